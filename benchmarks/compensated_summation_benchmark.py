@@ -0,0 +1,72 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import numpy as np
+
+from piquasso._math.permanent import permanent
+from piquasso._math.hafnian import hafnian_with_reduction, loop_hafnian_with_reduction
+
+
+pytestmark = pytest.mark.benchmark(
+    group="compensated-summation",
+)
+
+
+@pytest.fixture
+def d():
+    return 20
+
+
+@pytest.fixture
+def complex_symmetric_matrix(d):
+    matrix = np.random.rand(d, d) + 1j * np.random.rand(d, d)
+
+    return (matrix + matrix.T) / d
+
+
+@pytest.mark.parametrize("compensated", (False, True))
+def permanent_benchmark(benchmark, d, generate_unitary_matrix, compensated):
+    matrix = generate_unitary_matrix(d)
+    occupation_numbers = np.ones(d, dtype=int)
+
+    benchmark(permanent, matrix, occupation_numbers, occupation_numbers, compensated)
+
+
+@pytest.mark.parametrize("compensated", (False, True))
+def hafnian_benchmark(benchmark, d, complex_symmetric_matrix, compensated):
+    occupation_numbers = np.ones(d, dtype=int)
+
+    benchmark(
+        hafnian_with_reduction,
+        complex_symmetric_matrix,
+        occupation_numbers,
+        compensated,
+    )
+
+
+@pytest.mark.parametrize("compensated", (False, True))
+def loop_hafnian_benchmark(benchmark, d, complex_symmetric_matrix, compensated):
+    diagonal = np.random.rand(d) + 1j * np.random.rand(d)
+    occupation_numbers = np.ones(d, dtype=int)
+
+    benchmark(
+        loop_hafnian_with_reduction,
+        complex_symmetric_matrix,
+        diagonal,
+        occupation_numbers,
+        compensated,
+    )
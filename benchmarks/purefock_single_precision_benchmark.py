@@ -0,0 +1,70 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import numpy as np
+
+import piquasso as pq
+
+
+pytestmark = pytest.mark.benchmark(
+    group="pure-fock-single-precision",
+)
+
+
+@pytest.fixture
+def d():
+    return 6
+
+
+@pytest.fixture
+def cutoff():
+    return 10
+
+
+@pytest.fixture
+def program(d, generate_unitary_matrix):
+    with pq.Program() as program:
+        pq.Q() | pq.StateVector([1] * (d // 2) + [0] * (d - d // 2))
+
+        for i in range(d):
+            pq.Q(i) | pq.Squeezing(r=0.1)
+
+        pq.Q() | pq.Interferometer(generate_unitary_matrix(d))
+
+        for i in range(d - 1):
+            pq.Q(i, i + 1) | pq.Beamsplitter(theta=np.pi / 5, phi=np.pi / 3)
+
+    return program
+
+
+@pytest.mark.parametrize("dtype", (np.float64, np.float32))
+def piquasso_benchmark(benchmark, d, cutoff, program, dtype):
+    simulator = pq.PureFockSimulator(d=d, config=pq.Config(cutoff=cutoff, dtype=dtype))
+
+    state = benchmark(simulator.execute, program).state
+
+    expected_state = (
+        pq.PureFockSimulator(d=d, config=pq.Config(cutoff=cutoff))
+        .execute(program)
+        .state
+    )
+
+    error = np.max(np.abs(state.state_vector - expected_state.state_vector))
+
+    benchmark.extra_info["max_abs_error"] = float(error)
+
+    assert error < 1e-4
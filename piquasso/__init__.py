@@ -34,6 +34,7 @@ from piquasso.api.state import State
 from piquasso.api.computer import Computer
 from piquasso.api.simulator import Simulator
 from piquasso.api.utils import as_code
+from piquasso._math.cache import configure_index_cache
 
 from piquasso._simulators.sampling import SamplingState, SamplingSimulator
 
@@ -42,8 +43,12 @@ from piquasso._simulators.fock import (
     FockState,
     PureFockState,
     BatchPureFockState,
+    SectorPureFockState,
+    TrajectoryFockState,
     FockSimulator,
     PureFockSimulator,
+    SectorPureFockSimulator,
+    TrajectoryFockSimulator,
 )
 
 from piquasso._simulators.connectors import (
@@ -107,6 +112,8 @@ from .instructions.batch import (
     BatchApply,
 )
 
+from ._warmup import warmup
+
 
 __all__ = [
     # API
@@ -121,11 +128,15 @@ __all__ = [
     "Computer",
     "Simulator",
     "as_code",
+    "configure_index_cache",
+    "warmup",
     # Simulators
     "GaussianSimulator",
     "SamplingSimulator",
     "FockSimulator",
     "PureFockSimulator",
+    "SectorPureFockSimulator",
+    "TrajectoryFockSimulator",
     # Connectors
     "NumpyConnector",
     "TensorflowConnector",
@@ -136,6 +147,8 @@ __all__ = [
     "FockState",
     "PureFockState",
     "BatchPureFockState",
+    "SectorPureFockState",
+    "TrajectoryFockState",
     # Preparations
     "Vacuum",
     "Mean",
@@ -0,0 +1,309 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Caching of index tables, i.e., arrays depending only on small integer arguments like
+the number of modes, the cutoff and the modes an instruction acts on.
+
+The tables are kept in memory up to a limited number of bytes, and optionally stored
+on disk as `.npy` files, which are memory-mapped read-only when loaded, hence
+processes using the same cache directory share a single copy of them.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import functools
+
+from collections import OrderedDict
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+DEFAULT_MEMORY_LIMIT = 2**28
+
+CACHE_DIRECTORY_ENVIRONMENT_VARIABLE = "PIQUASSO_INDEX_CACHE_DIR"
+
+_FORMAT_VERSION = "v1"
+
+_STRUCTURE_FILENAME = "structure.json"
+
+
+class IndexTableCacheInfo(NamedTuple):
+    """Statistics of an index table cache, similarly to :func:`functools.lru_cache`."""
+
+    hits: int
+    disk_hits: int
+    misses: int
+    memory_limit: int
+    memory_usage: int
+
+
+class IndexTableCache:
+    """
+    Cache for the results of `function`, which should return a numpy array or
+    (possibly nested) lists and tuples of numpy arrays.
+
+    The results are stored in memory, and the least recently used ones are evicted
+    when their total size exceeds `memory_limit` bytes. When a cache directory is
+    configured, the missing results are looked up on disk before calculating them, and
+    the calculated results are saved there. The arrays loaded from disk are read-only.
+    """
+
+    def __init__(
+        self,
+        function: Callable,
+        memory_limit: int = DEFAULT_MEMORY_LIMIT,
+        directory: Optional[str] = None,
+    ) -> None:
+        functools.update_wrapper(self, function, updated=())
+
+        self._function = function
+        self.memory_limit = memory_limit
+        self.directory = directory
+
+        self.memory_usage = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._entry_sizes: "OrderedDict[Tuple, int]" = OrderedDict()
+
+    def __call__(self, *args, **kwargs):
+        key = (args, tuple(kwargs.items()))
+
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            self._entry_sizes.move_to_end(key)
+
+            return self._entries[key]
+
+        value = None
+        entry_directory = self._get_entry_directory(key)
+
+        if entry_directory is not None:
+            value = _load(entry_directory)
+
+        if value is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            value = self._function(*args, **kwargs)
+
+            if entry_directory is not None:
+                _save(value, entry_directory)
+
+        self._insert(key, value)
+
+        return value
+
+    def cache_info(self) -> IndexTableCacheInfo:
+        return IndexTableCacheInfo(
+            hits=self.hits,
+            disk_hits=self.disk_hits,
+            misses=self.misses,
+            memory_limit=self.memory_limit,
+            memory_usage=self.memory_usage,
+        )
+
+    def cache_clear(self) -> None:
+        """Clears the in-memory layer of the cache and resets the statistics."""
+
+        self._entries.clear()
+        self._entry_sizes.clear()
+        self.memory_usage = 0
+        self.hits = self.disk_hits = self.misses = 0
+
+    def _insert(self, key: Tuple, value: Any) -> None:
+        size = _get_size(value)
+
+        if size > self.memory_limit:
+            return
+
+        self._entries[key] = value
+        self._entry_sizes[key] = size
+        self.memory_usage += size
+
+        while self.memory_usage > self.memory_limit:
+            evicted_key, evicted_size = self._entry_sizes.popitem(last=False)
+            del self._entries[evicted_key]
+            self.memory_usage -= evicted_size
+
+    def _get_entry_directory(self, key: Tuple) -> Optional[str]:
+        if self.directory is None:
+            return None
+
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()[:32]
+
+        return os.path.join(
+            self.directory,
+            _FORMAT_VERSION,
+            f"{self.__module__}.{self.__qualname__}",
+            digest,
+        )
+
+
+_caches: List[IndexTableCache] = []
+
+_settings = {
+    "directory": os.environ.get(CACHE_DIRECTORY_ENVIRONMENT_VARIABLE) or None,
+    "memory_limit": DEFAULT_MEMORY_LIMIT,
+}
+
+
+def index_table_cache(function: Callable) -> IndexTableCache:
+    """Decorates `function` with a cache configured by :func:`configure_index_cache`.
+
+    Intended as a replacement of `functools.lru_cache(maxsize=None)` for functions
+    calculating index tables.
+    """
+
+    cache = IndexTableCache(
+        function,
+        memory_limit=_settings["memory_limit"],
+        directory=_settings["directory"],
+    )
+
+    _caches.append(cache)
+
+    return cache
+
+
+def configure_index_cache(
+    directory: Optional[str] = None, memory_limit: int = DEFAULT_MEMORY_LIMIT
+) -> None:
+    """Configures the cache of the index tables used by the Fock space simulators.
+
+    The index tables depend only on the number of modes, the cutoff and the modes
+    an instruction acts on. By default, they are kept in memory up to `memory_limit`
+    bytes per table kind. If `directory` is specified, they are also saved there, and
+    processes using the same directory load them from disk as read-only
+    memory-mapped arrays instead of calculating them. The directory can also be
+    specified by the `PIQUASSO_INDEX_CACHE_DIR` environment variable.
+
+    Calling this function clears the in-memory layer of the cache.
+
+    Args:
+        directory (str, optional):
+            The directory of the on-disk cache. If `None`, the on-disk cache is
+            disabled.
+        memory_limit (int):
+            The maximum size of the in-memory cache in bytes for every table kind.
+            Defaults to `2 ** 28`, i.e., 256 MiB.
+    """
+
+    _settings["directory"] = directory
+    _settings["memory_limit"] = memory_limit
+
+    for cache in _caches:
+        cache.directory = directory
+        cache.memory_limit = memory_limit
+        cache.cache_clear()
+
+
+def _get_size(value: Any) -> int:
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+
+    if isinstance(value, (list, tuple)):
+        return sum(_get_size(item) for item in value)
+
+    return 0
+
+
+def _get_structure(value: Any, arrays: List[np.ndarray]) -> Optional[dict]:
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            return None
+
+        arrays.append(value)
+
+        return {"type": "array", "index": len(arrays) - 1, "size": int(value.size)}
+
+    if isinstance(value, (list, tuple)):
+        items = []
+
+        for item in value:
+            item_structure = _get_structure(item, arrays)
+
+            if item_structure is None:
+                return None
+
+            items.append(item_structure)
+
+        return {"type": type(value).__name__, "items": items}
+
+    return None
+
+
+def _from_structure(structure: dict, entry_directory: str) -> Any:
+    if structure["type"] == "array":
+        filename = os.path.join(entry_directory, f"{structure['index']}.npy")
+
+        # NOTE: Empty files cannot be memory-mapped.
+        mmap_mode = "r" if structure["size"] > 0 else None
+
+        return np.asarray(np.load(filename, mmap_mode=mmap_mode))
+
+    items = [_from_structure(item, entry_directory) for item in structure["items"]]
+
+    return tuple(items) if structure["type"] == "tuple" else items
+
+
+def _save(value: Any, entry_directory: str) -> None:
+    arrays: List[np.ndarray] = []
+
+    structure = _get_structure(value, arrays)
+
+    if structure is None or os.path.isdir(entry_directory):
+        return
+
+    parent_directory = os.path.dirname(entry_directory)
+
+    try:
+        os.makedirs(parent_directory, exist_ok=True)
+
+        temporary_directory = tempfile.mkdtemp(dir=parent_directory)
+    except OSError:
+        return
+
+    try:
+        for index, array in enumerate(arrays):
+            np.save(os.path.join(temporary_directory, f"{index}.npy"), array)
+
+        with open(os.path.join(temporary_directory, _STRUCTURE_FILENAME), "w") as f:
+            json.dump(structure, f)
+
+        # NOTE: The entry is published atomically, so that other processes never see
+        # a partially written entry. If another process has published it in the
+        # meantime, the renaming fails, and our copy is discarded.
+        os.rename(temporary_directory, entry_directory)
+    except OSError:
+        shutil.rmtree(temporary_directory, ignore_errors=True)
+
+
+def _load(entry_directory: str) -> Any:
+    try:
+        with open(os.path.join(entry_directory, _STRUCTURE_FILENAME)) as f:
+            structure = json.load(f)
+
+        return _from_structure(structure, entry_directory)
+    except (OSError, ValueError):
+        return None
@@ -13,12 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import functools
 from typing import Tuple
 
 import numpy as np
 import numba as nb
 
+from piquasso._math.cache import index_table_cache
 from piquasso._math.combinatorics import comb
 
 from piquasso.api.config import Config
@@ -77,7 +77,7 @@ def nb_get_fock_space_basis(d: int, cutoff: int) -> np.ndarray:
     return ret
 
 
-get_fock_space_basis = functools.lru_cache(maxsize=None)(nb_get_fock_space_basis)
+get_fock_space_basis = index_table_cache(nb_get_fock_space_basis)
 
 
 def get_single_mode_squeezing_operator(
@@ -201,3 +201,136 @@ def get_single_mode_displacement_operator(r, phi, cutoff, complex_dtype, connect
         return matrix, grad
 
     return _single_mode_displacement_operator(r, phi)
+
+
+@nb.njit(cache=True)
+def _calculate_gaussian_unitary_operator(bargmann_matrix, vacuum_amplitude, cutoff):
+    d = bargmann_matrix.shape[0] // 2
+
+    basis = nb_get_fock_space_basis(d=d, cutoff=cutoff)
+    size = basis.shape[0]
+
+    lowered_indices = np.full(shape=(size, d), fill_value=-1, dtype=np.int64)
+    first_nonzero_modes = np.zeros(shape=size, dtype=np.int64)
+
+    for index in range(1, size):
+        occupation_numbers = basis[index].copy()
+
+        for mode in range(d - 1, -1, -1):
+            if occupation_numbers[mode] == 0:
+                continue
+
+            first_nonzero_modes[index] = mode
+
+            occupation_numbers[mode] -= 1
+            lowered_indices[index, mode] = get_index_in_fock_space(occupation_numbers)
+            occupation_numbers[mode] += 1
+
+    sqrt_occupation_numbers = np.sqrt(basis.astype(np.float64))
+    particle_numbers = np.sum(basis, axis=1)
+
+    output_block = bargmann_matrix[:d, :d]
+    mixed_block = bargmann_matrix[:d, d:]
+    input_block = bargmann_matrix[d:, d:]
+
+    matrix = np.zeros(shape=(size, size), dtype=bargmann_matrix.dtype)
+
+    matrix[0, 0] = vacuum_amplitude
+
+    for col in range(1, size):
+        if particle_numbers[col] % 2 == 1:
+            continue
+
+        mode = first_nonzero_modes[col]
+        previous = lowered_indices[col, mode]
+
+        value = 0.0j
+        for j in range(d):
+            if basis[previous, j] > 0:
+                value += (
+                    input_block[mode, j]
+                    * sqrt_occupation_numbers[previous, j]
+                    * matrix[0, lowered_indices[previous, j]]
+                )
+
+        matrix[0, col] = value / sqrt_occupation_numbers[col, mode]
+
+    for row in range(1, size):
+        mode = first_nonzero_modes[row]
+        previous = lowered_indices[row, mode]
+
+        for col in range(size):
+            # NOTE: The matrix elements between states with different particle number
+            # parities are zero.
+            if (particle_numbers[row] + particle_numbers[col]) % 2 == 1:
+                continue
+
+            value = 0.0j
+            for j in range(d):
+                if basis[previous, j] > 0:
+                    value += (
+                        output_block[mode, j]
+                        * sqrt_occupation_numbers[previous, j]
+                        * matrix[lowered_indices[previous, j], col]
+                    )
+
+                if basis[col, j] > 0:
+                    value += (
+                        mixed_block[mode, j]
+                        * sqrt_occupation_numbers[col, j]
+                        * matrix[previous, lowered_indices[col, j]]
+                    )
+
+            matrix[row, col] = value / sqrt_occupation_numbers[row, mode]
+
+    return matrix
+
+
+def get_gaussian_unitary_operator(
+    passive: np.ndarray, active: np.ndarray, cutoff: int, complex_dtype: np.dtype
+) -> np.ndarray:
+    r"""Calculates the matrix of a Gaussian unitary without displacement on the
+    cutoff Fock space of `len(passive)` modes.
+
+    The matrix elements :math:`\langle m | U | n \rangle` are calculated by the
+    recurrence relation of the Bargmann representation
+    (https://quantum-journal.org/papers/q-2020-11-30-366/), where the Gaussian
+    generating function is described by the symmetric matrix
+
+    .. math::
+        R = \begin{bmatrix}
+            A (P^*)^{-1} & (P^\dagger)^{-1} \\
+            (P^*)^{-1} & - (P^*)^{-1} A^*
+        \end{bmatrix},
+
+    with :math:`P` and :math:`A` being the passive and active blocks of the symplectic
+    matrix, and :math:`\langle 0 | U | 0 \rangle = |\det P|^{-1/2}`.
+
+    Args:
+        passive (numpy.ndarray): The passive block of the symplectic matrix.
+        active (numpy.ndarray): The active block of the symplectic matrix.
+        cutoff (int): The cutoff of the Fock space.
+        complex_dtype (numpy.dtype): The dtype of the resulting matrix.
+
+    Returns:
+        numpy.ndarray:
+            The matrix of the Gaussian unitary in the ordering of the Fock basis.
+    """
+
+    passive = np.asarray(passive, dtype=np.complex128)
+    active = np.asarray(active, dtype=np.complex128)
+
+    conjugate_passive_inverse = np.linalg.inv(passive.conj())
+
+    bargmann_matrix = np.block(
+        [
+            [active @ conjugate_passive_inverse, conjugate_passive_inverse.T],
+            [conjugate_passive_inverse, -conjugate_passive_inverse @ active.conj()],
+        ]
+    )
+
+    vacuum_amplitude = 1 / np.sqrt(np.abs(np.linalg.det(passive)))
+
+    return _calculate_gaussian_unitary_operator(
+        bargmann_matrix, vacuum_amplitude, cutoff
+    ).astype(complex_dtype)
@@ -22,6 +22,11 @@ from scipy.special import factorial
 from piquasso.api.connector import BaseConnector
 
 
+@lru_cache
+def _inverse_sqrt_factorial_array(cutoff):
+    return 1 / np.sqrt(factorial(np.arange(cutoff)))
+
+
 def create_single_mode_displacement_matrix(
     r: float,
     phi: float,
@@ -49,7 +54,7 @@ def create_single_mode_displacement_matrix(
 
     cutoff_range = fallback_np.arange(cutoff)
     sqrt_indices = fallback_np.sqrt(cutoff_range)
-    denominator = 1 / fallback_np.sqrt(factorial(cutoff_range))
+    denominator = _inverse_sqrt_factorial_array(cutoff)
 
     displacement = r * np.exp(1j * phi)
     displacement_conj = np.conj(displacement)
@@ -19,6 +19,7 @@ import numpy as np
 from numba import complex128, int64
 
 from piquasso._math.combinatorics import comb
+from piquasso._math.summation import two_sum, compensated_sum
 
 from .powtrace import calculate_power_traces_loop
 
@@ -181,13 +182,18 @@ def _extend(matrix_orig, diagonal_orig, occupation_numbers):
 
 
 @nb.njit(cache=True, parallel=True)
-def loop_hafnian_with_reduction(matrix_orig, diagonal_orig, occupation_numbers):
+def loop_hafnian_with_reduction(
+    matrix_orig, diagonal_orig, occupation_numbers, compensated=False
+):
     r"""
     Calculates the loop hafnian of the input matrix using the power trace algorithm
     with Glynn-type iterations.
 
     The algorithm is enhanced by factoring in repetitions according to
     https://arxiv.org/abs/2108.01622.
+
+    If `compensated` is `True`, the terms are accumulated with compensated summation,
+    see :func:`~piquasso._math.summation.compensated_sum`.
     """
 
     n = sum(occupation_numbers)
@@ -226,6 +232,11 @@ def loop_hafnian_with_reduction(matrix_orig, diagonal_orig, occupation_numbers):
 
     size = np.prod(all_edges + 1) // 2
 
+    nthreads = nb.config.NUMBA_NUM_THREADS
+
+    partial_results = np.zeros(nthreads, dtype=matrix.dtype)
+    compensations = np.zeros(nthreads, dtype=matrix.dtype)
+
     for permutation_idx in nb.prange(size):
         kept_edges = get_kept_edges(all_edges, permutation_idx)
         fact = False
@@ -249,7 +260,18 @@ def loop_hafnian_with_reduction(matrix_orig, diagonal_orig, occupation_numbers):
 
         summand = prefactor * fs[dim_over_2]
 
-        result += summand
+        if compensated:
+            thread_id = nb.get_thread_id()
+
+            partial_result, error = two_sum(partial_results[thread_id], summand)
+
+            partial_results[thread_id] = partial_result
+            compensations[thread_id] += error
+        else:
+            result += summand
+
+    if compensated:
+        result = compensated_sum(partial_results) + np.sum(compensations)
 
     result *= scale_factor**dim_over_2
 
@@ -19,6 +19,7 @@ import numba as nb
 from .powtrace import calc_power_traces
 
 from piquasso._math.combinatorics import comb
+from piquasso._math.summation import two_sum, compensated_sum
 
 from .utils import match_occupation_numbers, ix_, get_kept_edges
 
@@ -134,13 +135,16 @@ def _calc_f(traces, scale_factor):
 
 
 @nb.njit(cache=True, parallel=True)
-def hafnian_with_reduction(matrix_orig, occupation_numbers):
+def hafnian_with_reduction(matrix_orig, occupation_numbers, compensated=False):
     r"""
     Calculates the hafnian of the input matrix using the power trace algorithm with
     Glynn-type iterations.
 
     The algorithm is enhanced by factoring in repetitions according to
     https://arxiv.org/abs/2108.01622.
+
+    If `compensated` is `True`, the terms are accumulated with compensated summation,
+    see :func:`~piquasso._math.summation.compensated_sum`.
     """
     n = sum(occupation_numbers)
 
@@ -175,6 +179,11 @@ def hafnian_with_reduction(matrix_orig, occupation_numbers):
         for k in range(n + 1):
             comb_cache[(n, k)] = comb(n, k)
 
+    nthreads = nb.config.NUMBA_NUM_THREADS
+
+    partial_results = np.zeros(nthreads, dtype=matrix.dtype)
+    compensations = np.zeros(nthreads, dtype=matrix.dtype)
+
     for permutation_idx in nb.prange(size):
         kept_edges = get_kept_edges(all_edges, permutation_idx)
         fact = False
@@ -203,7 +212,18 @@ def hafnian_with_reduction(matrix_orig, occupation_numbers):
 
         summand = prefactor * _calc_f(traces, second_scale_factor)[dim_over_2]
 
-        result += summand
+        if compensated:
+            thread_id = nb.get_thread_id()
+
+            partial_result, error = two_sum(partial_results[thread_id], summand)
+
+            partial_results[thread_id] = partial_result
+            compensations[thread_id] += error
+        else:
+            result += summand
+
+    if compensated:
+        result = compensated_sum(partial_results) + np.sum(compensations)
 
     result *= np.power(scale_factor, dim_over_2)
     result /= 1 << (dim_over_2 - 1)
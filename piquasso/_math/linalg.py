@@ -130,3 +130,44 @@ def vector_absolute_square(vector, connector):
         return absolute_square, _vector_absolute_square_grad
 
     return _vector_absolute_square(vector)
+
+
+def extend_inverse_and_determinant(
+    inverse: np.ndarray, determinant: float, matrix: np.ndarray
+) -> Tuple[np.ndarray, float]:
+    r"""
+    Calculates the inverse and the determinant of the symmetric `matrix` from the
+    inverse and the determinant of its upper left block using the Schur complement
+
+    .. math::
+        M / A = D - B^T A^{-1} B,
+
+    where `matrix` is partitioned as
+
+    .. math::
+        M = \begin{bmatrix}
+            A & B \\
+            B^T & D
+        \end{bmatrix}.
+    """
+
+    n = len(inverse)
+
+    B = matrix[:n, n:]
+    D = matrix[n:, n:]
+
+    K = inverse @ B
+
+    schur_complement = D - B.T @ K
+    schur_complement_inverse = np.linalg.inv(schur_complement)
+
+    KS = K @ schur_complement_inverse
+
+    extended_inverse = np.empty_like(matrix)
+
+    extended_inverse[:n, :n] = inverse + KS @ K.T
+    extended_inverse[:n, n:] = -KS
+    extended_inverse[n:, :n] = -KS.T
+    extended_inverse[n:, n:] = schur_complement_inverse
+
+    return extended_inverse, determinant * np.linalg.det(schur_complement)
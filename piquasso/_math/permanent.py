@@ -20,16 +20,20 @@ import numba as nb
 from numba import int64
 
 from piquasso._math.combinatorics import comb
+from piquasso._math.summation import two_sum, compensated_sum
 
 
 @nb.njit(cache=True, parallel=True)
-def permanent(matrix, rows, cols):
+def permanent(matrix, rows, cols, compensated=False):
     """Calculates the permanent of a matrix given row and column repetitions.
 
     Translated from PiquassoBoost, original implementation:
     https://github.com/Budapest-Quantum-Computing-Group/piquassoboost/blob/main/piquassoboost/sampling/source/BBFGPermanentCalculatorRepeated.hpp
 
     Implements Eq. (8) from https://arxiv.org/pdf/2309.07027.pdf.
+
+    If `compensated` is `True`, the terms are accumulated with compensated summation,
+    see :func:`~piquasso._math.summation.compensated_sum`.
     """  # noqa: E501
 
     rows = rows.astype(np.int64)
@@ -88,10 +92,12 @@ def permanent(matrix, rows, cols):
 
     concurrency = min(nthreads, idx_max, 32)
 
-    permanent = 0.0
+    partial_permanents = np.zeros(concurrency, dtype=matrix.dtype)
+    compensations = np.zeros(concurrency, dtype=matrix.dtype)
 
     for job_idx in nb.prange(concurrency):
         partial_permanent = 0.0
+        compensation = 0.0
 
         work_batch = idx_max // concurrency
         initial_offset = job_idx * work_batch
@@ -133,7 +139,7 @@ def permanent(matrix, rows, cols):
             for _ in range(cols[idx]):
                 colsum_prod *= colsum[idx]
 
-        partial_permanent += colsum_prod * binomial_coeff
+        partial_permanent = colsum_prod * binomial_coeff
 
         for idx in range(initial_offset + 1, offset_max + 1):
             flag, changed_index, value_prev, value = gcode_counter.next()
@@ -161,15 +167,199 @@ def permanent(matrix, rows, cols):
                 else (binomial_coeff * (rows_current - value_prev) / value)
             )
 
-            partial_permanent += colsum_prod * binomial_coeff
+            summand = colsum_prod * binomial_coeff
+
+            if compensated:
+                partial_permanent, error = two_sum(partial_permanent, summand)
+                compensation += error
+            else:
+                partial_permanent += summand
 
-        permanent += partial_permanent
+        partial_permanents[job_idx] = partial_permanent
+        compensations[job_idx] = compensation
+
+    if compensated:
+        permanent = compensated_sum(partial_permanents) + np.sum(compensations)
+    else:
+        permanent = np.sum(partial_permanents)
 
     permanent /= 2 ** (sum_rows - 1)
 
     return permanent
 
 
+@nb.njit(cache=True, parallel=True)
+def partial_permanents(matrix, rows, cols):
+    """Calculates the permanents of a matrix with one column repetition removed.
+
+    The `j`-th element of the result is the permanent of `matrix` with row
+    repetitions `rows` and column repetitions `cols - e_j` (or zero if `cols[j]` is
+    zero), i.e., the sub-permanents in the Laplace expansion of the permanent of an
+    extended matrix along a new row. All of them are calculated by a single
+    traversal of the Gray code used in :func:`permanent`, hence `sum(rows)` should
+    be equal to `sum(cols) - 1`.
+    """
+
+    rows = rows.astype(np.int64)
+    cols = cols.astype(np.int64)
+
+    number_of_cols = len(cols)
+
+    sum_rows = np.sum(rows)
+
+    result = np.zeros(number_of_cols, dtype=matrix.dtype)
+
+    if sum_rows == 0:
+        for col_idx in range(number_of_cols):
+            if cols[col_idx] > 0:
+                result[col_idx] = 1.0
+
+        return result
+
+    # Determine minimal nonzero element
+    min_idx = 0
+    minelem = 0
+    for i in range(len(rows)):
+        if minelem == 0 or rows[i] < minelem and rows[i] != 0:
+            minelem = rows[i]
+            min_idx = i
+
+    rows_ = np.empty(len(rows) + 1, dtype=np.int64)
+    rows_[0] = 1
+    rows_[1:] = rows
+    rows_[1 + min_idx] -= 1
+
+    matrix_ = np.empty(shape=(matrix.shape[0] + 1, matrix.shape[1]), dtype=matrix.dtype)
+
+    matrix_[0] = matrix[min_idx]
+
+    matrix_[1:] = matrix
+    rows = rows_
+    matrix = matrix_
+
+    mtx2 = matrix * 2
+
+    n_ary_limits = np.empty(len(rows) - 1, dtype=np.int64)
+
+    for idx in range(len(n_ary_limits)):
+        n_ary_limits[idx] = rows[idx + 1] + 1
+
+    idx_max = n_ary_limits[0]
+    for idx in range(1, len(n_ary_limits)):
+        idx_max *= n_ary_limits[idx]
+
+    nthreads = nb.config.NUMBA_NUM_THREADS
+
+    concurrency = min(nthreads, idx_max, 32)
+
+    partial_results = np.zeros(shape=(concurrency, number_of_cols), dtype=matrix.dtype)
+
+    for job_idx in nb.prange(concurrency):
+        work_batch = idx_max // concurrency
+        initial_offset = job_idx * work_batch
+        offset_max = (job_idx + 1) * work_batch - 1
+        if job_idx == concurrency - 1:
+            offset_max = idx_max - 1
+
+        gcode_counter = NaryGrayCodeCounter(n_ary_limits, initial_offset)
+
+        gcode_counter.offset_max = offset_max
+        gcode = gcode_counter.gray_code
+        binomial_coeff = 1
+
+        colsum = np.copy(matrix[0])
+
+        minus_signs_all = 0
+
+        row_idx = 1
+
+        for idx in range(len(gcode)):
+            minus_signs = gcode[idx]
+            rows_current = rows[idx + 1]
+
+            for col_idx in range(len(cols)):
+                colsum[col_idx] += matrix[row_idx, col_idx] * (
+                    rows_current - 2 * minus_signs
+                )
+
+            minus_signs_all += minus_signs
+
+            binomial_coeff *= comb(rows_current, minus_signs)
+
+            row_idx += 1
+
+        parity = 1 if (minus_signs_all % 2 == 0) else -1
+
+        _add_partial_permanent_terms(
+            partial_results[job_idx], colsum, cols, parity * binomial_coeff
+        )
+
+        for idx in range(initial_offset + 1, offset_max + 1):
+            flag, changed_index, value_prev, value = gcode_counter.next()
+            if flag:
+                break
+
+            parity = -parity
+
+            row_offset = changed_index + 1
+            for col_idx in range(len(cols)):
+                if value_prev < value:
+                    colsum[col_idx] -= mtx2[row_offset, col_idx]
+
+                else:
+                    colsum[col_idx] += mtx2[row_offset, col_idx]
+
+            rows_current = rows[changed_index + 1]
+            binomial_coeff = (
+                (binomial_coeff * value_prev / (rows_current - value))
+                if value < value_prev
+                else (binomial_coeff * (rows_current - value_prev) / value)
+            )
+
+            _add_partial_permanent_terms(
+                partial_results[job_idx], colsum, cols, parity * binomial_coeff
+            )
+
+    for job_idx in range(concurrency):
+        result += partial_results[job_idx]
+
+    result /= 2 ** (sum_rows - 1)
+
+    return result
+
+
+@nb.njit(cache=True)
+def _add_partial_permanent_terms(target, colsum, cols, weight):
+    """
+    Adds `weight` times the products of the column sums with one factor of the
+    `j`-th column omitted to `target[j]` for every `j`, using prefix and suffix
+    products to avoid divisions.
+    """
+
+    number_of_cols = len(cols)
+
+    prefix_products = np.empty_like(colsum)
+
+    prefix_product = colsum.dtype.type(1.0)
+    for col_idx in range(number_of_cols):
+        prefix_products[col_idx] = prefix_product
+        for _ in range(cols[col_idx]):
+            prefix_product *= colsum[col_idx]
+
+    suffix_product = colsum.dtype.type(1.0)
+    for col_idx in range(number_of_cols - 1, -1, -1):
+        if cols[col_idx] > 0:
+            term = weight * prefix_products[col_idx] * suffix_product
+            for _ in range(cols[col_idx] - 1):
+                term *= colsum[col_idx]
+
+            target[col_idx] += term
+
+            suffix_product *= colsum[col_idx]
+            for _ in range(cols[col_idx] - 1):
+                suffix_product *= colsum[col_idx]
+
+
 @nb.experimental.jitclass(
     [
         ("gray_code", int64[:]),
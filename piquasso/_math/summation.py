@@ -0,0 +1,59 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import numba as nb
+
+
+@nb.njit(cache=True)
+def two_sum(a, b):
+    r"""Error-free transformation of the sum of two floating point numbers.
+
+    Returns the rounded sum :math:`s = fl(a + b)` and its rounding error :math:`e`,
+    such that :math:`a + b = s + e` holds exactly, see Knuth, TAOCP Vol. 2, 4.2.2.
+    The transformation is exact for complex numbers as well, since the real and
+    imaginary parts are added separately.
+    """
+
+    s = a + b
+    b_virtual = s - a
+    a_virtual = s - b_virtual
+
+    return s, (a - a_virtual) + (b - b_virtual)
+
+
+@nb.njit(cache=True)
+def compensated_sum(values):
+    """Sums `values` with compensated summation.
+
+    The rounding errors of the partial sums are accumulated separately, and added to
+    the result at the end, which yields a result as accurate as if it was computed in
+    twice the working precision. This matters when the terms cancel each other
+    significantly, e.g., for the permanent and the hafnian at large particle numbers,
+    at the expense of a few extra floating point operations per term.
+
+    The `compensated` argument of the permanent and hafnian kernels is a kernel-level
+    option: the simulators do not set it, and only :class:`~piquasso.NumpyConnector`,
+    whose methods are the kernels themselves, accepts it.
+    """
+
+    result = np.zeros(1, dtype=values.dtype)[0]
+    compensation = np.zeros(1, dtype=values.dtype)[0]
+
+    for value in values:
+        result, error = two_sum(result, value)
+        compensation += error
+
+    return result + compensation
@@ -47,6 +47,70 @@ py::object loop_torontonian_np(
     return create_numpy_scalar(result);
 }
 
+template <typename TScalar>
+py::array_t<TScalar> torontonian_batch_np(
+    py::array_t<TScalar, py::array::c_style | py::array::forcecast> matrices)
+{
+    py::buffer_info bufferinfo = matrices.request();
+
+    if (bufferinfo.ndim != 3 || bufferinfo.shape[1] != bufferinfo.shape[2])
+        throw py::value_error("The input should be a stack of square matrices.");
+
+    size_t batch_size = bufferinfo.shape[0];
+    size_t dim = bufferinfo.shape[1];
+
+    TScalar *data = static_cast<TScalar *>(bufferinfo.ptr);
+
+    py::array_t<TScalar> results(batch_size);
+    TScalar *results_data = results.mutable_data();
+
+    {
+        py::gil_scoped_release release;
+
+        torontonian_batch_cpp(data, batch_size, dim, results_data);
+    }
+
+    return results;
+}
+
+template <typename TScalar>
+py::array_t<TScalar> loop_torontonian_batch_np(
+    py::array_t<TScalar, py::array::c_style | py::array::forcecast> matrices,
+    py::array_t<TScalar, py::array::c_style | py::array::forcecast> displacement_vectors)
+{
+    py::buffer_info bufferinfo = matrices.request();
+    py::buffer_info vector_bufferinfo = displacement_vectors.request();
+
+    if (bufferinfo.ndim != 3 || bufferinfo.shape[1] != bufferinfo.shape[2])
+        throw py::value_error("The input should be a stack of square matrices.");
+
+    if (
+        vector_bufferinfo.ndim != 2
+        || vector_bufferinfo.shape[0] != bufferinfo.shape[0]
+        || vector_bufferinfo.shape[1] != bufferinfo.shape[1]
+    )
+        throw py::value_error(
+            "The displacement vectors should be stacked in accordance with the "
+            "matrices.");
+
+    size_t batch_size = bufferinfo.shape[0];
+    size_t dim = bufferinfo.shape[1];
+
+    TScalar *data = static_cast<TScalar *>(bufferinfo.ptr);
+    TScalar *vector_data = static_cast<TScalar *>(vector_bufferinfo.ptr);
+
+    py::array_t<TScalar> results(batch_size);
+    TScalar *results_data = results.mutable_data();
+
+    {
+        py::gil_scoped_release release;
+
+        loop_torontonian_batch_cpp(data, vector_data, batch_size, dim, results_data);
+    }
+
+    return results;
+}
+
 const char* torontonian_docstring = R""""(
 Calculates the torontonian of a matrix.
 
@@ -66,10 +130,44 @@ Note:
     data in the xpxp-ordering.
 )"""";
 
+const char* torontonian_batch_docstring = R""""(
+Calculates the torontonians of a stack of matrices with shape `(batch, dim, dim)`.
+
+The calculation of the torontonians is distributed among threads using OpenMP.
+
+Note:
+    This function expects arguments in a different ordering than usual. Usually, the
+    inputs are in the xxpp-ordering, but for this implementation, one needs to provide
+    data in the xpxp-ordering.
+)"""";
+
+
+const char* loop_torontonian_batch_docstring = R""""(
+Calculates the loop torontonians of a stack of matrices with shape `(batch, dim, dim)`
+and a stack of displacement vectors with shape `(batch, dim)`.
+
+The calculation of the loop torontonians is distributed among threads using OpenMP.
+
+Note:
+    This function expects arguments in a different ordering than usual. Usually, the
+    inputs are in the xxpp-ordering, but for this implementation, one needs to provide
+    data in the xpxp-ordering.
+)"""";
+
 PYBIND11_MODULE(torontonian, m)
 {
     m.def("torontonian", &torontonian_np<float>, torontonian_docstring);
     m.def("torontonian", &torontonian_np<double>, torontonian_docstring);
     m.def("loop_torontonian", &loop_torontonian_np<float>, loop_torontonian_docstring);
     m.def("loop_torontonian", &loop_torontonian_np<double>, loop_torontonian_docstring);
+    m.def("torontonian_batch", &torontonian_batch_np<float>, torontonian_batch_docstring);
+    m.def("torontonian_batch", &torontonian_batch_np<double>, torontonian_batch_docstring);
+    m.def(
+        "loop_torontonian_batch",
+        &loop_torontonian_batch_np<float>,
+        loop_torontonian_batch_docstring);
+    m.def(
+        "loop_torontonian_batch",
+        &loop_torontonian_batch_np<double>,
+        loop_torontonian_batch_docstring);
 }
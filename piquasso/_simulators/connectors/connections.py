@@ -20,8 +20,7 @@ This file contains some common calculations for `BuiltinConnector`.
 import numpy as np
 import numba as nb
 
-from functools import lru_cache
-
+from piquasso._math.cache import index_table_cache
 from piquasso._math.indices import get_auxiliary_modes
 
 from piquasso.fermionic._utils import (
@@ -136,7 +135,7 @@ def _nb_calculate_index_list_for_appling_interferometer(modes, d, cutoff):
     return index_list
 
 
-_calculate_index_list_for_appling_interferometer = lru_cache(maxsize=None)(
+_calculate_index_list_for_appling_interferometer = index_table_cache(
     _nb_calculate_index_list_for_appling_interferometer
 )
 
@@ -19,7 +19,15 @@ import numba as nb
 
 @nb.njit(parallel=True, cache=True)
 def calculate_interferometer_on_fock_space(interferometer, helper_indices):
+    """Calculates the representation of `interferometer` on the Fock space.
+
+    The calculation is performed in the precision of `interferometer`, i.e., the
+    square roots of the occupation numbers are converted to its real dtype, so that
+    single precision interferometers are not upcast to double precision.
+    """
+
     cutoff = len(helper_indices[0]) + 2
+    real_dtype = interferometer.real.dtype
     subspace_representations = []
 
     subspace_representations.append(np.array([[1.0]], dtype=interferometer.dtype))
@@ -31,8 +39,8 @@ def calculate_interferometer_on_fock_space(interferometer, helper_indices):
 
         first_nonzero_indices = helper_indices[1][n - 2]
 
-        sqrt_occupation_numbers = helper_indices[3][n - 2]
-        sqrt_first_occupation_numbers = helper_indices[4][n - 2]
+        sqrt_occupation_numbers = helper_indices[3][n - 2].astype(real_dtype)
+        sqrt_first_occupation_numbers = helper_indices[4][n - 2].astype(real_dtype)
 
         previous_representation = subspace_representations[n - 1]
 
@@ -61,6 +69,6 @@ def calculate_interferometer_on_fock_space(interferometer, helper_indices):
                         * previous_representation_indexed[subspace_indices[i, j]]
                     )
 
-        subspace_representations.append(representation.astype(interferometer.dtype))
+        subspace_representations.append(representation)
 
     return subspace_representations
@@ -231,11 +231,34 @@ class TensorflowConnector(BuiltinConnector):
         return self.scatter(tf_indices, updates, (dim, dim))
 
     def _funm(self, matrix, func):
-        eigenvalues, U = self._tf.linalg.eig(matrix)
+        matrix = self._tf.convert_to_tensor(matrix)
 
-        log_eigenvalues = func(eigenvalues)
+        if not matrix.dtype.is_complex:
+            matrix = self._tf.complex(matrix, self._tf.zeros_like(matrix))
 
-        return U @ self.np.diag(log_eigenvalues) @ self._tf.linalg.inv(U)
+        matrix_adjoint = self._tf.linalg.adjoint(matrix)
+
+        def _hermitian_funm():
+            eigenvalues, U = self._tf.linalg.eigh(matrix)
+
+            func_eigenvalues = func(self._tf.cast(eigenvalues, matrix.dtype))
+
+            return U @ self.np.diag(func_eigenvalues) @ self._tf.linalg.adjoint(U)
+
+        def _general_funm():
+            eigenvalues, U = self._tf.linalg.eig(matrix)
+
+            func_eigenvalues = func(eigenvalues)
+
+            return U @ self.np.diag(func_eigenvalues) @ self._tf.linalg.inv(U)
+
+        # NOTE: For Hermitian matrices with degenerate eigenvalues (e.g. the positive
+        # factor of the polar decomposition of `ControlledZ`), `tf.linalg.eig` may
+        # return an almost singular eigenvector matrix, and inverting it ruins the
+        # precision. `tf.linalg.eigh` yields a unitary eigenvector matrix instead.
+        is_hermitian = self.np.allclose(matrix, matrix_adjoint, rtol=0.0, atol=1e-12)
+
+        return self._tf.cond(is_hermitian, _hermitian_funm, _general_funm)
 
     def logm(self, matrix):
         # NOTE: Tensorflow 2.0 has matrix logarithm, but it doesn't support gradient.
@@ -251,13 +274,14 @@ class TensorflowConnector(BuiltinConnector):
         return self._funm(matrix, partial(self.np.power, x2=power))
 
     def polar(self, matrix, side="right"):
-        P = self._tf.linalg.sqrtm(self.np.conj(matrix) @ matrix.T)
-        Pinv = self._tf.linalg.inv(P)
+        matrix_adjoint = self.np.conj(matrix).T
 
         if side == "right":
-            U = matrix @ Pinv
+            P = self._tf.linalg.sqrtm(matrix_adjoint @ matrix)
+            U = matrix @ self._tf.linalg.inv(P)
         elif side == "left":
-            U = Pinv @ matrix
+            P = self._tf.linalg.sqrtm(matrix @ matrix_adjoint)
+            U = self._tf.linalg.inv(P) @ matrix
 
         return U, P
 
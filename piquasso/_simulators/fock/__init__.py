@@ -18,4 +18,10 @@ from .general.simulator import FockSimulator  # noqa: F401
 
 from .pure.state import PureFockState  # noqa: F401
 from .pure.batch_state import BatchPureFockState  # noqa: F401
-from .pure.simulator import PureFockSimulator  # noqa: F401
+from .pure.sector_state import SectorPureFockState  # noqa: F401
+from .pure.trajectory_state import TrajectoryFockState  # noqa: F401
+from .pure.simulator import (  # noqa: F401
+    PureFockSimulator,
+    SectorPureFockSimulator,
+    TrajectoryFockSimulator,
+)
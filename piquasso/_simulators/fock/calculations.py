@@ -20,14 +20,13 @@ import numba as nb
 
 from scipy.special import comb
 
-from functools import lru_cache
-
 from .state import BaseFockState
 
 from piquasso.api.instruction import Instruction
 from piquasso.api.result import Result
 from piquasso.api.exceptions import InvalidInstruction, InvalidParameter
 
+from piquasso._math.cache import index_table_cache
 from piquasso._math.fock import (
     cutoff_fock_space_dim,
     cutoff_fock_space_dim_array,
@@ -142,13 +141,86 @@ def nb_calculate_state_index_matrix_list(d, cutoff, mode):
     return state_index_matrix_list
 
 
-calculate_state_index_matrix_list = lru_cache(maxsize=None)(
+calculate_state_index_matrix_list = index_table_cache(
     nb_calculate_state_index_matrix_list
 )
 
 
 @nb.njit(cache=True)
-def calculate_interferometer_helper_indices(d, cutoff):
+def nb_calculate_multimode_state_index_matrix_list(d, cutoff, modes):
+    """Calculates the indices needed for applying a gate on `modes`, generalizing
+    :func:`nb_calculate_state_index_matrix_list` to multiple modes.
+
+    The `n`-th matrix contains the indices of the basis vectors with `n` particles on
+    the auxiliary modes, where the rows are enumerated along the basis on `modes`
+    with less than `cutoff - n` particles, and the columns along the `n`-particle
+    basis on the auxiliary modes.
+    """
+    subspace = nb_get_fock_space_basis(d=len(modes), cutoff=cutoff)
+    auxiliary_subspace = nb_get_fock_space_basis(d=d - len(modes), cutoff=cutoff)
+
+    indices = cutoff_fock_space_dim_array(cutoff=np.arange(cutoff + 1), d=len(modes))
+    auxiliary_indices = cutoff_fock_space_dim_array(
+        cutoff=np.arange(cutoff + 1), d=d - len(modes)
+    )
+    auxiliary_modes = get_auxiliary_modes(d, modes)
+
+    all_occupation_numbers = np.zeros(d, dtype=np.int32)
+
+    state_index_matrix_list = []
+
+    for n in range(cutoff):
+        limit = indices[cutoff - n]
+        auxiliary_n_particle_subspace = auxiliary_subspace[
+            auxiliary_indices[n] : auxiliary_indices[n + 1]
+        ]
+
+        state_index_matrix = np.empty(
+            shape=(limit, len(auxiliary_n_particle_subspace)), dtype=np.int32
+        )
+
+        for idx1, auxiliary_occupation_numbers in enumerate(
+            auxiliary_n_particle_subspace
+        ):
+            for idx, mode in enumerate(auxiliary_modes):
+                all_occupation_numbers[mode] = auxiliary_occupation_numbers[idx]
+
+            for idx2 in range(limit):
+                for idx, mode in enumerate(modes):
+                    all_occupation_numbers[mode] = subspace[idx2, idx]
+
+                state_index_matrix[idx2, idx1] = get_index_in_fock_space(
+                    all_occupation_numbers
+                )
+
+        state_index_matrix_list.append(state_index_matrix)
+
+    return state_index_matrix_list
+
+
+calculate_multimode_state_index_matrix_list = index_table_cache(
+    nb_calculate_multimode_state_index_matrix_list
+)
+
+
+def is_gaussian_unitary_operator_preferred(
+    d: int, cutoff: int, number_of_modes: int
+) -> bool:
+    """Decides whether a linear gate on `number_of_modes` modes should be applied in a
+    single pass using its matrix on the Fock space of the modes, instead of its Euler
+    decomposition.
+
+    The cost of calculating the matrix grows with its number of elements, while the
+    cost of the decomposition is roughly a few passes over the state, hence the
+    former is only preferred for gates acting on a small number of modes.
+    """
+    matrix_size = cutoff_fock_space_dim(cutoff=cutoff, d=number_of_modes)
+
+    return matrix_size**2 <= cutoff_fock_space_dim(cutoff=cutoff, d=d) * cutoff
+
+
+@nb.njit(cache=True)
+def nb_calculate_interferometer_helper_indices(d, cutoff):
     space = nb_get_fock_space_basis(d=d, cutoff=cutoff)
 
     basis = np.empty((space.shape[0], d), dtype=space.dtype)
@@ -208,6 +280,70 @@ def calculate_interferometer_helper_indices(d, cutoff):
     )
 
 
+calculate_interferometer_helper_indices = index_table_cache(
+    nb_calculate_interferometer_helper_indices
+)
+
+
+@nb.njit(cache=True)
+def calculate_two_mode_interferometer_on_fock_space(interferometer, cutoff):
+    r"""Calculates a two-mode interferometer on the Fock space.
+
+    Specialization of `connector.calculate_interferometer_on_fock_space` for
+    :math:`2 \times 2` matrices (e.g., beamsplitters), where the `N`-particle basis
+    vectors are :math:`|N - i, i\rangle` for :math:`i = 0, \dots, N`, hence no helper
+    indices are needed. The same recursion is used, i.e., a particle is removed from
+    the first occupied mode of the output basis vector.
+    """
+
+    subspace_representations = [np.ones((1, 1), dtype=interferometer.dtype)]
+
+    sqrt_numbers = np.sqrt(np.arange(cutoff)).astype(interferometer.real.dtype)
+
+    for N in range(1, cutoff):
+        previous_representation = subspace_representations[N - 1]
+
+        representation = np.zeros((N + 1, N + 1), dtype=interferometer.dtype)
+
+        reversed_sqrt_numbers = sqrt_numbers[N::-1].copy()
+
+        for row in range(N + 1):
+            if row < N:
+                mode = 0
+                previous_row = row
+                denominator = reversed_sqrt_numbers[row]
+            else:
+                mode = 1
+                previous_row = row - 1
+                denominator = sqrt_numbers[N]
+
+            first_contrib = interferometer[mode, 0] / denominator
+            second_contrib = interferometer[mode, 1] / denominator
+
+            for col in range(N + 1):
+                value = representation[row, col]
+
+                if col < N:
+                    value += (
+                        first_contrib
+                        * reversed_sqrt_numbers[col]
+                        * previous_representation[previous_row, col]
+                    )
+
+                if col > 0:
+                    value += (
+                        second_contrib
+                        * sqrt_numbers[col]
+                        * previous_representation[previous_row, col - 1]
+                    )
+
+                representation[row, col] = value
+
+        subspace_representations.append(representation)
+
+    return subspace_representations
+
+
 @nb.njit(cache=True)
 def nb_calculate_index_list_for_appling_interferometer(
     modes: Tuple[int, ...],
@@ -250,11 +386,133 @@ def nb_calculate_index_list_for_appling_interferometer(
     return index_list
 
 
-calculate_index_list_for_appling_interferometer = lru_cache(maxsize=None)(
+calculate_index_list_for_appling_interferometer = index_table_cache(
     nb_calculate_index_list_for_appling_interferometer
 )
 
 
+@nb.njit(cache=True)
+def nb_calculate_sector_index_list_for_appling_interferometer(
+    modes: Tuple[int, ...],
+    d: int,
+    particle_number: int,
+) -> List[np.ndarray]:
+    """Calculates the indices needed for applying an interferometer on `modes` to the
+    `particle_number`-particle subspace.
+
+    The `n`-th matrix contains the indices of the basis vectors with `n` particles on
+    `modes`, where the rows are enumerated along the `n`-particle basis on `modes`
+    and the columns along the remaining particles on the auxiliary modes. The indices
+    are relative to the first basis vector of the `particle_number`-particle subspace.
+    """
+    subspace = nb_get_fock_space_basis(d=len(modes), cutoff=particle_number + 1)
+    auxiliary_subspace = nb_get_fock_space_basis(
+        d=d - len(modes), cutoff=particle_number + 1
+    )
+
+    indices = cutoff_fock_space_dim_array(
+        cutoff=np.arange(particle_number + 2), d=len(modes)
+    )
+    auxiliary_indices = cutoff_fock_space_dim_array(
+        cutoff=np.arange(particle_number + 2), d=d - len(modes)
+    )
+    auxiliary_modes = get_auxiliary_modes(d, modes)
+
+    offset = cutoff_fock_space_dim(cutoff=particle_number, d=d)
+
+    all_occupation_numbers = np.zeros(d, dtype=np.int32)
+
+    index_list = []
+
+    for n in range(particle_number + 1):
+        n_particle_subspace = subspace[indices[n] : indices[n + 1]]
+        auxiliary_n_particle_subspace = auxiliary_subspace[
+            auxiliary_indices[particle_number - n] : auxiliary_indices[
+                particle_number - n + 1
+            ]
+        ]
+        state_index_matrix = np.empty(
+            shape=(len(n_particle_subspace), len(auxiliary_n_particle_subspace)),
+            dtype=np.int32,
+        )
+        for idx1, auxiliary_occupation_numbers in enumerate(
+            auxiliary_n_particle_subspace
+        ):
+            for idx, mode in enumerate(auxiliary_modes):
+                all_occupation_numbers[mode] = auxiliary_occupation_numbers[idx]
+
+            for idx2, column_vector_on_subspace in enumerate(n_particle_subspace):
+                for idx, mode in enumerate(modes):
+                    all_occupation_numbers[mode] = column_vector_on_subspace[idx]
+
+                column_index = get_index_in_fock_space(all_occupation_numbers)
+                state_index_matrix[idx2, idx1] = column_index - offset
+
+        index_list.append(state_index_matrix)
+
+    return index_list
+
+
+calculate_sector_index_list_for_appling_interferometer = index_table_cache(
+    nb_calculate_sector_index_list_for_appling_interferometer
+)
+
+
+@nb.njit(cache=True)
+def nb_calculate_reduced_index_list(d, cutoff, modes):
+    """Calculates the indices needed for the partial trace onto `modes`.
+
+    The `m`-th matrix corresponds to the basis vectors with `m` particles on the
+    auxiliary modes. These only pair with the basis vectors on `modes` with less than
+    `cutoff - m` particles, which form a prefix of the basis on `modes`. The rows of
+    the matrix are enumerated along this prefix, the columns along the `m`-particle
+    basis on the auxiliary modes, hence no index beyond the cutoff is stored.
+    """
+    subspace = nb_get_fock_space_basis(d=len(modes), cutoff=cutoff)
+    auxiliary_subspace = nb_get_fock_space_basis(d=d - len(modes), cutoff=cutoff)
+
+    indices = cutoff_fock_space_dim_array(cutoff=np.arange(cutoff + 1), d=len(modes))
+    auxiliary_indices = cutoff_fock_space_dim_array(
+        cutoff=np.arange(cutoff + 1), d=d - len(modes)
+    )
+    auxiliary_modes = get_auxiliary_modes(d, modes)
+
+    all_occupation_numbers = np.zeros(d, dtype=np.int32)
+
+    index_list = []
+
+    for m in range(cutoff):
+        auxiliary_m_particle_subspace = auxiliary_subspace[
+            auxiliary_indices[m] : auxiliary_indices[m + 1]
+        ]
+
+        index_matrix = np.empty(
+            shape=(indices[cutoff - m], len(auxiliary_m_particle_subspace)),
+            dtype=np.int32,
+        )
+
+        for idx2, auxiliary_occupation_numbers in enumerate(
+            auxiliary_m_particle_subspace
+        ):
+            for idx, mode in enumerate(auxiliary_modes):
+                all_occupation_numbers[mode] = auxiliary_occupation_numbers[idx]
+
+            for idx1 in range(indices[cutoff - m]):
+                for idx, mode in enumerate(modes):
+                    all_occupation_numbers[mode] = subspace[idx1, idx]
+
+                index_matrix[idx1, idx2] = get_index_in_fock_space(
+                    all_occupation_numbers
+                )
+
+        index_list.append(index_matrix)
+
+    return index_list
+
+
+calculate_reduced_index_list = index_table_cache(nb_calculate_reduced_index_list)
+
+
 def get_projection_operator_indices(d, cutoff, modes, basis_vector):
     new_cutoff = cutoff - np.sum(basis_vector)
 
@@ -32,16 +32,19 @@ from piquasso._math.fock import (
     get_single_mode_displacement_operator,
     get_creation_operator,
     get_annihilation_operator,
-    operator_basis,
     get_single_mode_squeezing_operator,
     get_single_mode_cubic_phase_operator,
     get_fock_space_basis,
+    get_gaussian_unitary_operator,
 )
 
 from ..calculations import (
     calculate_state_index_matrix_list,
+    calculate_multimode_state_index_matrix_list,
+    is_gaussian_unitary_operator_preferred,
     calculate_interferometer_helper_indices,
     calculate_index_list_for_appling_interferometer,
+    calculate_two_mode_interferometer_on_fock_space,
     get_projection_operator_indices,
 )
 
@@ -95,27 +98,41 @@ def _calculate_density_matrix_after_interferometer(
     subspace_transformations: List[np.ndarray],
     index_list: List[np.ndarray],
 ) -> np.ndarray:
-    new_density_matrix = np.empty_like(density_matrix)
+    r"""
+    Calculates :math:`U \rho U^\dagger` by applying :math:`U` on the rows of
+    :math:`\rho`, and then on the rows of :math:`(U \rho)^\dagger`.
+    """
 
-    for ket, indices_ket in enumerate(index_list):
-        for bra, indices_bra in enumerate(index_list):
-            for col_ket in range(indices_ket.shape[1]):
-                for col_bra in range(indices_bra.shape[1]):
-                    index = np.ix_(
-                        indices_ket[:, col_ket],
-                        indices_bra[:, col_bra].T,
-                    )
-                    new_density_matrix[index] = np.einsum(
-                        "ij,jk,kl->il",
-                        subspace_transformations[ket],
-                        density_matrix[index],
-                        subspace_transformations[bra].T.conj(),
-                    )
+    new_density_matrix = _apply_subspace_transformations_on_rows(
+        density_matrix, subspace_transformations, index_list
+    )
 
-    return new_density_matrix
+    new_density_matrix = _apply_subspace_transformations_on_rows(
+        new_density_matrix.conj().T, subspace_transformations, index_list
+    )
+
+    return np.ascontiguousarray(new_density_matrix.conj().T)
+
+
+def _apply_subspace_transformations_on_rows(
+    matrix: np.ndarray,
+    subspace_transformations: List[np.ndarray],
+    index_list: List[np.ndarray],
+) -> np.ndarray:
+    new_matrix = np.empty_like(matrix)
+
+    for n, indices in enumerate(index_list):
+        new_matrix[indices] = np.tensordot(
+            subspace_transformations[n], matrix[indices], axes=1
+        )
+
+    return new_matrix
 
 
 def _get_interferometer_on_fock_space(interferometer, cutoff, connector):
+    if len(interferometer) == 2:
+        return calculate_two_mode_interferometer_on_fock_space(interferometer, cutoff)
+
     index_tuple = calculate_interferometer_helper_indices(
         d=len(interferometer),
         cutoff=cutoff,
@@ -214,20 +231,26 @@ def annihilate(state: FockState, instruction: Instruction, shots: int) -> Result
     return Result(state=state)
 
 
-def kerr(state: FockState, instruction: Instruction, shots: int) -> Result:
-    space = get_fock_space_basis(d=state.d, cutoff=state._config.cutoff)
+def phaseshifter(state: FockState, instruction: Instruction, shots: int) -> Result:
+    occupation_numbers = get_fock_space_basis(d=state.d, cutoff=state._config.cutoff)
 
-    xi = instruction._all_params["xi"]
+    phi = instruction._all_params["phi"]
 
     mode = instruction.modes[0]
 
-    for index, (basis, dual_basis) in operator_basis(space):
-        number = basis[mode]
-        dual_number = dual_basis[mode]
+    _apply_diagonal_gate(state, phi * occupation_numbers[:, mode])
+
+    return Result(state=state)
+
+
+def kerr(state: FockState, instruction: Instruction, shots: int) -> Result:
+    occupation_numbers = get_fock_space_basis(d=state.d, cutoff=state._config.cutoff)
 
-        coefficient = np.exp(1j * xi * (number**2 - dual_number**2))
+    xi = instruction._all_params["xi"]
+
+    mode = instruction.modes[0]
 
-        state._density_matrix[index] *= coefficient
+    _apply_diagonal_gate(state, xi * occupation_numbers[:, mode] ** 2)
 
     return Result(state=state)
 
@@ -313,26 +336,31 @@ def _calculate_density_matrix_after_apply_active_gate(
 
 
 def cross_kerr(state: FockState, instruction: Instruction, shots: int) -> Result:
-    space = get_fock_space_basis(d=state.d, cutoff=state._config.cutoff)
+    occupation_numbers = get_fock_space_basis(d=state.d, cutoff=state._config.cutoff)
 
-    modes = instruction.modes
     xi = instruction._all_params["xi"]
 
-    for index, (basis, dual_basis) in operator_basis(space):
-        coefficient = np.exp(
-            1j
-            * xi
-            * (
-                basis[modes[0]] * basis[modes[1]]
-                - dual_basis[modes[0]] * dual_basis[modes[1]]
-            )
-        )
+    modes = instruction.modes
 
-        state._density_matrix[index] *= coefficient
+    _apply_diagonal_gate(
+        state,
+        xi * occupation_numbers[:, modes[0]] * occupation_numbers[:, modes[1]],
+    )
 
     return Result(state=state)
 
 
+def _apply_diagonal_gate(state: FockState, phases: np.ndarray) -> None:
+    """
+    Applies the unitary which multiplies every basis vector by `exp(1j * phase)`,
+    where `phases` contains the phases corresponding to the basis vectors.
+    """
+
+    coefficients = np.exp(1j * phases)
+
+    state._density_matrix *= np.outer(coefficients, coefficients.conj())
+
+
 def displacement(state: FockState, instruction: Instruction, shots: int) -> Result:
     r = instruction._all_params["r"]
     phi = instruction._all_params["phi"]
@@ -380,6 +408,26 @@ def linear(
     passive_block = instruction._get_passive_block(state._connector, state._config)
     active_block = instruction._get_active_block(state._connector, state._config)
 
+    if is_gaussian_unitary_operator_preferred(
+        state.d, state._config.cutoff, len(modes)
+    ):
+        matrix = get_gaussian_unitary_operator(
+            passive_block,
+            active_block,
+            cutoff=state._config.cutoff,
+            complex_dtype=state._config.complex_dtype,
+        )
+
+        state._density_matrix = _calculate_density_matrix_after_apply_active_gate(
+            state._density_matrix,
+            matrix,
+            calculate_multimode_state_index_matrix_list(
+                state.d, state._config.cutoff, modes
+            ),
+        )
+
+        return Result(state=state)
+
     symplectic = connector.block(
         [
             [passive_block, active_block],
@@ -25,6 +25,7 @@ from .calculations import (
     displacement,
     linear,
     density_matrix_instruction,
+    phaseshifter,
     kerr,
     cross_kerr,
     cubic_phase,
@@ -105,7 +106,7 @@ class FockSimulator(BuiltinSimulator):
         gates.Interferometer: passive_linear,
         gates.Beamsplitter: passive_linear,
         gates.Beamsplitter5050: passive_linear,
-        gates.Phaseshifter: passive_linear,
+        gates.Phaseshifter: phaseshifter,
         gates.MachZehnder: passive_linear,
         gates.Fourier: passive_linear,
         gates.Kerr: kerr,
@@ -118,6 +119,8 @@ class FockSimulator(BuiltinSimulator):
         gates.MomentumDisplacement: displacement,
         gates.Squeezing2: linear,
         gates.GaussianTransform: linear,
+        gates.ControlledX: linear,
+        gates.ControlledZ: linear,
         measurements.ParticleNumberMeasurement: particle_number_measurement,
         channels.Attenuator: attenuator,
     }
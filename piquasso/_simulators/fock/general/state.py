@@ -21,13 +21,11 @@ from piquasso.api.connector import BaseConnector
 from piquasso.api.config import Config
 from piquasso.api.exceptions import InvalidState, PiquassoException
 from piquasso._math.linalg import is_selfadjoint
-from piquasso._math.fock import cutoff_fock_space_dim, get_fock_space_basis
-from piquasso._math.indices import (
-    get_index_in_fock_space,
-    get_index_in_fock_space_array,
-)
+from piquasso._math.fock import cutoff_fock_space_dim
+from piquasso._math.indices import get_index_in_fock_space
 
 from ..state import BaseFockState
+from ..calculations import calculate_reduced_index_list
 
 
 class FockState(BaseFockState):
@@ -146,58 +144,53 @@ class FockState(BaseFockState):
         return probability_map
 
     def reduced(self, modes: Tuple[int, ...]) -> "FockState":
-        np = self._connector.np
-        fallback_np = self._connector.fallback_np
-        d = self.d
+        r"""Reduces the state to a subsystem by taking the partial trace.
 
-        if modes == tuple(range(d)):
-            return self
+        The elements of the reduced density matrix are calculated as
 
-        outer_modes = self._get_auxiliary_modes(modes)
+        .. math::
+            \rho^{\text{red}}_{ij} = \sum_k \rho_{(i, k), (j, k)},
+
+        where :math:`k` runs over the basis of the auxiliary modes. The auxiliary basis
+        vectors with :math:`m` particles only pair with the reduced basis vectors
+        with less than :math:`c - m` particles, which form a prefix of the reduced
+        basis. Hence, the elements are gathered for every :math:`m` separately, using
+        the cached indices of the basis vectors :math:`(i, k)`, and no element beyond
+        the cutoff is ever gathered.
+        """
+        np = self._connector.np
 
-        inner_size = len(modes)
-        outer_size = d - inner_size
+        if modes == tuple(range(self.d)):
+            return self
 
-        reduced_state = FockState(
-            d=inner_size, connector=self._connector, config=self._config
+        index_list = calculate_reduced_index_list(
+            self.d, self._config.cutoff, tuple(modes)
         )
 
-        density_list = [
-            [0.0 for _ in range(reduced_state._density_matrix.shape[1])]
-            for _ in range(reduced_state._density_matrix.shape[0])
-        ]
-
-        cutoff = self._config.cutoff
-        inner_space = get_fock_space_basis(d=inner_size, cutoff=cutoff)
-        outer_space = get_fock_space_basis(d=outer_size, cutoff=cutoff)
+        reduced_dim = index_list[0].shape[0]
 
-        index_list = []
-
-        basis_matrix = fallback_np.empty(
-            shape=(outer_space.shape[0], self.d), dtype=int
+        density_matrix = np.zeros(
+            shape=(reduced_dim, reduced_dim), dtype=self._density_matrix.dtype
         )
 
-        for inner_basis in inner_space:
-            size = cutoff_fock_space_dim(
-                cutoff=cutoff - fallback_np.sum(inner_basis), d=outer_size
-            )
-
-            basis_matrix[:size, modes] = inner_basis
-
-            basis_matrix[:size, outer_modes] = outer_space[:size]
+        for index_matrix in index_list:
+            size = index_matrix.shape[0]
+            indices = index_matrix.T
 
-            partial_index_list = get_index_in_fock_space_array(basis_matrix[:size])
+            block = np.sum(
+                self._density_matrix[indices[:, :, None], indices[:, None, :]],
+                axis=0,
+            )
 
-            index_list.append(partial_index_list)
+            density_matrix += np.pad(
+                block, ((0, reduced_dim - size), (0, reduced_dim - size))
+            )
 
-        for i, ix1 in enumerate(index_list):
-            for j, ix2 in enumerate(index_list):
-                minlen = min(len(ix1), len(ix2))
-                density_list[i][j] = np.sum(
-                    self._density_matrix[ix1[:minlen], ix2[:minlen]]
-                )
+        reduced_state = FockState(
+            d=len(modes), connector=self._connector, config=self._config
+        )
 
-        reduced_state._density_matrix = np.array(density_list)
+        reduced_state._density_matrix = density_matrix
 
         return reduced_state
 
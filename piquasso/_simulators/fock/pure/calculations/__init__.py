@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .passive_linear import passive_linear, beamsplitter5050
+from .passive_linear import passive_linear, beamsplitter5050, sector_passive_linear
 from .measurements import (
     post_select_photons,
     imperfect_post_select_photons,
@@ -24,6 +24,7 @@ from .homodyne import homodyne_measurement
 __all__ = [
     "passive_linear",
     "beamsplitter5050",
+    "sector_passive_linear",
     "post_select_photons",
     "imperfect_post_select_photons",
     "homodyne_measurement",
@@ -37,7 +38,11 @@ import numpy as np
 from .passive_linear import _apply_passive_linear
 from .utils import project_to_subspace
 
-from ...calculations import calculate_state_index_matrix_list
+from ...calculations import (
+    calculate_state_index_matrix_list,
+    calculate_multimode_state_index_matrix_list,
+    is_gaussian_unitary_operator_preferred,
+)
 
 from ..state import PureFockState
 from ..batch_state import BatchPureFockState
@@ -51,6 +56,7 @@ from piquasso._math.fock import (
     get_single_mode_squeezing_operator,
     get_single_mode_cubic_phase_operator,
     get_fock_space_basis,
+    get_gaussian_unitary_operator,
 )
 
 from piquasso.instructions import gates
@@ -108,6 +114,7 @@ def _apply_active_gate_matrix_to_state(
     cutoff: int,
     mode: int,
     connector: BaseConnector,
+    out: Optional[np.ndarray] = None,
 ) -> None:
     @connector.custom_gradient
     def _apply_active_gate_matrix(state_vector, matrix):
@@ -116,7 +123,7 @@ def _apply_active_gate_matrix_to_state(
 
         state_index_matrix_list = calculate_state_index_matrix_list(d, cutoff, mode)
         new_state_vector = _calculate_state_vector_after_apply_active_gate(
-            state_vector, matrix, state_index_matrix_list, connector
+            state_vector, matrix, state_index_matrix_list, connector, out=out
         )
         grad = _create_linear_active_gate_gradient_function(
             state_vector, matrix, state_index_matrix_list, connector
@@ -131,10 +138,13 @@ def _calculate_state_vector_after_apply_active_gate(
     matrix,
     state_index_matrix_list,
     connector,
+    out=None,
 ):
     np = connector.forward_pass_np
 
-    new_state_vector = np.empty_like(state_vector, dtype=state_vector.dtype)
+    new_state_vector = (
+        np.empty_like(state_vector, dtype=state_vector.dtype) if out is None else out
+    )
 
     is_batch = len(state_vector.shape) == 2
 
@@ -253,38 +263,59 @@ def annihilate(state: PureFockState, instruction: Instruction, shots: int) -> Re
     return Result(state=state)
 
 
+def phaseshifter(state: PureFockState, instruction: Instruction, shots: int) -> Result:
+    occupation_numbers = get_fock_space_basis(d=state.d, cutoff=state._config.cutoff)
+
+    phi = instruction._all_params["phi"]
+
+    mode = instruction.modes[0]
+
+    _apply_diagonal_gate(state, phi * occupation_numbers[:, mode])
+
+    return Result(state=state)
+
+
 def kerr(state: PureFockState, instruction: Instruction, shots: int) -> Result:
-    space = get_fock_space_basis(d=state.d, cutoff=state._config.cutoff)
+    occupation_numbers = get_fock_space_basis(d=state.d, cutoff=state._config.cutoff)
 
     xi = instruction._all_params["xi"]
-    np = state._np
 
     mode = instruction.modes[0]
 
-    coefficients = np.exp(1j * xi * np.array([basis[mode] ** 2 for basis in space]))
-
-    # NOTE: Transposition is done here in order to work with batch processing.
-    state.state_vector = (coefficients * state.state_vector.T).T
+    _apply_diagonal_gate(state, xi * occupation_numbers[:, mode] ** 2)
 
     return Result(state=state)
 
 
 def cross_kerr(state: PureFockState, instruction: Instruction, shots: int) -> Result:
-    space = get_fock_space_basis(d=state.d, cutoff=state._config.cutoff)
+    occupation_numbers = get_fock_space_basis(d=state.d, cutoff=state._config.cutoff)
 
-    np = state._connector.np
+    xi = instruction._all_params["xi"]
 
     modes = instruction.modes
-    xi = instruction._all_params["xi"]
-    for index, basis in enumerate(space):
-        coefficient = np.exp(1j * xi * basis[modes[0]] * basis[modes[1]])
-        state.state_vector = state._connector.assign(
-            state.state_vector, index, state.state_vector[index] * coefficient
-        )
+
+    _apply_diagonal_gate(
+        state,
+        xi * occupation_numbers[:, modes[0]] * occupation_numbers[:, modes[1]],
+    )
 
     return Result(state=state)
 
 
+def _apply_diagonal_gate(state: PureFockState, phases) -> None:
+    """
+    Multiplies every basis vector by `exp(1j * phase)`, where `phases` contains the
+    phases corresponding to the basis vectors, calculated from the occupation numbers.
+    """
+
+    np = state._np
+
+    coefficients = np.exp(1j * phases).astype(state._config.complex_dtype)
+
+    # NOTE: Transposition is done here in order to work with batch processing.
+    state.state_vector = (coefficients * state.state_vector.T).T
+
+
 def displacement(state: PureFockState, instruction: Instruction, shots: int) -> Result:
     connector = state._connector
 
@@ -310,6 +341,7 @@ def displacement(state: PureFockState, instruction: Instruction, shots: int) ->
         state._config.cutoff,
         instruction.modes[0],
         connector,
+        out=state._get_spare_state_vector(),
     )
 
     return Result(state=state)
@@ -337,6 +369,7 @@ def _apply_squeezing(state, r, phi, mode):
         state._config.cutoff,
         mode,
         connector=connector,
+        out=state._get_spare_state_vector(),
     )
 
 
@@ -374,6 +407,7 @@ def cubic_phase(state: PureFockState, instruction: Instruction, shots: int) -> R
         state._config.cutoff,
         instruction.modes[0],
         connector,
+        out=state._get_spare_state_vector(),
     )
 
     return Result(state=state)
@@ -385,11 +419,38 @@ def linear(
     connector = state._connector
     modes = instruction.modes
 
-    np = connector.np
-
     passive_block = instruction._get_passive_block(state._connector, state._config)
     active_block = instruction._get_active_block(state._connector, state._config)
 
+    # NOTE: The matrix of the gate on the Fock space of `modes` is not
+    # differentiable, hence the decomposition is used for the other connectors.
+    if (
+        connector.np is connector.fallback_np
+        and is_gaussian_unitary_operator_preferred(
+            state.d, state._config.cutoff, len(modes)
+        )
+    ):
+        matrix = get_gaussian_unitary_operator(
+            passive_block,
+            active_block,
+            cutoff=state._config.cutoff,
+            complex_dtype=state._config.complex_dtype,
+        )
+
+        state.state_vector = _calculate_state_vector_after_apply_active_gate(
+            state.state_vector,
+            matrix,
+            calculate_multimode_state_index_matrix_list(
+                state.d, state._config.cutoff, modes
+            ),
+            connector,
+            out=state._get_spare_state_vector(),
+        )
+
+        return Result(state=state)
+
+    np = connector.np
+
     symplectic = connector.block(
         [
             [passive_block, active_block],
@@ -0,0 +1,282 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Calculations applying instructions with different parameters on every element of a
+:class:`BatchPureFockState`, where the `k`-th instruction corresponds to the `k`-th
+column of the state vector.
+"""
+
+from typing import List
+
+import numpy as np
+
+from piquasso.api.instruction import Instruction
+from piquasso.api.result import Result
+
+from piquasso._math.fock import (
+    get_fock_space_basis,
+    get_single_mode_displacement_operator,
+    get_single_mode_squeezing_operator,
+    get_single_mode_cubic_phase_operator,
+)
+
+from piquasso.instructions import gates
+
+from ...calculations import (
+    calculate_index_list_for_appling_interferometer,
+    calculate_state_index_matrix_list,
+)
+
+from ..batch_state import BatchPureFockState
+
+from .passive_linear import _get_interferometer_on_fock_space
+
+
+def batch_passive_linear(
+    state: BatchPureFockState,
+    instructions: List[gates._PassiveLinearGate],
+    shots: int,
+) -> Result:
+    connector = state._connector
+    np = connector.np
+    cutoff = state._config.cutoff
+
+    subspace_transformations_list = [
+        _get_interferometer_on_fock_space(
+            instruction._get_passive_block(connector, state._config).astype(
+                state._config.complex_dtype
+            ),
+            cutoff,
+            connector,
+        )
+        for instruction in instructions
+    ]
+
+    index_list = calculate_index_list_for_appling_interferometer(
+        instructions[0].modes, state.d, cutoff
+    )
+
+    state_vector = state.state_vector
+    new_state_vector = np.empty_like(state_vector)
+
+    for n, indices in enumerate(index_list):
+        subspace_transformations = np.stack(
+            [
+                subspace_transformations[n]
+                for subspace_transformations in subspace_transformations_list
+            ]
+        )
+
+        new_state_vector = connector.assign(
+            new_state_vector,
+            indices,
+            _apply_batch_matrices(
+                subspace_transformations, state_vector[indices], connector
+            ),
+        )
+
+    state.state_vector = new_state_vector
+
+    return Result(state=state)
+
+
+def batch_phaseshifter(
+    state: BatchPureFockState, instructions: List[Instruction], shots: int
+) -> Result:
+    occupation_numbers = get_fock_space_basis(d=state.d, cutoff=state._config.cutoff)
+
+    phis = _stack_param(state, instructions, "phi")
+
+    mode = instructions[0].modes[0]
+
+    _apply_batch_diagonal_gate(state, occupation_numbers[:, mode], phis)
+
+    return Result(state=state)
+
+
+def batch_kerr(
+    state: BatchPureFockState, instructions: List[Instruction], shots: int
+) -> Result:
+    occupation_numbers = get_fock_space_basis(d=state.d, cutoff=state._config.cutoff)
+
+    xis = _stack_param(state, instructions, "xi")
+
+    mode = instructions[0].modes[0]
+
+    _apply_batch_diagonal_gate(state, occupation_numbers[:, mode] ** 2, xis)
+
+    return Result(state=state)
+
+
+def batch_cross_kerr(
+    state: BatchPureFockState, instructions: List[Instruction], shots: int
+) -> Result:
+    occupation_numbers = get_fock_space_basis(d=state.d, cutoff=state._config.cutoff)
+
+    xis = _stack_param(state, instructions, "xi")
+
+    modes = instructions[0].modes
+
+    _apply_batch_diagonal_gate(
+        state, occupation_numbers[:, modes[0]] * occupation_numbers[:, modes[1]], xis
+    )
+
+    return Result(state=state)
+
+
+def _stack_param(
+    state: BatchPureFockState, instructions: List[Instruction], name: str
+) -> np.ndarray:
+    return state._connector.np.stack(
+        [instruction._all_params[name] for instruction in instructions]
+    )
+
+
+def _apply_batch_diagonal_gate(state: BatchPureFockState, numbers, params) -> None:
+    """
+    Multiplies the basis vectors in the `k`-th batch element by
+    `exp(1j * numbers * params[k])`, where `numbers` contains the values corresponding
+    to the basis vectors, calculated from the occupation numbers.
+
+    The exponentials are only calculated for the distinct values in `numbers`.
+    """
+
+    np = state._np
+
+    unique_numbers, inverse_indices = state._connector.fallback_np.unique(
+        numbers, return_inverse=True
+    )
+
+    coefficients = np.exp(1j * np.outer(unique_numbers, params)).astype(
+        state._config.complex_dtype
+    )
+
+    state.state_vector = coefficients[inverse_indices] * state.state_vector
+
+
+def batch_squeezing(
+    state: BatchPureFockState, instructions: List[Instruction], shots: int
+) -> Result:
+    connector = state._connector
+
+    wrapped_get_matrix = connector.decorator(get_single_mode_squeezing_operator)
+
+    matrices = connector.np.stack(
+        [
+            wrapped_get_matrix(
+                r=instruction._all_params["r"],
+                phi=instruction._all_params["phi"],
+                cutoff=state._config.cutoff,
+                complex_dtype=state._config.complex_dtype,
+                connector=connector,
+            )
+            for instruction in instructions
+        ]
+    )
+
+    _apply_batch_active_gate_matrices(state, matrices, instructions[0].modes[0])
+
+    return Result(state=state)
+
+
+def batch_displacement(
+    state: BatchPureFockState, instructions: List[Instruction], shots: int
+) -> Result:
+    connector = state._connector
+
+    wrapped_get_matrix = connector.decorator(get_single_mode_displacement_operator)
+
+    matrices = connector.np.stack(
+        [
+            wrapped_get_matrix(
+                r=instruction._all_params["r"],
+                phi=instruction._all_params["phi"],
+                cutoff=state._config.cutoff,
+                complex_dtype=state._config.complex_dtype,
+                connector=connector,
+            )
+            for instruction in instructions
+        ]
+    )
+
+    _apply_batch_active_gate_matrices(state, matrices, instructions[0].modes[0])
+
+    return Result(state=state)
+
+
+def batch_cubic_phase(
+    state: BatchPureFockState, instructions: List[Instruction], shots: int
+) -> Result:
+    connector = state._connector
+
+    wrapped_get_matrix = connector.decorator(get_single_mode_cubic_phase_operator)
+
+    matrices = connector.np.stack(
+        [
+            wrapped_get_matrix(
+                gamma=instruction._all_params["gamma"],
+                cutoff=state._config.cutoff,
+                hbar=state._config.hbar,
+                connector=connector,
+            )
+            for instruction in instructions
+        ]
+    )
+
+    _apply_batch_active_gate_matrices(state, matrices, instructions[0].modes[0])
+
+    return Result(state=state)
+
+
+def _apply_batch_active_gate_matrices(
+    state: BatchPureFockState, matrices: np.ndarray, mode: int
+) -> None:
+    connector = state._connector
+    np = connector.np
+
+    state_index_matrix_list = calculate_state_index_matrix_list(
+        state.d, state._config.cutoff, mode
+    )
+
+    state_vector = state.state_vector
+    new_state_vector = np.empty_like(state_vector)
+
+    for state_index_matrix in state_index_matrix_list:
+        limit = state_index_matrix.shape[0]
+        new_state_vector = connector.assign(
+            new_state_vector,
+            state_index_matrix,
+            _apply_batch_matrices(
+                matrices[:, :limit, :limit],
+                state_vector[state_index_matrix],
+                connector,
+            ),
+        )
+
+    state.state_vector = new_state_vector
+
+
+def _apply_batch_matrices(matrices, state_vector_slices, connector):
+    """
+    Applies the `k`-th matrix on the `k`-th batch element, i.e., calculates the einsum
+    "kij,jlk->ilk" via a batched matrix multiplication.
+    """
+
+    np = connector.np
+
+    return np.transpose(
+        matrices @ np.transpose(state_vector_slices, (2, 0, 1)), (1, 2, 0)
+    )
@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Tuple, List, Callable
+from typing import Tuple, List, Callable, Optional
 
 from functools import lru_cache
 
@@ -25,9 +25,12 @@ from scipy.special import factorial, comb
 from piquasso.api.connector import BaseConnector
 
 from ..state import PureFockState
+from ..sector_state import SectorPureFockState
 from ...calculations import (
     calculate_interferometer_helper_indices,
     calculate_index_list_for_appling_interferometer,
+    calculate_sector_index_list_for_appling_interferometer,
+    calculate_two_mode_interferometer_on_fock_space,
 )
 from piquasso.instructions import gates
 
@@ -48,6 +51,40 @@ def passive_linear(
     return Result(state=state)
 
 
+def sector_passive_linear(
+    state: SectorPureFockState, instruction: gates._PassiveLinearGate, shots: int
+) -> Result:
+    """Applies a passive linear gate on each nonempty particle number subspace
+    separately, without assembling the whole state vector.
+    """
+    connector = state._connector
+
+    if not state._sectors:
+        return Result(state=state)
+
+    interferometer: np.ndarray = instruction._get_passive_block(
+        state._connector, state._config
+    ).astype(state._config.complex_dtype)
+
+    subspace_transformations = _get_interferometer_on_fock_space(
+        interferometer, max(state._sectors) + 1, connector
+    )
+
+    state._sectors = {
+        particle_number: _calculate_state_vector_after_interferometer(
+            sector,
+            subspace_transformations,
+            calculate_sector_index_list_for_appling_interferometer(
+                instruction.modes, state.d, particle_number
+            ),
+            connector,
+        )
+        for particle_number, sector in state._sectors.items()
+    }
+
+    return Result(state=state)
+
+
 def _apply_passive_linear(state, interferometer, modes, connector):
     wrapped = connector.decorator(_do_apply_passive_linear)
 
@@ -58,34 +95,44 @@ def _apply_passive_linear(state, interferometer, modes, connector):
         state._config.cutoff,
         modes,
         connector,
+        out=state._get_spare_state_vector(),
     )
 
 
-def _do_apply_passive_linear(state_vector, interferometer, d, cutoff, modes, connector):
+def _do_apply_passive_linear(
+    state_vector, interferometer, d, cutoff, modes, connector, out=None
+):
     subspace_transformations = _get_interferometer_on_fock_space(
         interferometer, cutoff, connector
     )
 
     return _apply_passive_gate_matrix_to_state(
-        state_vector, subspace_transformations, d, cutoff, modes, connector
+        state_vector, subspace_transformations, d, cutoff, modes, connector, out=out
     )
 
 
 def _get_interferometer_on_fock_space(interferometer, cutoff, connector):
     def _get_interferometer_with_gradient_callback(interferometer):
         interferometer = connector.preprocess_input_for_custom_gradient(interferometer)
-        index_tuple = calculate_interferometer_helper_indices(
-            d=len(interferometer), cutoff=cutoff
-        )
 
-        subspace_representations = connector.calculate_interferometer_on_fock_space(
-            interferometer, index_tuple
-        )
+        if len(interferometer) == 2 and connector.forward_pass_np is np:
+            subspace_representations = calculate_two_mode_interferometer_on_fock_space(
+                interferometer, cutoff
+            )
+        else:
+            index_tuple = calculate_interferometer_helper_indices(
+                d=len(interferometer), cutoff=cutoff
+            )
+
+            subspace_representations = connector.calculate_interferometer_on_fock_space(
+                interferometer, index_tuple
+            )
+
         grad = _calculate_interferometer_gradient_on_fock_space(
             interferometer,
             connector,
             subspace_representations,
-            index_tuple,
+            cutoff,
         )
 
         return subspace_representations, grad
@@ -145,7 +192,7 @@ def _calculate_subspace_grad(
 
 
 def _calculate_interferometer_gradient_on_fock_space(
-    interferometer, connector, subspace_representations, index_tuple
+    interferometer, connector, subspace_representations, cutoff
 ):
     def interferometer_gradient(*upstream):
         tf = connector._tf
@@ -160,7 +207,8 @@ def _calculate_interferometer_gradient_on_fock_space(
             np = connector.np
 
         d = len(interferometer)
-        cutoff = len(index_tuple[0]) + 2
+
+        index_tuple = calculate_interferometer_helper_indices(d=d, cutoff=cutoff)
 
         (
             subspace_index_tensor,
@@ -223,6 +271,7 @@ def _apply_passive_gate_matrix_to_state(
     cutoff: int,
     modes: Tuple[int, ...],
     connector: BaseConnector,
+    out: Optional[np.ndarray] = None,
 ) -> None:
     def _apply_interferometer_matrix(state_vector, subspace_transformations):
         state_vector = connector.preprocess_input_for_custom_gradient(state_vector)
@@ -243,6 +292,7 @@ def _apply_passive_gate_matrix_to_state(
             subspace_transformations,
             index_list,
             connector,
+            out=out,
         )
 
         grad = _create_linear_passive_gate_gradient_function(
@@ -263,10 +313,11 @@ def _calculate_state_vector_after_interferometer(
     subspace_transformations: List[np.ndarray],
     index_list: List[np.ndarray],
     connector: BaseConnector,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     np = connector.forward_pass_np
 
-    new_state_vector = np.empty_like(state_vector)
+    new_state_vector = np.empty_like(state_vector) if out is None else out
 
     is_batch = len(state_vector.shape) == 2
 
@@ -396,4 +447,5 @@ def _apply_beamsplitter5050(state, modes):
         cutoff=cutoff,
         modes=modes,
         connector=state._connector,
+        out=state._get_spare_state_vector(),
     )
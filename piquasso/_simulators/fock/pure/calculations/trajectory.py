@@ -0,0 +1,177 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from scipy.special import comb
+
+from piquasso.api.instruction import Instruction
+from piquasso.api.result import Result
+from piquasso.api.exceptions import InvalidInstruction, InvalidParameter
+
+from piquasso._math.fock import get_fock_space_basis
+from piquasso._math.indices import get_index_in_fock_space_array
+
+from ...calculations import calculate_state_index_matrix_list
+
+from ..trajectory_state import TrajectoryFockState
+
+from . import particle_number_measurement
+
+
+def trajectory_attenuator(
+    state: TrajectoryFockState, instruction: Instruction, shots: int
+) -> Result:
+    r"""
+    Applies the loss channel by choosing a Kraus operator
+
+    .. math::
+        K_k = \sum_{n=k}^{c - 1} \sqrt{ {n \choose k} } \cos(\theta)^{n - k}
+            \sin(\theta)^k | n - k \rangle \langle n |
+
+    for every trajectory :math:`\ket{\psi}` with probability
+    :math:`\| K_k \ket{\psi} \|^2`, and replacing the trajectory with the normalized
+    :math:`K_k \ket{\psi}`.
+
+    The state is split into `shots` trajectories at the first channel.
+    """
+
+    modes = instruction.modes
+
+    if state._config.validate and len(modes) != 1:
+        raise InvalidInstruction(
+            f"The instruction should be specified for '{len(modes)}' "
+            f"modes: instruction={instruction}"
+        )
+
+    mean_thermal_excitation = instruction._all_params["mean_thermal_excitation"]
+
+    if state._config.validate and not np.isclose(mean_thermal_excitation, 0.0):
+        raise InvalidParameter(
+            "Non-zero mean thermal excitation is not supported in this backend. "
+            f"mean_thermal_excitation={mean_thermal_excitation}"
+        )
+
+    theta = instruction._all_params["theta"]
+    mode = modes[0]
+
+    d = state.d
+    cutoff = state._config.cutoff
+
+    if len(state.state_vector.shape) == 1:
+        state.state_vector = np.repeat(state.state_vector[:, None], shots, axis=1)
+
+    state_vectors = state.state_vector
+
+    occupation_numbers = np.arange(cutoff)
+    jumps = occupation_numbers[:, None]
+
+    amplitudes = np.where(
+        jumps <= occupation_numbers,
+        np.sqrt(comb(occupation_numbers, jumps))
+        * np.cos(theta) ** np.maximum(occupation_numbers - jumps, 0)
+        * np.sin(theta) ** jumps,
+        0.0,
+    )
+
+    space = get_fock_space_basis(d=d, cutoff=cutoff)
+
+    jump_probabilities = (amplitudes**2)[:, space[:, mode]] @ (
+        np.abs(state_vectors) ** 2
+    )
+
+    cumulative_probabilities = np.cumsum(jump_probabilities, axis=0)
+
+    guesses = state._config.rng.uniform(size=state_vectors.shape[1])
+
+    chosen_jumps = np.sum(
+        cumulative_probabilities < guesses * cumulative_probabilities[-1], axis=0
+    )
+
+    new_state_vectors = np.zeros_like(state_vectors)
+
+    state_index_matrix_list = calculate_state_index_matrix_list(d, cutoff, mode)
+
+    for jump in np.unique(chosen_jumps):
+        trajectories = np.flatnonzero(chosen_jumps == jump)
+
+        normalization = 1 / np.sqrt(jump_probabilities[jump, trajectories])
+
+        for state_index_matrix in state_index_matrix_list:
+            limit = state_index_matrix.shape[0]
+
+            if jump >= limit:
+                continue
+
+            new_state_vectors[
+                state_index_matrix[: limit - jump, :, None], trajectories
+            ] = (
+                amplitudes[jump, jump:limit, None, None]
+                * state_vectors[state_index_matrix[jump:, :, None], trajectories]
+                * normalization
+            )
+
+    state.state_vector = new_state_vectors
+
+    return Result(state=state)
+
+
+def trajectory_particle_number_measurement(
+    state: TrajectoryFockState, instruction: Instruction, shots: int
+) -> Result:
+    """
+    Samples every trajectory once and projects it to the sampled subspace.
+
+    If the trajectories were not split by any channel, `shots` samples are drawn from
+    the only trajectory, similarly to :class:`PureFockSimulator`.
+    """
+
+    if len(state.state_vector.shape) == 1:
+        return particle_number_measurement(state, instruction, shots)
+
+    modes = instruction.modes
+
+    space = get_fock_space_basis(d=state.d, cutoff=state._config.cutoff)
+    reduced_space = get_fock_space_basis(d=len(modes), cutoff=state._config.cutoff)
+
+    reduced_indices = get_index_in_fock_space_array(space[:, modes])
+
+    probabilities = np.abs(state.state_vector) ** 2
+
+    reduced_probabilities = np.zeros(
+        shape=(len(reduced_space), probabilities.shape[1]), dtype=probabilities.dtype
+    )
+    np.add.at(reduced_probabilities, reduced_indices, probabilities)
+
+    cumulative_probabilities = np.cumsum(reduced_probabilities, axis=0)
+
+    guesses = state._config.rng.uniform(size=probabilities.shape[1])
+
+    sample_indices = np.sum(
+        cumulative_probabilities < guesses * cumulative_probabilities[-1], axis=0
+    )
+
+    trajectories = np.arange(probabilities.shape[1])
+
+    state.state_vector = np.where(
+        reduced_indices[:, None] == sample_indices,
+        state.state_vector
+        / np.sqrt(reduced_probabilities[sample_indices, trajectories]),
+        0.0,
+    ).astype(state.state_vector.dtype)
+
+    samples = [tuple(sample) for sample in reduced_space[sample_indices].tolist()]
+
+    return Result(state=state, samples=samples)
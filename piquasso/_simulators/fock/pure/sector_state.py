@@ -0,0 +1,140 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional, Dict
+
+import numpy as np
+
+from piquasso.api.config import Config
+from piquasso.api.connector import BaseConnector
+
+from piquasso._math.fock import cutoff_fock_space_dim, cutoff_fock_space_dim_array
+
+from .state import PureFockState
+
+
+class SectorPureFockState(PureFockState):
+    r"""A simulated pure Fock state, storing only its nonempty particle number sectors.
+
+    The cutoff Fock space is the direct sum of the :math:`n`-particle subspaces for
+    :math:`n < c`, where :math:`c` is the cutoff. Since passive linear gates act on
+    these subspaces separately, a state with a definite particle number remains in a
+    single subspace during a passive circuit, and the other subspaces need not be
+    stored.
+
+    The dense state vector is assembled from the stored subspaces on access, and the
+    state vector is split into subspaces when set, hence all the functionality of
+    :class:`PureFockState` is available.
+    """
+
+    def __init__(
+        self, *, d: int, connector: BaseConnector, config: Optional[Config] = None
+    ) -> None:
+        """
+        Args:
+            d (int): The number of modes.
+            connector (BaseConnector): Instance containing calculation functions.
+            config (Config): Instance containing constants for the simulation.
+        """
+
+        self._sectors: Dict[int, np.ndarray] = {}
+
+        super().__init__(d=d, connector=connector, config=config)
+
+    @property
+    def _sector_boundaries(self) -> np.ndarray:
+        return cutoff_fock_space_dim_array(
+            cutoff=np.arange(self._config.cutoff + 1), d=self.d
+        )
+
+    @property
+    def state_vector(self) -> np.ndarray:
+        boundaries = self._sector_boundaries
+
+        state_vector = np.zeros(
+            shape=(boundaries[-1],), dtype=self._config.complex_dtype
+        )
+
+        for particle_number, sector in self._sectors.items():
+            state_vector[
+                boundaries[particle_number] : boundaries[particle_number + 1]
+            ] = sector
+
+        return state_vector
+
+    @state_vector.setter
+    def state_vector(self, value: np.ndarray) -> None:
+        boundaries = self._sector_boundaries
+
+        self._sectors = {}
+
+        for particle_number in range(self._config.cutoff):
+            sector = value[
+                boundaries[particle_number] : boundaries[particle_number + 1]
+            ]
+
+            if np.any(sector):
+                self._sectors[particle_number] = np.array(
+                    sector, dtype=self._config.complex_dtype
+                )
+
+    def _get_spare_state_vector(self) -> Optional[np.ndarray]:
+        return None
+
+    def reset(self) -> None:
+        self._sectors = {0: np.ones(shape=(1,), dtype=self._config.complex_dtype)}
+
+    @property
+    def norm(self) -> float:
+        return float(
+            sum(np.sum(np.abs(sector) ** 2) for sector in self._sectors.values())
+        )
+
+    def copy(self) -> "SectorPureFockState":
+        state = self.__class__(
+            d=self.d, connector=self._connector, config=self._config.copy()
+        )
+
+        state._sectors = {
+            particle_number: np.copy(sector)
+            for particle_number, sector in self._sectors.items()
+        }
+
+        return state
+
+    def get_particle_number_sector(self, particle_number: int) -> np.ndarray:
+        """The components of the state vector in the subspace with `particle_number`
+        particles.
+
+        Args:
+            particle_number (int): The number of particles.
+
+        Returns:
+            numpy.ndarray: The components corresponding to the `particle_number`-th
+            subspace in the ordering of the Fock basis.
+        """
+
+        sector = self._sectors.get(particle_number)
+
+        if sector is not None:
+            return sector
+
+        return np.zeros(
+            shape=(
+                cutoff_fock_space_dim(cutoff=particle_number + 1, d=self.d)
+                - cutoff_fock_space_dim(cutoff=particle_number, d=self.d)
+            ),
+            dtype=self._config.complex_dtype,
+        )
@@ -14,11 +14,16 @@
 # limitations under the License.
 
 from .state import PureFockState
+from .batch_state import BatchPureFockState
+from .sector_state import SectorPureFockState
+from .trajectory_state import TrajectoryFockState
 
 from .calculations import (
     state_vector_instruction,
     passive_linear,
+    sector_passive_linear,
     beamsplitter5050,
+    phaseshifter,
     kerr,
     cross_kerr,
     cubic_phase,
@@ -36,9 +41,26 @@ from .calculations import (
     homodyne_measurement,
 )
 
+from .calculations.trajectory import (
+    trajectory_attenuator,
+    trajectory_particle_number_measurement,
+)
+
+from .calculations.batch import (
+    batch_passive_linear,
+    batch_phaseshifter,
+    batch_kerr,
+    batch_cross_kerr,
+    batch_cubic_phase,
+    batch_squeezing,
+    batch_displacement,
+)
+
 from ..calculations import attenuator
 
 from ...simulator import BuiltinSimulator
+from piquasso.api.simulator import BatchSimulator
+from piquasso.api.exceptions import InvalidState
 from piquasso.instructions import (
     preparations,
     gates,
@@ -54,7 +76,7 @@ from piquasso._simulators.connectors import (
 )
 
 
-class PureFockSimulator(BuiltinSimulator):
+class PureFockSimulator(BuiltinSimulator, BatchSimulator):
     """Performs photonic simulations using Fock representation with pure states.
 
     The simulation (when executed) results in an instance of
@@ -121,7 +143,7 @@ class PureFockSimulator(BuiltinSimulator):
         gates.Interferometer: passive_linear,
         gates.Beamsplitter: passive_linear,
         gates.Beamsplitter5050: beamsplitter5050,
-        gates.Phaseshifter: passive_linear,
+        gates.Phaseshifter: phaseshifter,
         gates.MachZehnder: passive_linear,
         gates.Fourier: passive_linear,
         gates.Kerr: kerr,
@@ -134,6 +156,8 @@ class PureFockSimulator(BuiltinSimulator):
         gates.MomentumDisplacement: displacement,
         gates.Squeezing2: linear,
         gates.GaussianTransform: linear,
+        gates.ControlledX: linear,
+        gates.ControlledZ: linear,
         measurements.ParticleNumberMeasurement: particle_number_measurement,
         measurements.PostSelectPhotons: post_select_photons,
         measurements.ImperfectPostSelectPhotons: imperfect_post_select_photons,
@@ -143,6 +167,211 @@ class PureFockSimulator(BuiltinSimulator):
         batch.BatchApply: batch_apply,
     }
 
+    _batch_instruction_map = {
+        gates.Interferometer: batch_passive_linear,
+        gates.Beamsplitter: batch_passive_linear,
+        gates.Phaseshifter: batch_phaseshifter,
+        gates.MachZehnder: batch_passive_linear,
+        gates.Kerr: batch_kerr,
+        gates.CrossKerr: batch_cross_kerr,
+        gates.CubicPhase: batch_cubic_phase,
+        gates.Squeezing: batch_squeezing,
+        gates.Displacement: batch_displacement,
+        gates.PositionDisplacement: batch_displacement,
+        gates.MomentumDisplacement: batch_displacement,
+    }
+
     _default_connector_class = NumpyConnector
 
     _extra_builtin_connectors = [TensorflowConnector, JaxConnector]
+
+    def _broadcast_state(
+        self, state: PureFockState, batch_size: int
+    ) -> BatchPureFockState:
+        if isinstance(state, BatchPureFockState):
+            if state._batch_size != batch_size:
+                raise InvalidState(
+                    f"The batch size of the initial state should be '{batch_size}': "
+                    f"state._batch_size={state._batch_size}"
+                )
+
+            return state
+
+        batch_state = BatchPureFockState(
+            d=state.d, connector=state._connector, config=state._config
+        )
+
+        batch_state._apply_separate_state_vectors([state.state_vector] * batch_size)
+
+        return batch_state
+
+
+class SectorPureFockSimulator(PureFockSimulator):
+    """Performs photonic simulations using Fock representation with pure states,
+    storing only the nonempty particle number subspaces.
+
+    The simulation (when executed) results in an instance of
+    :class:`~piquasso._simulators.fock.pure.sector_state.SectorPureFockState`.
+
+    Passive linear gates are applied on each nonempty particle number subspace
+    separately, while the other instructions are applied on the whole state vector,
+    as in :class:`PureFockSimulator`. Therefore, this simulator is beneficial for
+    mostly passive circuits with a definite number of particles, e.g., boson sampling.
+
+    Example usage::
+
+        import piquasso as pq
+
+        from scipy.stats import unitary_group
+
+
+        with pq.Program() as program:
+            pq.Q(all) | pq.StateVector([1, 1, 1, 0, 0, 0])
+
+            pq.Q(all) | pq.Interferometer(unitary_group.rvs(6))
+
+        simulator = pq.SectorPureFockSimulator(d=6, config=pq.Config(cutoff=4))
+        result = simulator.execute(program)
+
+    Supported preparations:
+        :class:`~piquasso.instructions.preparations.Vacuum`,
+        :class:`~piquasso.instructions.preparations.Create`,
+        :class:`~piquasso.instructions.preparations.Annihilate`,
+        :class:`~piquasso.instructions.preparations.StateVector`.
+
+    Supported gates:
+        The same as for :class:`PureFockSimulator`.
+
+    Supported measurements:
+        :class:`~piquasso.instructions.measurements.ParticleNumberMeasurement`.
+
+    Supported channels:
+        :class:`~piquasso.instructions.channels.Attenuator`.
+
+    Note:
+        Only :class:`~piquasso.NumpyConnector` is supported by this simulator.
+    """
+
+    _state_class = SectorPureFockState
+
+    _instruction_map = {
+        preparations.Vacuum: vacuum,
+        preparations.Create: create,
+        preparations.Annihilate: annihilate,
+        preparations.StateVector: state_vector_instruction,
+        gates.Interferometer: sector_passive_linear,
+        gates.Beamsplitter: sector_passive_linear,
+        gates.Beamsplitter5050: sector_passive_linear,
+        gates.Phaseshifter: sector_passive_linear,
+        gates.MachZehnder: sector_passive_linear,
+        gates.Fourier: sector_passive_linear,
+        gates.Kerr: kerr,
+        gates.CrossKerr: cross_kerr,
+        gates.CubicPhase: cubic_phase,
+        gates.Squeezing: squeezing,
+        gates.QuadraticPhase: linear,
+        gates.Displacement: displacement,
+        gates.PositionDisplacement: displacement,
+        gates.MomentumDisplacement: displacement,
+        gates.Squeezing2: linear,
+        gates.GaussianTransform: linear,
+        gates.ControlledX: linear,
+        gates.ControlledZ: linear,
+        measurements.ParticleNumberMeasurement: particle_number_measurement,
+        measurements.PostSelectPhotons: post_select_photons,
+        measurements.ImperfectPostSelectPhotons: imperfect_post_select_photons,
+        measurements.HomodyneMeasurement: homodyne_measurement,
+        channels.Attenuator: attenuator,
+    }
+
+    _batch_instruction_map = {}
+
+    _extra_builtin_connectors = []
+
+
+class TrajectoryFockSimulator(PureFockSimulator):
+    """Performs photonic simulations of lossy circuits using quantum trajectories.
+
+    The channels are unraveled into randomly chosen Kraus operators, hence the mixed
+    state is represented by an ensemble of pure states, the trajectories, instead of
+    a density matrix. The number of trajectories is given by the `shots` parameter of
+    :meth:`execute`, and the trajectories are simulated simultaneously.
+
+    The simulation (when executed) results in an instance of
+    :class:`~piquasso._simulators.fock.pure.trajectory_state.TrajectoryFockState`,
+    which estimates the quantities of the mixed state by averaging over the
+    trajectories, along with their standard errors.
+
+    Example usage::
+
+        import numpy as np
+        import piquasso as pq
+
+
+        with pq.Program() as program:
+            pq.Q(all) | pq.StateVector([2, 1, 0])
+
+            pq.Q(0, 1) | pq.Beamsplitter(theta=np.pi / 3)
+
+            pq.Q(0) | pq.Attenuator(theta=np.pi / 6)
+            pq.Q(1) | pq.Attenuator(theta=np.pi / 5)
+
+            pq.Q(1, 2) | pq.Beamsplitter(theta=np.pi / 4)
+
+        simulator = pq.TrajectoryFockSimulator(d=3, config=pq.Config(cutoff=4))
+        state = simulator.execute(program, shots=500).state
+
+        state.fock_probabilities, state.fock_probabilities_standard_error
+
+    Supported preparations:
+        :class:`~piquasso.instructions.preparations.Vacuum`,
+        :class:`~piquasso.instructions.preparations.Create`,
+        :class:`~piquasso.instructions.preparations.Annihilate`,
+        :class:`~piquasso.instructions.preparations.StateVector`.
+
+    Supported gates:
+        The same as for :class:`PureFockSimulator`.
+
+    Supported measurements:
+        :class:`~piquasso.instructions.measurements.ParticleNumberMeasurement`, where
+        every trajectory is sampled once.
+
+    Supported channels:
+        :class:`~piquasso.instructions.channels.Attenuator`.
+
+    Note:
+        Only :class:`~piquasso.NumpyConnector` is supported by this simulator.
+    """
+
+    _state_class = TrajectoryFockState
+
+    _instruction_map = {
+        preparations.Vacuum: vacuum,
+        preparations.Create: create,
+        preparations.Annihilate: annihilate,
+        preparations.StateVector: state_vector_instruction,
+        gates.Interferometer: passive_linear,
+        gates.Beamsplitter: passive_linear,
+        gates.Beamsplitter5050: beamsplitter5050,
+        gates.Phaseshifter: phaseshifter,
+        gates.MachZehnder: passive_linear,
+        gates.Fourier: passive_linear,
+        gates.Kerr: kerr,
+        gates.CrossKerr: cross_kerr,
+        gates.CubicPhase: cubic_phase,
+        gates.Squeezing: squeezing,
+        gates.QuadraticPhase: linear,
+        gates.Displacement: displacement,
+        gates.PositionDisplacement: displacement,
+        gates.MomentumDisplacement: displacement,
+        gates.Squeezing2: linear,
+        gates.GaussianTransform: linear,
+        gates.ControlledX: linear,
+        gates.ControlledZ: linear,
+        measurements.ParticleNumberMeasurement: trajectory_particle_number_measurement,
+        channels.Attenuator: trajectory_attenuator,
+    }
+
+    _batch_instruction_map = {}
+
+    _extra_builtin_connectors = []
@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional, Tuple, Dict
+from typing import Optional, Tuple, Dict, List
 
 import numpy as np
 
@@ -30,6 +30,7 @@ from piquasso._math.indices import (
 )
 
 from ..state import BaseFockState
+from ..calculations import calculate_reduced_index_list
 from ..general.state import FockState
 
 
@@ -62,6 +63,37 @@ class PureFockState(BaseFockState):
 
         self.state_vector = self._get_empty()
 
+        self._state_vector_buffers: List[np.ndarray] = []
+
+    def _get_spare_state_vector(self) -> Optional[np.ndarray]:
+        """
+        Returns a preallocated array different from the current state vector, into
+        which the next state vector could be written, or `None` if the connector does
+        not support in-place updates.
+
+        At most two such arrays are allocated, and the gates writing into them
+        alternate between the two.
+        """
+
+        if self._connector.np is not np:
+            return None
+
+        self._state_vector_buffers = [
+            buffer
+            for buffer in self._state_vector_buffers
+            if buffer.shape == self.state_vector.shape
+            and buffer.dtype == self.state_vector.dtype
+        ]
+
+        for buffer in self._state_vector_buffers:
+            if buffer is not self.state_vector:
+                return buffer
+
+        buffer = np.empty_like(self.state_vector)
+        self._state_vector_buffers.append(buffer)
+
+        return buffer
+
     def _get_empty_list(self) -> list:
         state_vector_size = cutoff_fock_space_dim(cutoff=self._config.cutoff, d=self.d)
         return [0.0] * state_vector_size
@@ -121,7 +153,49 @@ class PureFockState(BaseFockState):
         return FockState.from_fock_state(self)
 
     def reduced(self, modes: Tuple[int, ...]) -> FockState:
-        return self._as_mixed().reduced(modes)
+        r"""Reduces the state to a subsystem corresponding to the specified modes.
+
+        The partial trace is calculated directly from the state vector as
+
+        .. math::
+            \rho_{ij} = \sum_k \psi_{ik} \psi_{jk}^*,
+
+        where :math:`k` runs over the basis of the auxiliary modes, hence the density
+        matrix of the whole system is never created. As in :meth:`FockState.reduced`,
+        the elements are gathered separately for every particle number on the
+        auxiliary modes, hence no element beyond the cutoff is ever gathered.
+        """
+        np = self._connector.np
+
+        if modes == tuple(range(self.d)):
+            return self._as_mixed()
+
+        index_list = calculate_reduced_index_list(self.d, self._config.cutoff, modes)
+
+        reduced_dim = index_list[0].shape[0]
+
+        density_matrix = np.zeros(
+            shape=(reduced_dim, reduced_dim), dtype=self.state_vector.dtype
+        )
+
+        for index_matrix in index_list:
+            size = index_matrix.shape[0]
+
+            partial_state_vectors = self.state_vector[index_matrix]
+
+            block = partial_state_vectors @ np.conj(partial_state_vectors).T
+
+            density_matrix += np.pad(
+                block, ((0, reduced_dim - size), (0, reduced_dim - size))
+            )
+
+        reduced_state = FockState(
+            d=len(modes), connector=self._connector, config=self._config
+        )
+
+        reduced_state._density_matrix = density_matrix
+
+        return reduced_state
 
     def get_particle_detection_probability(
         self, occupation_number: np.ndarray
@@ -138,12 +212,11 @@ class PureFockState(BaseFockState):
             self.state_vector[index].conjugate() * self.state_vector[index]
         )
 
-    def get_particle_detection_probability_on_modes(
+    def _get_particle_detection_indices_on_modes(
         self,
         occupation_numbers: np.ndarray,
         modes: Tuple[int, ...],
-    ) -> float:
-        np = self._connector.np
+    ) -> np.ndarray:
         fallback_np = self._connector.fallback_np
 
         occupation_numbers = fallback_np.array(occupation_numbers)
@@ -169,7 +242,18 @@ class PureFockState(BaseFockState):
 
         ordered_occupation_numbers = unordered_occupation_numbers[:, sorter]
 
-        indices = get_index_in_fock_space_array(ordered_occupation_numbers)
+        return get_index_in_fock_space_array(ordered_occupation_numbers)
+
+    def get_particle_detection_probability_on_modes(
+        self,
+        occupation_numbers: np.ndarray,
+        modes: Tuple[int, ...],
+    ) -> float:
+        np = self._connector.np
+
+        indices = self._get_particle_detection_indices_on_modes(
+            occupation_numbers, modes
+        )
 
         return np.sum(np.abs(self.state_vector[indices]) ** 2)
 
@@ -216,11 +300,14 @@ class PureFockState(BaseFockState):
     def _get_mean_position_indices(self, mode):
         fallback_np = self._connector.fallback_np
 
-        self._space[:, mode] -= 1
-        lowered_indices = get_index_in_fock_space_array(self._space)
-        self._space[:, mode] += 2
-        raised_indices = get_index_in_fock_space_array(self._space)
-        self._space[:, mode] -= 1
+        # NOTE: `self._space` is shared between states and may be read-only, hence a
+        # copy is modified.
+        space = fallback_np.array(self._space)
+
+        space[:, mode] -= 1
+        lowered_indices = get_index_in_fock_space_array(space)
+        space[:, mode] += 2
+        raised_indices = get_index_in_fock_space_array(space)
 
         relevant_column = self._space[:, mode]
 
@@ -0,0 +1,232 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Tuple, Dict
+
+import numpy as np
+
+from piquasso.api.exceptions import InvalidState, PiquassoException
+from piquasso._math.indices import get_index_in_fock_space
+
+from ..general.state import FockState
+from ..calculations import calculate_reduced_index_list
+
+from .state import PureFockState
+
+
+class TrajectoryFockState(PureFockState):
+    r"""An ensemble of pure Fock states representing a mixed state.
+
+    The state is the average :math:`\rho = \frac{1}{T} \sum_{t=1}^T
+    \ket{\psi_t} \bra{\psi_t}` of :math:`T` quantum trajectories, which are
+    generated by unraveling the channels into randomly chosen Kraus operators. The
+    trajectories coincide until the first channel, hence they are stored as a single
+    state vector until then, and as the columns of :attr:`state_vector` afterwards.
+
+    The quantities of the mixed state are estimated by the averages over the
+    trajectories, and their standard errors are available as well, e.g.,
+    :attr:`fock_probabilities_standard_error`.
+    """
+
+    @property
+    def _trajectory_state_vectors(self) -> np.ndarray:
+        if len(self.state_vector.shape) == 1:
+            return self.state_vector[:, None]
+
+        return self.state_vector
+
+    @property
+    def _trajectory_fock_probabilities(self) -> np.ndarray:
+        return np.abs(self._trajectory_state_vectors) ** 2
+
+    @property
+    def number_of_trajectories(self) -> int:
+        """The number of the simulated trajectories."""
+        return self._trajectory_state_vectors.shape[1]
+
+    @property
+    def nonzero_elements(self):
+        return [
+            self._nonzero_elements_for_single_state_vector(state_vector)
+            for state_vector in self._trajectory_state_vectors.T
+        ]
+
+    def __str__(self) -> str:
+        return "\n".join(
+            self._get_repr_for_single_state_vector(partial_nonzero_elements)
+            for partial_nonzero_elements in self.nonzero_elements
+        )
+
+    @property
+    def density_matrix(self) -> np.ndarray:
+        state_vectors = self._trajectory_state_vectors
+
+        return state_vectors @ state_vectors.conj().T / state_vectors.shape[1]
+
+    def reduced(self, modes: Tuple[int, ...]) -> FockState:
+        if modes == tuple(range(self.d)):
+            return self._as_mixed()
+
+        index_list = calculate_reduced_index_list(self.d, self._config.cutoff, modes)
+
+        state_vectors = self._trajectory_state_vectors
+
+        reduced_dim = index_list[0].shape[0]
+
+        density_matrix = np.zeros(
+            shape=(reduced_dim, reduced_dim), dtype=state_vectors.dtype
+        )
+
+        for index_matrix in index_list:
+            size = index_matrix.shape[0]
+
+            partial_state_vectors = state_vectors[index_matrix]
+
+            block = np.einsum(
+                "ikt,jkt->ij", partial_state_vectors, np.conj(partial_state_vectors)
+            )
+
+            density_matrix[:size, :size] += block
+
+        reduced_state = FockState(
+            d=len(modes), connector=self._connector, config=self._config
+        )
+
+        reduced_state._density_matrix = density_matrix / state_vectors.shape[1]
+
+        return reduced_state
+
+    @property
+    def fock_probabilities(self) -> np.ndarray:
+        return np.mean(self._trajectory_fock_probabilities, axis=1)
+
+    @property
+    def fock_probabilities_standard_error(self) -> np.ndarray:
+        """The standard errors of :attr:`fock_probabilities`."""
+        return _standard_error(self._trajectory_fock_probabilities)
+
+    @property
+    def fock_probabilities_map(self) -> Dict[Tuple[int, ...], float]:
+        return {
+            tuple(basis): probability
+            for basis, probability in zip(self._space, self.fock_probabilities)
+        }
+
+    def get_particle_detection_probability(
+        self, occupation_number: np.ndarray
+    ) -> float:
+        if self._config.validate and len(occupation_number) != self.d:
+            raise PiquassoException(
+                f"The specified occupation number should have length '{self.d}': "
+                f"occupation_number='{occupation_number}'."
+            )
+
+        index = get_index_in_fock_space(occupation_number)
+
+        return np.mean(self._trajectory_fock_probabilities[index])
+
+    def get_particle_detection_probability_on_modes(
+        self,
+        occupation_numbers: np.ndarray,
+        modes: Tuple[int, ...],
+    ) -> float:
+        indices = self._get_particle_detection_indices_on_modes(
+            occupation_numbers, modes
+        )
+
+        return np.mean(np.sum(self._trajectory_fock_probabilities[indices], axis=0))
+
+    def normalize(self) -> None:
+        """Normalizes every trajectory to have norm 1.
+
+        Raises:
+            InvalidState: Raised if the norm of a trajectory is too close to 0.
+        """
+
+        norms = np.sum(self._trajectory_fock_probabilities, axis=0)
+
+        if self._config.validate and np.any(np.isclose(norms, 0)):
+            raise InvalidState("The norm of a trajectory is 0.")
+
+        if len(self.state_vector.shape) == 1:
+            self.state_vector = self.state_vector / np.sqrt(norms[0])
+        else:
+            self.state_vector = self.state_vector / np.sqrt(norms)
+
+    def _trajectory_mean_photon_numbers(self) -> np.ndarray:
+        numbers = np.sum(self._space, axis=1)
+
+        return numbers @ self._trajectory_fock_probabilities
+
+    def mean_photon_number(self):
+        r"""Returns the estimated mean photon number
+
+        .. math::
+            \operatorname{Tr}(\rho \hat{n}) \approx \frac{1}{T} \sum_{t=1}^T
+                \bra{\psi_t} \hat{n} \ket{\psi_t},
+
+        where :math:`\hat{n}` is the total photon number operator.
+        """
+
+        return np.mean(self._trajectory_mean_photon_numbers())
+
+    def mean_photon_number_standard_error(self) -> float:
+        """The standard error of :meth:`mean_photon_number`."""
+
+        return _standard_error(self._trajectory_mean_photon_numbers()[None, :])[0]
+
+    def variance_photon_number(self):
+        numbers = np.sum(self._space, axis=1)
+
+        probabilities = self.fock_probabilities
+
+        mean = numbers @ probabilities
+
+        return (numbers - mean) ** 2 @ probabilities
+
+    def mean_position(self, mode: int) -> np.ndarray:
+        multipliers, left_indices, right_indices = self._get_mean_position_indices(mode)
+
+        state_vectors = self._trajectory_state_vectors
+
+        accumulator = np.mean(
+            multipliers @ (state_vectors[left_indices] * state_vectors[right_indices])
+        )
+
+        return np.real(accumulator) * np.sqrt(self._config.hbar / 2)
+
+    def get_tensor_representation(self):
+        raise NotImplementedError(
+            "The tensor representation of a pure state is not defined for an "
+            "ensemble of trajectories."
+        )
+
+    def get_purity(self):
+        state_vectors = self._trajectory_state_vectors
+
+        overlaps = state_vectors.conj().T @ state_vectors
+
+        return np.sum(np.abs(overlaps) ** 2) / state_vectors.shape[1] ** 2
+
+
+def _standard_error(samples: np.ndarray) -> np.ndarray:
+    """Calculates the standard error of the mean of `samples` along the last axis."""
+
+    size = samples.shape[-1]
+
+    if size < 2:
+        return np.zeros(samples.shape[:-1])
+
+    return np.std(samples, axis=-1, ddof=1) / np.sqrt(size)
@@ -0,0 +1,133 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List, Tuple
+
+from scipy.special import comb
+
+from piquasso.api.config import Config
+from piquasso.api.connector import BaseConnector
+from piquasso.api.instruction import Instruction
+
+from piquasso.instructions import gates
+
+from piquasso._math.indices import get_operator_index
+
+
+_GATE_OVERHEAD = 20000
+"""
+The overhead of applying a gate (e.g., calculating the matrices of the gate on the
+particle number subspaces) in terms of multiplications, estimated from measurements.
+"""
+
+
+def fuse_passive_linear_gates(
+    instructions: List[Instruction], d: int, connector: BaseConnector, config: Config
+) -> List[Instruction]:
+    """Fuses consecutive passive linear gates into a single interferometer.
+
+    A gate is fused with the preceding ones if the fused gate is estimated to be
+    cheaper to apply on the Fock space than the preceding fused gate and the current
+    one separately, see :func:`_get_passive_linear_cost`.
+
+    Args:
+        instructions (List[Instruction]):
+            The instructions with their modes already specified.
+        d (int): The number of modes.
+        connector (BaseConnector): The connector used for calculating the matrices.
+        config (Config): The config of the simulation.
+
+    Returns:
+        List[Instruction]: The instructions with the passive linear gates fused.
+    """
+
+    fused_instructions: List[Instruction] = []
+
+    run: List[gates._PassiveLinearGate] = []
+    run_modes: Tuple[int, ...] = ()
+
+    for instruction in instructions:
+        if not isinstance(instruction, gates._PassiveLinearGate):
+            fused_instructions.extend(_fuse(run, run_modes, connector, config))
+            fused_instructions.append(instruction)
+            run, run_modes = [], ()
+            continue
+
+        modes = run_modes + tuple(
+            mode for mode in instruction.modes if mode not in run_modes
+        )
+
+        fused_cost = _get_passive_linear_cost(len(modes), d, config.cutoff)
+        separate_cost = _get_passive_linear_cost(
+            len(run_modes), d, config.cutoff
+        ) + _get_passive_linear_cost(len(instruction.modes), d, config.cutoff)
+
+        if run and fused_cost <= separate_cost:
+            run.append(instruction)
+            run_modes = modes
+        else:
+            fused_instructions.extend(_fuse(run, run_modes, connector, config))
+            run, run_modes = [instruction], tuple(instruction.modes)
+
+    fused_instructions.extend(_fuse(run, run_modes, connector, config))
+
+    return fused_instructions
+
+
+def _get_passive_linear_cost(k: int, d: int, cutoff: int) -> int:
+    """
+    Estimates the cost of applying a passive linear gate on `k` out of `d` modes to a
+    state vector, i.e., the number of multiplications with the matrices of the
+    particle number subspaces of the `k` modes, along with a constant overhead.
+    """
+
+    return _GATE_OVERHEAD + sum(
+        comb(n + k - 1, n, exact=True) ** 2
+        * comb(cutoff - 1 - n + d - k, d - k, exact=True)
+        for n in range(cutoff)
+    )
+
+
+def _fuse(
+    run: List[gates._PassiveLinearGate],
+    modes: Tuple[int, ...],
+    connector: BaseConnector,
+    config: Config,
+) -> List[Instruction]:
+    if len(run) < 2:
+        return list(run)
+
+    np = connector.np
+
+    matrix = np.identity(len(modes), dtype=config.complex_dtype)
+
+    for instruction in run:
+        passive_block = instruction._get_passive_block(connector, config).astype(
+            config.complex_dtype
+        )
+
+        indices = tuple(modes.index(mode) for mode in instruction.modes)
+
+        matrix = (
+            connector.embed_in_identity(
+                passive_block, get_operator_index(indices), len(modes)
+            )
+            @ matrix
+        )
+
+    interferometer = gates.Interferometer(matrix)
+    interferometer.modes = modes
+
+    return [interferometer]
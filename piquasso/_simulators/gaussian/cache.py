@@ -0,0 +1,336 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import hashlib
+
+from collections import OrderedDict
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from piquasso._math.indices import double_modes
+from piquasso._math.linalg import extend_inverse_and_determinant
+
+from .probabilities import calculate_click_probabilities_from_sigma_inverse
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache, similarly to :func:`functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+    memory_limit: int
+    memory_usage: int
+
+
+class _Node:
+    """
+    A node of the sample prefix trie.
+
+    The node corresponding to the prefix `sample` stores the probability of the
+    occupation numbers `sample + [0]` on the next subspace, and `children[choice]`
+    corresponds to the prefix `sample + [choice]`.
+    """
+
+    __slots__ = ("probability", "children")
+
+    def __init__(self) -> None:
+        self.probability: Optional[float] = None
+        self.children: List[Optional["_Node"]] = [None, None]
+
+
+_NODE_SIZE = sys.getsizeof(_Node()) + sys.getsizeof([None, None])
+
+_EMPTY_REDUCED_STATE = (np.empty(shape=(0, 0)), 1.0, None)
+
+
+class _Entry:
+    """The cached data corresponding to a single state and measured modes."""
+
+    __slots__ = ("root", "reduced_states")
+
+    def __init__(self, size: int) -> None:
+        self.root = _Node()
+        self.reduced_states: List[Optional[Tuple[np.ndarray, float, Any]]] = [
+            None
+        ] * size
+
+
+class ClickProbabilityCache:
+    """
+    Cache for the click probabilities of threshold measurement using torontonians.
+
+    The probabilities are stored in a trie per state and measured modes, keyed by the
+    prefix of the sample generated so far. Alongside the trie, the inverses and
+    determinants needed for the click probabilities are cached for every subspace of
+    the measured modes.
+
+    The number of cached probabilities is bounded by `maxsize` (unbounded if `None`),
+    and the memory usage of the cache is bounded by `memory_limit` bytes. When either
+    limit is reached, the least recently used entries are evicted, and the trie of the
+    current entry is not extended any further, i.e., the probabilities corresponding
+    to short prefixes (which are the most frequently visited ones) are kept.
+
+    Copies of a state share this cache, since the entries are identified by the
+    contents of the state.
+    """
+
+    def __init__(self, maxsize: Optional[int], memory_limit: int) -> None:
+        self.maxsize = maxsize
+        self.memory_limit = memory_limit
+        self.currsize = 0
+        self.memory_usage = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[Tuple, _Entry]" = OrderedDict()
+        self._entry_sizes: "OrderedDict[Tuple, Tuple[int, int]]" = OrderedDict()
+
+    def __deepcopy__(self, memo: Any) -> "ClickProbabilityCache":
+        return self
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=self.currsize,
+            memory_limit=self.memory_limit,
+            memory_usage=self.memory_usage,
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._entry_sizes.clear()
+        self.currsize = 0
+        self.memory_usage = 0
+
+    def generate_samples(
+        self,
+        xpxp_covariance_matrix: np.ndarray,
+        xpxp_mean_vector: Optional[np.ndarray],
+        modes: Tuple[int, ...],
+        rngs: Iterable[np.random.Generator],
+    ) -> List[Tuple[int, ...]]:
+        """
+        Generates a sample for every random number generator in `rngs`.
+
+        The samples are generated mode by mode simultaneously, so that the
+        probabilities missing from the cache could be calculated in a single batch
+        for every mode.
+        """
+
+        key = _get_key(xpxp_covariance_matrix, xpxp_mean_vector, modes)
+
+        d = len(modes)
+
+        guesses = np.array([rng.uniform(size=d) for rng in rngs]).reshape(-1, d)
+        shots = len(guesses)
+
+        entry = self._get_entry(key, d)
+
+        if entry is not None:
+            nodes = [entry.root] * shots
+        else:
+            entry = _Entry(d)
+            nodes = [_Node() for _ in range(shots)]
+
+        samples = np.zeros(shape=(shots, d), dtype=int)
+        reduced_state = _EMPTY_REDUCED_STATE
+        previous_probabilities = np.ones(shots, dtype=float)
+
+        for mode_index in range(d):
+            missing_nodes = {}
+
+            for shot, node in enumerate(nodes):
+                if node.probability is None:
+                    missing_nodes.setdefault(id(node), (shot, node))
+
+            self.misses += len(missing_nodes)
+            self.hits += shots - len(missing_nodes)
+
+            reduced_state = self._get_reduced_state(
+                key,
+                entry,
+                mode_index,
+                xpxp_covariance_matrix,
+                xpxp_mean_vector,
+                modes,
+                reduced_state,
+            )
+
+            if missing_nodes:
+                shot_indices = [shot for shot, _ in missing_nodes.values()]
+
+                sigma_inv, sigma_determinant, reduced_mean_vector = reduced_state
+
+                probabilities = calculate_click_probabilities_from_sigma_inverse(
+                    sigma_inv,
+                    sigma_determinant,
+                    samples[shot_indices, : mode_index + 1],
+                    reduced_mean_vector,
+                )
+
+                for (_, node), probability in zip(
+                    missing_nodes.values(), probabilities
+                ):
+                    node.probability = float(probability)
+
+            for shot, node in enumerate(nodes):
+                conditional_probability = (
+                    node.probability / previous_probabilities[shot]
+                )
+
+                choice: int
+
+                if guesses[shot, mode_index] < conditional_probability:
+                    choice = 0
+                    previous_probabilities[shot] *= conditional_probability
+                else:
+                    choice = 1
+                    previous_probabilities[shot] *= 1 - conditional_probability
+
+                samples[shot, mode_index] = choice
+
+                if mode_index == d - 1:
+                    continue
+
+                child = node.children[choice]
+
+                if child is None:
+                    child = _Node()
+
+                    if self._allocate(key, _NODE_SIZE, count=1):
+                        node.children[choice] = child
+
+                nodes[shot] = child
+
+        return list(map(tuple, samples.tolist()))
+
+    def _get_entry(self, key: Tuple, size: int) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self._entry_sizes.move_to_end(key)
+            return entry
+
+        entry = _Entry(size)
+
+        self._entries[key] = entry
+        self._entry_sizes[key] = (0, 0)
+
+        if not self._allocate(key, _NODE_SIZE, count=1):
+            del self._entries[key]
+            del self._entry_sizes[key]
+
+            return None
+
+        return entry
+
+    def _get_reduced_state(
+        self,
+        key,
+        entry,
+        mode_index,
+        xpxp_covariance_matrix,
+        xpxp_mean_vector,
+        modes,
+        previous_reduced_state,
+    ):
+        r"""
+        Returns the inverse and the determinant of :math:`\Sigma` (see
+        :func:`calculate_click_probability`) and the mean vector, reduced to
+        `modes[: mode_index + 1]`.
+
+        The inverse and the determinant are calculated from the ones corresponding
+        to `modes[:mode_index]`, since only a single mode is added.
+        """
+
+        reduced_state = entry.reduced_states[mode_index]
+
+        if reduced_state is not None:
+            return reduced_state
+
+        indices = double_modes(np.array(modes[: mode_index + 1]))
+
+        sigma = (
+            xpxp_covariance_matrix[np.ix_(indices, indices)] + np.identity(len(indices))
+        ) / 2
+
+        sigma_inv, sigma_determinant = extend_inverse_and_determinant(
+            previous_reduced_state[0], previous_reduced_state[1], sigma
+        )
+
+        reduced_state = (
+            sigma_inv,
+            sigma_determinant,
+            xpxp_mean_vector[indices] if xpxp_mean_vector is not None else None,
+        )
+
+        size = sum(array.nbytes for array in reduced_state[::2] if array is not None)
+
+        if self._allocate(key, size):
+            entry.reduced_states[mode_index] = reduced_state
+
+        return reduced_state
+
+    def _allocate(self, key: Tuple, size: int, count: int = 0) -> bool:
+        """
+        Reserves `size` bytes and `count` probabilities for the entry corresponding to
+        `key` by evicting the least recently used other entries if needed. Returns
+        `False` if the memory could not be reserved.
+        """
+
+        if key not in self._entry_sizes:
+            return False
+
+        while self.memory_usage + size > self.memory_limit or (
+            self.maxsize is not None and self.currsize + count > self.maxsize
+        ):
+            oldest_key = next(iter(self._entries))
+
+            if oldest_key == key:
+                return False
+
+            del self._entries[oldest_key]
+            oldest_count, oldest_size = self._entry_sizes.pop(oldest_key)
+            self.currsize -= oldest_count
+            self.memory_usage -= oldest_size
+
+        entry_count, entry_size = self._entry_sizes[key]
+
+        self.currsize += count
+        self.memory_usage += size
+        self._entry_sizes[key] = (entry_count + count, entry_size + size)
+
+        return True
+
+
+def _get_key(xpxp_covariance_matrix, xpxp_mean_vector, modes):
+    digest = hashlib.blake2b(np.ascontiguousarray(xpxp_covariance_matrix).tobytes())
+
+    if xpxp_mean_vector is not None:
+        digest.update(np.ascontiguousarray(xpxp_mean_vector).tobytes())
+
+    return (
+        digest.hexdigest(),
+        xpxp_covariance_matrix.shape,
+        xpxp_mean_vector is None,
+        tuple(modes),
+    )
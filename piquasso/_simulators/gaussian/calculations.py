@@ -13,21 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Tuple, List
+from typing import Tuple
 
 import scipy
 import numpy as np
-
-from itertools import repeat
-from functools import lru_cache
-
-from scipy.special import factorial
+import numba as nb
 
 from .state import GaussianState
-from .probabilities import (
-    calculate_click_probability_nondisplaced,
-    calculate_click_probability,
-)
+from .cache import ClickProbabilityCache, CacheInfo
+from ..parallel import distribute_shots
 
 from piquasso.instructions import gates
 
@@ -35,7 +29,11 @@ from piquasso.api.result import Result
 from piquasso.api.instruction import Instruction
 from piquasso.api.exceptions import InvalidInstruction
 
-from piquasso._math.indices import get_operator_index, get_auxiliary_operator_index
+from piquasso._math.hafnian import loop_hafnian_with_reduction_batch
+from piquasso._math.indices import (
+    get_operator_index,
+    get_auxiliary_operator_index,
+)
 from piquasso._math.decompositions import (
     williamson,
     decompose_adjacency_matrix_into_circuit,
@@ -389,54 +387,105 @@ def _get_particle_number_measurement_samples(
     sqrt_cov_1 = S @ np.sqrt(mixed_diag)
     sqrt_cov_2 = np.linalg.cholesky(T + np.identity(2 * d))
 
-    samples = np.empty(shape=(shots, d), dtype=int)
-
-    for idx in range(shots):
-        sample = _generate_sample(
-            B,
-            sqrt_cov_1,
-            sqrt_cov_2,
-            mean=normalized_mean,
-            connector=reduced_state._connector,
-            config=config,
+    B = np.ascontiguousarray(B, dtype=np.complex128)
+    args = (B, sqrt_cov_1, sqrt_cov_2, normalized_mean, config.measurement_cutoff)
+    seed_sequences = config.spawn(shots)
+
+    if config.workers > 1:
+        return np.concatenate(
+            distribute_shots(
+                _generate_particle_number_samples_from_seed_sequences,
+                args=args,
+                seed_sequences=seed_sequences,
+                workers=config.workers,
+            )
         )
 
-        samples[idx] = sample
-
-    return samples
+    return _generate_particle_number_samples_from_seed_sequences(*args, seed_sequences)
 
 
-def _generate_sample(B, sqrt_cov_1, sqrt_cov_2, mean, connector, config):
+def _generate_particle_number_samples_from_seed_sequences(
+    B, sqrt_cov_1, sqrt_cov_2, mean, cutoff, seed_sequences
+):
+    """
+    Generates a particle number sample for every seed sequence, where the random
+    numbers of each shot are drawn from its own generator, so that the samples do not
+    depend on how the shots are distributed among the workers.
+    """
     d = len(B)
-    cutoff = config.measurement_cutoff
-    rng = config.rng
+    shots = len(seed_sequences)
 
-    possible_choices = np.arange(cutoff)
+    pure_noise = np.empty(shape=(shots, 2 * d))
+    evolved_noise = np.empty(shape=(shots, 2 * d))
+    uniforms = np.empty(shape=(shots, d))
 
-    sample = np.zeros(d, dtype=int)
+    for shot, seed_sequence in enumerate(seed_sequences):
+        rng = np.random.default_rng(seed_sequence)
 
-    pure_mean = mean + sqrt_cov_1 @ rng.normal(size=2 * d)
-    pure_mean_complex = (pure_mean[:d] + 1j * pure_mean[d:]) / 2
+        pure_noise[shot] = rng.normal(size=2 * d)
+        evolved_noise[shot] = rng.normal(size=2 * d)
+        uniforms[shot] = rng.uniform(size=d)
 
-    evolved_mean = pure_mean + sqrt_cov_2 @ rng.normal(size=2 * d)
-    evolved_mean_complex = (evolved_mean[:d] + 1j * evolved_mean[d:]) / 2
-    gamma = pure_mean_complex.conj() + B @ (evolved_mean_complex - pure_mean_complex)
+    pure_means = mean + pure_noise @ sqrt_cov_1.T
+    pure_means_complex = (pure_means[:, :d] + 1j * pure_means[:, d:]) / 2
 
-    for mode in range(d):
-        gamma -= evolved_mean_complex[mode] * B[:, mode]
-        mode_p_1 = mode + 1
-        matrix = B[:mode_p_1, :mode_p_1]
-        diagonal = gamma[:mode_p_1]
-        partial_sample = sample[:mode_p_1]
-        lhaf_values = connector.loop_hafnian_batch(
-            matrix, diagonal, partial_sample, cutoff
-        )
-        weights = np.abs(lhaf_values) ** 2 / factorial(possible_choices)
-        weights /= np.sum(weights)
+    evolved_means = pure_means + evolved_noise @ sqrt_cov_2.T
+    evolved_means_complex = (evolved_means[:, :d] + 1j * evolved_means[:, d:]) / 2
 
-        sample[mode] = rng.choice(possible_choices, p=weights)
+    gammas = (
+        pure_means_complex.conj() + (evolved_means_complex - pure_means_complex) @ B.T
+    )
+
+    return _generate_particle_number_samples(
+        B,
+        np.ascontiguousarray(gammas, dtype=np.complex128),
+        np.ascontiguousarray(evolved_means_complex, dtype=np.complex128),
+        uniforms,
+        cutoff,
+    )
 
-    return sample
+
+@nb.njit(cache=True)
+def _generate_particle_number_samples(
+    B, gammas, evolved_means_complex, uniforms, cutoff
+):
+    """
+    Generates the particle number samples mode by mode for all the shots, where the
+    Gaussian noise is already factored into `gammas` and `evolved_means_complex`, and
+    the choices are made using the pre-generated `uniforms`.
+    """
+    shots, d = uniforms.shape
+
+    samples = np.zeros(shape=(shots, d), dtype=np.int64)
+
+    factorials = np.ones(cutoff, dtype=np.float64)
+    for n in range(1, cutoff):
+        factorials[n] = factorials[n - 1] * n
+
+    for shot in range(shots):
+        gamma = gammas[shot].copy()
+
+        for mode in range(d):
+            gamma -= evolved_means_complex[shot, mode] * B[:, mode]
+            mode_p_1 = mode + 1
+
+            lhaf_values = loop_hafnian_with_reduction_batch(
+                B[:mode_p_1, :mode_p_1],
+                gamma[:mode_p_1].copy(),
+                samples[shot, :mode_p_1].copy(),
+                cutoff,
+            )
+            cumulative_weights = np.cumsum(np.abs(lhaf_values) ** 2 / factorials)
+
+            choice = np.searchsorted(
+                cumulative_weights,
+                uniforms[shot, mode] * cumulative_weights[-1],
+                side="right",
+            )
+
+            samples[shot, mode] = min(choice, cutoff - 1)
+
+    return samples
 
 
 def threshold_measurement(
@@ -452,72 +501,101 @@ def threshold_measurement(
     click is equal to one minus the probability of no click.
     """
     if state._config.use_torontonian:
-        samples = _generate_threshold_samples_using_torontonian(
+        samples, cache_info = _generate_threshold_samples_using_torontonian(
             state, instruction, shots
         )
-    else:
-        samples = _generate_threshold_samples_using_hafnian(state, instruction, shots)
+
+        return Result(state=state, samples=samples, cache_info=cache_info)
+
+    samples = _generate_threshold_samples_using_hafnian(state, instruction, shots)
 
     return Result(state=state, samples=samples)
 
 
 def _generate_threshold_samples_using_torontonian(state, instruction, shots):
-    is_displaced = state._is_displaced()
-    rng = state._config.rng
-    hbar = state._config.hbar
+    config = state._config
+    hbar = config.hbar
 
     modes = instruction.modes
 
-    @lru_cache(state._config.cache_size)
-    def get_probability(
-        subspace_modes: Tuple[int, ...], occupation_numbers: Tuple[int, ...]
-    ) -> float:
-        reduced_state = state.reduced(subspace_modes)
+    xpxp_covariance_matrix = state.xpxp_covariance_matrix / hbar
+    xpxp_mean_vector = (
+        state.xpxp_mean_vector / np.sqrt(hbar) if state._is_displaced() else None
+    )
 
-        if not is_displaced:
-            return calculate_click_probability_nondisplaced(
-                reduced_state.xpxp_covariance_matrix / hbar,
-                occupation_numbers,
-            )
+    seed_sequences = config.spawn(shots)
+
+    if config.workers > 1:
+        results = distribute_shots(
+            _generate_threshold_samples_from_seed_sequences,
+            args=(
+                xpxp_covariance_matrix,
+                xpxp_mean_vector,
+                modes,
+                config.cache_size,
+                config.cache_memory_limit,
+            ),
+            seed_sequences=seed_sequences,
+            workers=config.workers,
+        )
+
+        samples = sum((samples for samples, _ in results), [])
 
-        return calculate_click_probability(
-            reduced_state.xpxp_covariance_matrix / hbar,
-            reduced_state.xpxp_mean_vector / np.sqrt(hbar),
-            occupation_numbers,
+        cache_info = CacheInfo(
+            hits=sum(info.hits for _, info in results),
+            misses=sum(info.misses for _, info in results),
+            maxsize=config.cache_size,
+            currsize=max(info.currsize for _, info in results),
+            memory_limit=config.cache_memory_limit,
+            memory_usage=max(info.memory_usage for _, info in results),
         )
 
-    samples = []
+        return samples, cache_info
 
-    for _ in repeat(None, shots):
-        sample: List[int] = []
+    cache = state._click_probability_cache
 
-        previous_probability = 1.0
+    if (cache.maxsize, cache.memory_limit) != (
+        config.cache_size,
+        config.cache_memory_limit,
+    ):
+        cache.clear()
+        cache.maxsize = config.cache_size
+        cache.memory_limit = config.cache_memory_limit
 
-        for mode_index in range(1, len(modes) + 1):
-            subspace_modes = tuple(modes[:mode_index])
+    hits, misses = cache.hits, cache.misses
 
-            occupation_numbers = tuple(sample + [0])
+    samples = cache.generate_samples(
+        xpxp_covariance_matrix,
+        xpxp_mean_vector,
+        modes,
+        map(np.random.default_rng, seed_sequences),
+    )
 
-            probability = get_probability(
-                subspace_modes=subspace_modes, occupation_numbers=occupation_numbers
-            )
-            conditional_probability = probability / previous_probability
+    cache_info = cache.cache_info()._replace(
+        hits=cache.hits - hits, misses=cache.misses - misses
+    )
 
-            choice: int
-            guess = rng.uniform()
+    return samples, cache_info
 
-            if guess < conditional_probability:
-                choice = 0
-                previous_probability *= conditional_probability
-            else:
-                choice = 1
-                previous_probability *= 1 - conditional_probability
 
-            sample.append(choice)
+def _generate_threshold_samples_from_seed_sequences(
+    xpxp_covariance_matrix,
+    xpxp_mean_vector,
+    modes,
+    cache_size,
+    cache_memory_limit,
+    seed_sequences,
+):
+    cache = ClickProbabilityCache(cache_size, cache_memory_limit)
 
-        samples.append(tuple(sample))
+    samples = cache.generate_samples(
+        xpxp_covariance_matrix,
+        xpxp_mean_vector,
+        modes,
+        map(np.random.default_rng, seed_sequences),
+    )
 
-    return samples
+    return samples, cache.cache_info()
 
 
 def _generate_threshold_samples_using_hafnian(state, instruction, shots):
@@ -15,19 +15,32 @@
 
 import abc
 
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
+import numba as nb
 
 from scipy.special import factorial
 
+from piquasso._math.fock import get_fock_space_basis
+from piquasso._math.indices import (
+    get_index_in_fock_space,
+    get_index_in_fock_space_array,
+)
 from piquasso._math.linalg import block_reduce_xpxp
-from piquasso._math.torontonian import torontonian, loop_torontonian
+from piquasso._math.torontonian import (
+    torontonian,
+    loop_torontonian,
+    torontonian_batch,
+    loop_torontonian_batch,
+)
 from piquasso.api.connector import BaseConnector
 
 
 class DensityMatrixCalculation(abc.ABC):
     _normalization: float
+    _A: np.ndarray
+    _gamma: Optional[np.ndarray] = None
 
     def __init__(self, connector: BaseConnector):
         self.connector = connector
@@ -59,6 +72,18 @@ class DensityMatrixCalculation(abc.ABC):
     def get_particle_number_detection_probabilities(
         self, occupation_numbers: np.ndarray
     ) -> np.ndarray:
+        if self.connector.allow_conditionals and self._is_pure():
+            return self._get_pure_particle_number_detection_probabilities(
+                occupation_numbers
+            )
+
+        # NOTE: For mixed states, the diagonal density matrix element corresponding to
+        # `n` is the (loop) hafnian of `_A` reduced on the concatenation of `n` with
+        # itself, i.e., increasing the occupation number on a mode repeats two rows of
+        # `_A` at once. The batched kernels only enumerate the repetitions of a single
+        # row, hence they cannot be used here, and the elements are calculated
+        # one by one. To calculate every element in a single pass for mixed states, see
+        # `Config.use_bargmann_recurrence`.
         ret_list = []
 
         for occupation_number in occupation_numbers:
@@ -76,6 +101,74 @@ class DensityMatrixCalculation(abc.ABC):
 
         return ret
 
+    def _is_pure(self) -> bool:
+        d = len(self._A) // 2
+
+        return np.allclose(self._A[:d, d:], 0.0)
+
+    def _get_pure_particle_number_detection_probabilities(
+        self, occupation_numbers: np.ndarray
+    ) -> np.ndarray:
+        r"""
+        For pure states, `_A` is block diagonal, hence the diagonal density matrix
+        elements factorize as
+
+        .. math::
+            \rho_{n, n} \propto |\operatorname{lhaf}(B_{(n)})|^2,
+
+        where :math:`B` is the upper left block of `_A`. Therefore, the loop hafnians
+        corresponding to every occupation number on the last mode are calculated in a
+        single batch for every occupation number on the other modes.
+        """
+
+        d = len(self._A) // 2
+
+        B = np.ascontiguousarray(self._A[:d, :d], dtype=np.complex128)
+        gamma = (
+            np.zeros(d, dtype=np.complex128)
+            if self._gamma is None
+            else np.ascontiguousarray(self._gamma[:d], dtype=np.complex128)
+        )
+
+        occupation_numbers = np.asarray(occupation_numbers, dtype=np.int64)
+
+        cutoff = np.max(np.sum(occupation_numbers, axis=1)) + 1
+
+        indices = {
+            tuple(occupation_number): index
+            for index, occupation_number in enumerate(occupation_numbers.tolist())
+        }
+
+        ret = np.zeros(len(occupation_numbers), dtype=float)
+
+        for occupation_number in occupation_numbers[occupation_numbers[:, -1] == 0]:
+            batch_cutoff = cutoff - np.sum(occupation_number)
+
+            loop_hafnians = self.connector.loop_hafnian_batch(
+                B, gamma.copy(), occupation_number.copy(), batch_cutoff
+            )
+
+            weights = (
+                self._normalization
+                * np.abs(loop_hafnians) ** 2
+                / np.prod(factorial(occupation_number))
+                / factorial(np.arange(batch_cutoff))
+            )
+
+            key = list(occupation_number)
+
+            for last_occupation_number in range(batch_cutoff):
+                key[-1] = last_occupation_number
+
+                index = indices.get(tuple(key))
+
+                if index is not None:
+                    ret[index] = np.real(weights[last_occupation_number])
+
+        ret[abs(ret) < 1e-10] = 0.0
+
+        return ret
+
 
 class NondisplacedDensityMatrixCalculation(DensityMatrixCalculation):
     def __init__(
@@ -146,6 +239,115 @@ class DisplacedDensityMatrixCalculation(DensityMatrixCalculation):
         return self.connector.loop_hafnian(self._A, self._gamma, reduce_on)
 
 
+class RecursiveDensityMatrixCalculation(DisplacedDensityMatrixCalculation):
+    r"""
+    Calculates the density matrix using the recurrence relation of the loop hafnians
+
+    .. math::
+        G_{k + e_i} = \frac{1}{\sqrt{k_i + 1}} \left (
+            \gamma_i G_k + \sum_j \sqrt{k_j} A_{ij} G_{k - e_j}
+        \right ),
+
+    where :math:`G_k = \mathcal{N} \operatorname{lhaf}(A_{(k)}) / \sqrt{k!}` is a
+    density matrix element, and :math:`k` is the concatenation of the occupation
+    numbers of the ket and the bra. This way, every density matrix element is
+    calculated in :math:`O(d)` time from the previously calculated ones.
+    """
+
+    def get_density_matrix(self, occupation_numbers: np.ndarray) -> np.ndarray:
+        occupation_numbers = np.asarray(occupation_numbers)
+        d = occupation_numbers.shape[1]
+        cutoff = np.max(np.sum(occupation_numbers, axis=1)) + 1
+
+        density_matrix = _calculate_density_matrix_recursively(
+            np.ascontiguousarray(self._A, dtype=np.complex128),
+            np.ascontiguousarray(self._gamma, dtype=np.complex128),
+            complex(self._normalization),
+            get_fock_space_basis(d=d, cutoff=cutoff),
+        )
+
+        indices = get_index_in_fock_space_array(occupation_numbers)
+
+        return density_matrix[np.ix_(indices, indices)]
+
+    def get_particle_number_detection_probabilities(
+        self, occupation_numbers: np.ndarray
+    ) -> np.ndarray:
+        ret = np.real(np.diag(self.get_density_matrix(occupation_numbers))).copy()
+
+        ret[abs(ret) < 1e-10] = 0.0
+
+        return ret
+
+
+@nb.njit(cache=True)
+def _calculate_density_matrix_recursively(A, gamma, normalization, basis):
+    dim, d = basis.shape
+
+    lowered_indices = np.full(shape=(dim, d), fill_value=-1, dtype=np.int64)
+
+    for index in range(dim):
+        for mode in range(d):
+            if basis[index, mode] > 0:
+                lowered = basis[index].copy()
+                lowered[mode] -= 1
+                lowered_indices[index, mode] = get_index_in_fock_space(lowered)
+
+    sqrt_values = np.sqrt(np.arange(np.max(basis) + 1))
+
+    density_matrix = np.empty(shape=(dim, dim), dtype=np.complex128)
+
+    for row in range(dim):
+        for col in range(dim):
+            if row == 0 and col == 0:
+                density_matrix[row, col] = normalization
+                continue
+
+            # NOTE: The row corresponds to the bra, i.e., to the second half of the
+            # indices of `A`, and the column corresponds to the ket.
+            if row != 0:
+                mode = 0
+                while basis[row, mode] == 0:
+                    mode += 1
+
+                pivot = d + mode
+                previous_row = lowered_indices[row, mode]
+                previous_col = col
+                pivot_occupation = basis[previous_row, mode]
+            else:
+                mode = 0
+                while basis[col, mode] == 0:
+                    mode += 1
+
+                pivot = mode
+                previous_row = row
+                previous_col = lowered_indices[col, mode]
+                pivot_occupation = basis[previous_col, mode]
+
+            value = gamma[pivot] * density_matrix[previous_row, previous_col]
+
+            for j in range(d):
+                occupation = basis[previous_row, j]
+                if occupation > 0:
+                    value += (
+                        sqrt_values[occupation]
+                        * A[pivot, d + j]
+                        * density_matrix[lowered_indices[previous_row, j], previous_col]
+                    )
+
+                occupation = basis[previous_col, j]
+                if occupation > 0:
+                    value += (
+                        sqrt_values[occupation]
+                        * A[pivot, j]
+                        * density_matrix[previous_row, lowered_indices[previous_col, j]]
+                    )
+
+            density_matrix[row, col] = value / sqrt_values[pivot_occupation + 1]
+
+    return density_matrix
+
+
 def calculate_click_probability_nondisplaced(
     xpxp_covariance: np.ndarray,
     occupation_number: Tuple[int, ...],
@@ -238,3 +440,115 @@ def calculate_click_probability(
     )
 
     return max(probability, 0.0)
+
+
+def calculate_click_probabilities_nondisplaced(
+    xpxp_covariance: np.ndarray,
+    occupation_numbers: np.ndarray,
+) -> np.ndarray:
+    """
+    Calculates the threshold detection probabilities for every row of
+    `occupation_numbers`, see :func:`calculate_click_probability_nondisplaced`.
+
+    The torontonians are calculated in batches, in parallel.
+    """
+
+    d = len(xpxp_covariance) // 2
+
+    sigma: np.ndarray = (xpxp_covariance + np.identity(2 * d)) / 2
+
+    return calculate_click_probabilities_from_sigma_inverse(
+        np.linalg.inv(sigma), np.linalg.det(sigma), occupation_numbers
+    )
+
+
+def calculate_click_probabilities(
+    xpxp_covariance: np.ndarray,
+    xpxp_mean: np.ndarray,
+    occupation_numbers: np.ndarray,
+) -> np.ndarray:
+    """
+    Calculates the threshold detection probabilities for every row of
+    `occupation_numbers`, see :func:`calculate_click_probability`.
+
+    The loop torontonians are calculated in batches, in parallel.
+    """
+
+    d = len(xpxp_covariance) // 2
+
+    sigma: np.ndarray = (xpxp_covariance + np.identity(2 * d)) / 2
+
+    return calculate_click_probabilities_from_sigma_inverse(
+        np.linalg.inv(sigma), np.linalg.det(sigma), occupation_numbers, xpxp_mean
+    )
+
+
+def calculate_click_probabilities_from_sigma_inverse(
+    sigma_inv: np.ndarray,
+    sigma_determinant: float,
+    occupation_numbers: np.ndarray,
+    xpxp_mean: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    r"""
+    Calculates the threshold detection probabilities for every row of
+    `occupation_numbers` from the inverse and the determinant of
+    :math:`\Sigma`, see :func:`calculate_click_probability`.
+
+    This enables one to calculate :math:`\Sigma^{-1}` incrementally for a chain of
+    subsystems, see
+    :func:`~piquasso._math.linalg.extend_inverse_and_determinant`.
+    """
+
+    normalization = np.sqrt(sigma_determinant)
+
+    probabilities = np.empty(len(occupation_numbers), dtype=float)
+
+    if xpxp_mean is None:
+        for rows, indices in _group_reduce_indices_by_clicks(occupation_numbers):
+            A = (
+                np.identity(indices.shape[1], dtype=float)
+                - sigma_inv[indices[:, :, None], indices[:, None, :]]
+            )
+
+            probabilities[rows] = torontonian_batch(A) / normalization
+
+        return np.maximum(probabilities, 0.0)
+
+    gamma = sigma_inv @ xpxp_mean
+
+    exponential_term = np.exp(-xpxp_mean @ sigma_inv @ xpxp_mean / 2)
+
+    for rows, indices in _group_reduce_indices_by_clicks(occupation_numbers):
+        A = (
+            np.identity(indices.shape[1], dtype=float)
+            - sigma_inv[indices[:, :, None], indices[:, None, :]]
+        )
+
+        probabilities[rows] = (
+            loop_torontonian_batch(A, gamma[indices]).real
+            * exponential_term
+            / normalization
+        )
+
+    return np.maximum(probabilities, 0.0)
+
+
+def _group_reduce_indices_by_clicks(occupation_numbers):
+    """
+    Groups the rows of `occupation_numbers` by the number of clicks, and yields the
+    row indices and the corresponding xpxp-indices to reduce on for every group.
+    """
+
+    occupation_numbers = np.asarray(occupation_numbers, dtype=bool)
+    number_of_clicks = occupation_numbers.sum(axis=1)
+
+    for clicks in np.unique(number_of_clicks):
+        rows = np.flatnonzero(number_of_clicks == clicks)
+
+        modes = np.nonzero(occupation_numbers[rows])[1].reshape(len(rows), clicks)
+
+        indices = np.stack([2 * modes, 2 * modes + 1], axis=-1).reshape(
+            len(rows), 2 * clicks
+        )
+
+        yield rows, indices
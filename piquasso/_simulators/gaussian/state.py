@@ -33,10 +33,12 @@ from piquasso._math.transformations import xxpp_to_xpxp_indices, xpxp_to_xxpp_in
 
 from piquasso._math.decompositions import williamson
 
+from .cache import ClickProbabilityCache
 from .probabilities import (
     DensityMatrixCalculation,
     DisplacedDensityMatrixCalculation,
     NondisplacedDensityMatrixCalculation,
+    RecursiveDensityMatrixCalculation,
     calculate_click_probability_nondisplaced,
     calculate_click_probability,
 )
@@ -55,6 +57,9 @@ class GaussianState(State):
         """
         super().__init__(connector=connector, config=config)
         self._d = d
+        self._click_probability_cache = ClickProbabilityCache(
+            self._config.cache_size, self._config.cache_memory_limit
+        )
         self.reset()
 
     def __len__(self) -> int:
@@ -814,6 +819,12 @@ class GaussianState(State):
         return not self._connector.np.allclose(self._m, 0.0)
 
     def _get_density_matrix_calculation(self) -> DensityMatrixCalculation:
+        if self._connector.allow_conditionals and self._config.use_bargmann_recurrence:
+            return RecursiveDensityMatrixCalculation(
+                complex_displacement=self.complex_displacement,
+                complex_covariance=self.complex_covariance,
+                connector=self._connector,
+            )
         if self._connector.allow_conditionals and not self._is_displaced():
             return NondisplacedDensityMatrixCalculation(
                 complex_covariance=self.complex_covariance, connector=self._connector
@@ -0,0 +1,60 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Callable, List, Sequence
+
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+def distribute_shots(
+    function: Callable,
+    args: Sequence[Any],
+    seed_sequences: Sequence[np.random.SeedSequence],
+    workers: int,
+) -> List[Any]:
+    """Distributes the shots among separate processes.
+
+    The shots are represented by their seed sequences, which are split into contiguous
+    chunks, and `function` is called in a separate process for each chunk as
+    `function(*args, seed_sequences)`.
+
+    Args:
+        function (Callable): A picklable (i.e., module-level) function.
+        args (Sequence): The arguments passed to `function` besides the seeds.
+        seed_sequences (Sequence[numpy.random.SeedSequence]):
+            The seed sequences of every shot.
+        workers (int): The maximal number of processes.
+
+    Returns:
+        list: The results of `function` for each chunk, in the order of the shots.
+    """
+
+    shots = len(seed_sequences)
+    bounds = np.linspace(0, shots, min(workers, shots) + 1).astype(int)
+
+    chunks = [seed_sequences[start:end] for start, end in zip(bounds, bounds[1:])]
+
+    # NOTE: Forking is avoided, since it may deadlock with the threads of the parallel
+    # Numba kernels already running in the parent process.
+    context = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(max_workers=len(chunks), mp_context=context) as executor:
+        futures = [executor.submit(function, *args, chunk) for chunk in chunks]
+
+        return [future.result() for future in futures]
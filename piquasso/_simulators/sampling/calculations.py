@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Tuple
+from typing import Callable, Tuple
 
 import numpy as np
 from piquasso._simulators.sampling.state import SamplingState
@@ -30,10 +30,13 @@ from piquasso._simulators.fock.pure.calculations import (
 )
 
 
+from ..parallel import distribute_shots
+
 from .utils import (
     generate_lossless_samples,
     generate_uniform_lossy_samples,
     generate_lossy_samples,
+    generate_samples_from_seed_sequences,
 )
 
 
@@ -151,33 +154,36 @@ def particle_number_measurement(
 
     singular_values = interferometer_svd[1]
 
+    generate_samples: Callable
+
     if not state.is_lossy:
-        samples = generate_lossless_samples(
-            initial_state,
-            shots,
-            state._connector.permanent,
-            state.interferometer,
-            state._config.rng,
-        )
+        generate_samples = generate_lossless_samples
+        args: Tuple = (initial_state, state.interferometer)
     elif np.all(np.isclose(singular_values, singular_values[0])):
         uniform_transmission_probability = singular_values[0] ** 2
 
-        samples = generate_uniform_lossy_samples(
-            initial_state,
-            shots,
-            state._connector.permanent,
-            state.interferometer,
-            uniform_transmission_probability,
-            state._config.rng,
-        )
+        generate_samples = generate_uniform_lossy_samples
+        args = (initial_state, state.interferometer, uniform_transmission_probability)
+    else:
+        generate_samples = generate_lossy_samples
+        args = (initial_state, interferometer_svd)
+
+    config = state._config
 
+    seed_sequences = config.spawn(shots)
+
+    if config.workers > 1:
+        samples = np.concatenate(
+            distribute_shots(
+                generate_samples_from_seed_sequences,
+                args=(generate_samples, args),
+                seed_sequences=seed_sequences,
+                workers=config.workers,
+            )
+        )
     else:
-        samples = generate_lossy_samples(
-            initial_state,
-            shots,
-            state._connector.permanent,
-            interferometer_svd,
-            state._config.rng,
+        samples = generate_samples_from_seed_sequences(
+            generate_samples, args, seed_sequences
         )
 
     return Result(state=state, samples=list(map(tuple, samples)))
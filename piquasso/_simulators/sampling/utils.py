@@ -20,6 +20,7 @@ from functools import partial
 
 
 from piquasso._math.combinatorics import partitions
+from piquasso._math.permanent import partial_permanents
 
 """
 This is a contribution from `theboss`, see https://github.com/Tomev-CTP/theboss.
@@ -71,35 +72,30 @@ def calculate_inner_product(interferometer, input, output, connector):
     )
 
 
-def generate_lossless_samples(input, shots, permanent, interferometer, rng):
+def generate_lossless_samples(input, interferometer, rngs):
     """
     Generates samples corresponding to the Clifford & Clifford algorithm B from
     https://arxiv.org/abs/1706.01260.
 
     Args:
         input: The input Fock basis state.
-        shots: Number of samples to be generated.
-        permanent: Permanent calculator function, already containing
-            the unitary matrix corresponding to the interferometer.
-        rng: Random number generator.
+        interferometer: The unitary matrix corresponding to the interferometer.
+        rngs: The random number generators of every shot. The same generator may
+            be repeated for multiple shots.
 
     Returns:
-        The generated samples.
+        The generated samples as an array of shape `(shots, d)`.
     """
 
     return _generate_samples(
         input,
-        shots,
-        permanent,
         sample_generator=_generate_lossless_sample,
         interferometer=interferometer,
-        rng=rng,
+        rngs=rngs,
     )
 
 
-def generate_uniform_lossy_samples(
-    input, shots, permanent, interferometer, transmissivity, rng
-):
+def generate_uniform_lossy_samples(input, interferometer, transmissivity, rngs):
     """
     Basically the same algorithm as in `generate_lossless_samples`, but rejects
     particles according to the uniform `transmissivity` specified.
@@ -110,17 +106,13 @@ def generate_uniform_lossy_samples(
 
     return _generate_samples(
         input,
-        shots,
-        permanent,
         interferometer=interferometer,
         sample_generator=sample_generator,
-        rng=rng,
+        rngs=rngs,
     )
 
 
-def generate_lossy_samples(
-    input_state, samples_number, permanent, interferometer_svd, rng
-):
+def generate_lossy_samples(input_state, interferometer_svd, rngs):
     """
     Basically the same algorithm as in `generate_lossless_samples`, but doubles the
     system size and embeds the input state and the input matrix in order to simulate
@@ -136,19 +128,24 @@ def generate_lossy_samples(
         2 * len(input_state),
     )
 
-    expanded_samples = generate_lossless_samples(
-        expanded_state, samples_number, permanent, expanded_matrix, rng
-    )
+    expanded_samples = generate_lossless_samples(expanded_state, expanded_matrix, rngs)
 
     # Trim output state
-    samples = []
+    return expanded_samples[:, : len(input_state)]
 
-    for output_state in expanded_samples:
-        while len(output_state) > len(input_state):
-            output_state = np.delete(output_state, len(output_state) - 1)
-        samples.append(output_state)
 
-    return samples
+def generate_samples_from_seed_sequences(generate_samples, args, seed_sequences):
+    """
+    Calls one of the sample generators above with a separate random number generator
+    for every shot, created from `seed_sequences`.
+
+    The samples hence do not depend on how the shots are distributed among
+    multiple processes.
+    """
+
+    rngs = [np.random.default_rng(seed_sequence) for seed_sequence in seed_sequences]
+
+    return generate_samples(*args, rngs)
 
 
 def _get_first_quantized(occupation_numbers):
@@ -163,24 +160,22 @@ def _get_first_quantized(occupation_numbers):
     return first_quantized
 
 
-def _generate_samples(input, shots, permanent, interferometer, sample_generator, rng):
+def _generate_samples(input, interferometer, sample_generator, rngs):
     d = len(input)
     n = np.sum(input)
 
-    samples = []
+    samples = np.empty(shape=(len(rngs), d), dtype=int)
 
     first_quantized_input = _get_first_quantized(input)
 
-    while len(samples) < shots:
-        sample = sample_generator(
+    for shot, rng in enumerate(rngs):
+        samples[shot] = sample_generator(
             d,
             n,
-            permanent,
             interferometer,
             first_quantized_input,
             rng=rng,
         )
-        samples.append(sample)
 
     return samples
 
@@ -196,9 +191,7 @@ def _grow_current_input(current_input, to_shrink, rng):
     return current_input, to_shrink
 
 
-def _generate_lossless_sample(
-    d, n, permanent, interferometer, first_quantized_input, rng
-):
+def _generate_lossless_sample(d, n, interferometer, first_quantized_input, rng):
     sample = np.zeros(d, dtype=int)
 
     current_input = np.zeros(d, dtype=int)
@@ -207,7 +200,7 @@ def _generate_lossless_sample(
     for _ in range(1, n + 1):
         current_input, to_shrink = _grow_current_input(current_input, to_shrink, rng)
 
-        pmf = _calculate_pmf(current_input, sample, permanent, interferometer)
+        pmf = _calculate_pmf(current_input, sample, interferometer)
 
         index = _sample_from_pmf(pmf, rng)
 
@@ -217,7 +210,7 @@ def _generate_lossless_sample(
 
 
 def _generate_uniform_lossy_sample(
-    d, n, permanent, interferometer, first_quantized_input, transmissivity, rng
+    d, n, interferometer, first_quantized_input, transmissivity, rng
 ):
     sample = np.zeros(d, dtype=int)
 
@@ -234,7 +227,7 @@ def _generate_uniform_lossy_sample(
 
         current_input, to_shrink = _grow_current_input(current_input, to_shrink, rng)
 
-        pmf = _calculate_pmf(current_input, sample, permanent, interferometer)
+        pmf = _calculate_pmf(current_input, sample, interferometer)
 
         index = _sample_from_pmf(pmf, rng)
 
@@ -243,51 +236,33 @@ def _generate_uniform_lossy_sample(
     return sample
 
 
-def _filter_zeros(matrix, input_state, output_state):
-    nonzero_input_indices = input_state > 0
-    nonzero_output_indices = output_state > 0
-
-    new_input_state = input_state[input_state > 0]
-    new_output_state = output_state[output_state > 0]
-
-    new_matrix = matrix[np.ix_(nonzero_output_indices, nonzero_input_indices)]
-
-    return new_matrix, new_input_state, new_output_state
-
-
-def _calculate_pmf(input_state, sample, calculate_permanent, interferometer):
-    d = len(sample)
-    pmf = np.empty(d, dtype=np.float64)
+def _calculate_pmf(input_state, sample, interferometer):
+    """
+    Calculates the probabilities of adding a particle to each output mode, where
+    the permanents for every output mode are expanded along the new particle.
 
-    nonzero_indices = np.arange(d)[input_state > 0]
+    The sub-permanents of the expansion are calculated in a single pass by
+    :func:`~piquasso._math.permanent.partial_permanents`.
+    """
 
-    partial_permanents = np.zeros(len(nonzero_indices), dtype=interferometer.dtype)
+    nonzero_input_indices = np.flatnonzero(input_state)
+    nonzero_output_indices = np.flatnonzero(sample)
 
-    for idx, nonzero_idx in enumerate(nonzero_indices):
-        input_state_subtracted = input_state.copy()
-        input_state_subtracted[nonzero_idx] -= 1
+    nonzero_input_state = input_state[nonzero_input_indices]
 
-        filtered_interferometer, filtered_input_state, filtered_output_state = (
-            _filter_zeros(interferometer, input_state_subtracted, sample)
-        )
-        partial_permanents[idx] = calculate_permanent(
-            filtered_interferometer, filtered_output_state, filtered_input_state
-        )
+    partial_permanents_ = partial_permanents(
+        interferometer[np.ix_(nonzero_output_indices, nonzero_input_indices)],
+        sample[nonzero_output_indices],
+        nonzero_input_state,
+    )
 
-    normalization = 0.0
-    for idx in range(d):
-        permanent = 0.0
-        for j in range(len(partial_permanents)):
-            permanent += (
-                input_state[nonzero_indices[j]]
-                * partial_permanents[j]
-                * interferometer[idx, nonzero_indices[j]]
-            )
+    permanents = interferometer[:, nonzero_input_indices] @ (
+        nonzero_input_state * partial_permanents_
+    )
 
-        pmf[idx] = np.abs(permanent) ** 2
-        normalization += pmf[idx]
+    pmf = np.abs(permanents) ** 2
 
-    return pmf / normalization
+    return pmf / np.sum(pmf)
 
 
 def _sample_from_pmf(pmf, rng):
@@ -19,9 +19,13 @@ from piquasso.api.config import Config
 from piquasso.api.connector import BaseConnector
 
 from piquasso.api.simulator import Simulator
+from piquasso.api.instruction import Instruction
 from piquasso.api.exceptions import InvalidSimulation
 
+from piquasso.instructions import gates
+
 from .connectors.connector import BuiltinConnector
+from .fusion import fuse_passive_linear_gates
 
 
 class BuiltinSimulator(Simulator):
@@ -52,3 +56,16 @@ class BuiltinSimulator(Simulator):
                 "\n"
                 f"{[self._default_connector_class] + self._extra_builtin_connectors}"
             )
+
+    def _preprocess_instructions(
+        self, instructions: List[Instruction]
+    ) -> List[Instruction]:
+        if (
+            self.config.fuse_passive_gates
+            and gates.Interferometer in self._instruction_map
+        ):
+            return fuse_passive_linear_gates(
+                instructions, self.d, self._connector, self.config
+            )
+
+        return instructions
@@ -0,0 +1,238 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Ahead-of-time compilation of the numba kernels used by the simulators.
+
+The kernels are compiled with `cache=True`, i.e., the compiled machine code is saved
+next to the source files (or in `NUMBA_CACHE_DIR`) and loaded by later processes.
+Warming up runs small simulations for every requested dtype, which compiles every
+kernel specialization they use, or loads it from the cache.
+"""
+
+import time
+import argparse
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from piquasso.api.mode import Q
+from piquasso.api.config import Config
+from piquasso.api.program import Program
+
+from piquasso.instructions.preparations import Vacuum, StateVector
+from piquasso.instructions.gates import (
+    Squeezing,
+    Displacement,
+    Beamsplitter,
+    Interferometer,
+    Kerr,
+)
+from piquasso.instructions.measurements import ParticleNumberMeasurement
+
+from piquasso._simulators.gaussian import GaussianSimulator
+from piquasso._simulators.fock import FockSimulator, PureFockSimulator
+from piquasso._simulators.sampling import SamplingSimulator
+
+
+_WARMUP_d = 3
+
+_WARMUP_CUTOFF = 4
+
+
+def _get_interferometer_matrix(dtype: type) -> np.ndarray:
+    angle = np.pi / 5
+
+    return np.array(
+        [
+            [np.cos(angle), -np.sin(angle), 0],
+            [np.sin(angle), np.cos(angle), 0],
+            [0, 0, 1j],
+        ],
+        dtype=np.complex128 if dtype is np.float64 else np.complex64,
+    )
+
+
+def _warm_up_gaussian(dtype: type) -> None:
+    config = Config(dtype=dtype)
+
+    for displacement in (0.0, 0.1):
+        with Program() as program:
+            Q() | Vacuum()
+
+            Q(0) | Squeezing(0.1)
+            Q(1) | Displacement(displacement)
+            Q() | Interferometer(_get_interferometer_matrix(dtype))
+
+            Q() | ParticleNumberMeasurement()
+
+        simulator = GaussianSimulator(d=_WARMUP_d, config=config)
+
+        state = simulator.execute(program, shots=2).state
+        state.get_particle_detection_probability([1, 1, 0])
+
+
+def _warm_up_fock(simulator_class: type, dtype: type) -> None:
+    with Program() as program:
+        Q() | Vacuum()
+
+        Q(0) | Squeezing(0.1)
+        Q(1) | Displacement(0.1)
+        Q(0, 1) | Beamsplitter(theta=np.pi / 5, phi=np.pi / 7)
+        Q() | Interferometer(_get_interferometer_matrix(dtype))
+        Q(2) | Kerr(0.1)
+
+    simulator = simulator_class(
+        d=_WARMUP_d, config=Config(dtype=dtype, cutoff=_WARMUP_CUTOFF)
+    )
+
+    simulator.execute(program).state.fock_probabilities
+
+
+def _warm_up_pure_fock(dtype: type) -> None:
+    _warm_up_fock(PureFockSimulator, dtype)
+
+
+def _warm_up_mixed_fock(dtype: type) -> None:
+    _warm_up_fock(FockSimulator, dtype)
+
+
+def _warm_up_sampling(dtype: type) -> None:
+    with Program() as program:
+        Q() | StateVector([1, 1, 0])
+
+        Q() | Interferometer(_get_interferometer_matrix(dtype))
+
+        Q() | ParticleNumberMeasurement()
+
+    simulator = SamplingSimulator(d=_WARMUP_d, config=Config(dtype=dtype))
+
+    simulator.execute(program, shots=2).state.get_particle_detection_probability(
+        [1, 0, 1]
+    )
+
+
+_TASKS: Dict[str, Callable[[type], None]] = {
+    "gaussian": _warm_up_gaussian,
+    "pure_fock": _warm_up_pure_fock,
+    "fock": _warm_up_mixed_fock,
+    "sampling": _warm_up_sampling,
+}
+
+
+def _run_task(name: str, dtype: type) -> float:
+    start_time = time.perf_counter()
+
+    _TASKS[name](dtype)
+
+    return time.perf_counter() - start_time
+
+
+def warmup(
+    dtypes: Iterable[type] = (np.float64,), processes: Optional[int] = None
+) -> Dict[Tuple[str, str], float]:
+    """Compiles the numba kernels used by the simulators ahead of time.
+
+    The compiled kernels are cached on disk by numba, hence this function is
+    useful to call once, e.g., when building a container image or before starting
+    short-lived worker processes, which then load the kernels instead of compiling
+    them on their first simulation. The cache location can be set by the
+    `NUMBA_CACHE_DIR` environment variable.
+
+    The kernels are also loaded in the calling process, so that its first
+    simulation does not pay the latency of compiling or loading them.
+
+    Example usage::
+
+        import numpy as np
+        import piquasso as pq
+
+        pq.warmup(dtypes=(np.float32, np.float64), processes=4)
+
+    The same can be achieved from the command line by running
+    `python -m piquasso warmup --dtype float32 --dtype float64 --processes 4`.
+
+    Args:
+        dtypes (Iterable[type]):
+            The dtypes used in :class:`~piquasso.api.config.Config`, for which the
+            kernels are compiled. Defaults to `(np.float64,)`.
+        processes (int, optional):
+            The number of processes compiling the kernels in parallel. If `None` or
+            `1`, the kernels are compiled in the calling process.
+
+    Returns:
+        dict:
+            The time in seconds taken by the first simulation in the calling process,
+            keyed by the name of the simulator kind and the dtype.
+    """
+
+    jobs: List[Tuple[str, type]] = [
+        (name, np.dtype(dtype).type) for dtype in dtypes for name in _TASKS
+    ]
+
+    if processes is not None and processes > 1:
+        # NOTE: The worker processes populate the on-disk cache of numba in
+        # parallel, from which the kernels are loaded below. Processes are spawned
+        # instead of forked, since forking a process with running numba threads is
+        # unsafe.
+        with ProcessPoolExecutor(
+            max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            list(executor.map(_run_task, *zip(*jobs)))
+
+    return {
+        (name, np.dtype(dtype).name): _run_task(name, dtype) for name, dtype in jobs
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="piquasso",
+        description="Command line tools of Piquasso.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    warmup_parser = subparsers.add_parser(
+        "warmup", help="Compile the numba kernels used by the simulators."
+    )
+    warmup_parser.add_argument(
+        "--dtype",
+        action="append",
+        choices=["float32", "float64"],
+        help="The dtype to compile the kernels for. Can be specified multiple times.",
+    )
+    warmup_parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="The number of processes compiling the kernels in parallel.",
+    )
+
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+
+    elapsed_times = warmup(
+        dtypes=[np.dtype(dtype).type for dtype in args.dtype or ["float64"]],
+        processes=args.processes,
+    )
+
+    for (name, dtype), elapsed_time in elapsed_times.items():
+        print(f"{name:<12}{dtype:<10}{elapsed_time:.3f} s")
+
+    print(f"Warmup finished in {time.perf_counter() - start_time:.3f} s.")
@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional, Any
+from typing import Optional, Any, List
 
 import os
 import copy
@@ -41,14 +41,40 @@ class Config(_mixins.CodeMixin):
         Uses torontonian for
         :class:`~piquasso.instructions.measurements.ThresholdMeasurement`. Defaults to
         `False`.
+    :ivar use_bargmann_recurrence:
+        Uses a recurrence relation to calculate every density matrix element of a
+        Gaussian state at once, instead of calculating a loop hafnian per element, in
+        :attr:`~piquasso._simulators.gaussian.state.GaussianState.density_matrix` and
+        :attr:`~piquasso._simulators.gaussian.state.GaussianState.fock_probabilities`.
+        Defaults to `False`.
+    :ivar fuse_passive_gates:
+        Fuses consecutive passive linear gates (e.g.,
+        :class:`~piquasso.instructions.gates.Beamsplitter` or
+        :class:`~piquasso.instructions.gates.Phaseshifter`) into a single
+        :class:`~piquasso.instructions.gates.Interferometer` before the simulation,
+        as long as the fused gate is estimated to be cheaper to apply on the Fock space
+        than the separate gates. Defaults to `False`.
     :ivar cache_size:
-        The maximum size of the cache for certain algorithms. Defaults to `2.0`.
+        The maximum number of entries in the cache for certain algorithms, e.g., the
+        click probabilities of
+        :class:`~piquasso.instructions.measurements.ThresholdMeasurement` using
+        torontonians. If `None`, the number of entries is only bounded by
+        :attr:`cache_memory_limit`. Defaults to `None`.
+    :ivar cache_memory_limit:
+        The maximum size of the cache for certain algorithms in bytes. Defaults to
+        `2 ** 27`, i.e., 128 MiB.
     :ivar validate:
         Validates computations during simulation. Defaults to `True`. If set to `False`,
         it is not guaranteed that the calculations will be correct, and it is advised
         to only turn it off when necessary. Moreover, it is also not guaranteed that all
         validations are turned off by setting `validate=False` (e.g., specifying invalid
         modes will still yield an error).
+    :ivar workers:
+        The number of processes to distribute the shots of certain sampling algorithms
+        among. Defaults to `1`, i.e., sampling in the current process. Every shot of
+        these algorithms uses its own random number generator spawned from
+        :attr:`seed_sequence`, hence the samples do not depend on the number of
+        workers.
     """
 
     def __init__(
@@ -60,20 +86,28 @@ class Config(_mixins.CodeMixin):
         hbar: float = 2.0,
         seed_sequence: Optional[Any] = None,
         use_torontonian: bool = False,
-        cache_size: int = 32,
+        use_bargmann_recurrence: bool = False,
+        fuse_passive_gates: bool = False,
+        cache_size: Optional[int] = None,
+        cache_memory_limit: int = 2**27,
         validate: bool = True,
+        workers: int = 1,
     ):
         self._original_seed_sequence = seed_sequence
         self.seed_sequence = seed_sequence or int.from_bytes(
             os.urandom(8), byteorder="big"
         )
         self.cache_size = cache_size
+        self.cache_memory_limit = cache_memory_limit
         self.hbar = hbar
         self.use_torontonian = use_torontonian
+        self.use_bargmann_recurrence = use_bargmann_recurrence
+        self.fuse_passive_gates = fuse_passive_gates
         self.cutoff = cutoff
         self.measurement_cutoff = measurement_cutoff
         self.dtype = np.float64 if dtype is float else dtype
         self.validate = validate
+        self.workers = workers
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Config):
@@ -81,12 +115,16 @@ class Config(_mixins.CodeMixin):
         return (
             self._original_seed_sequence == other._original_seed_sequence
             and self.cache_size == other.cache_size
+            and self.cache_memory_limit == other.cache_memory_limit
             and self.hbar == other.hbar
             and self.use_torontonian == other.use_torontonian
+            and self.use_bargmann_recurrence == other.use_bargmann_recurrence
+            and self.fuse_passive_gates == other.fuse_passive_gates
             and self.cutoff == other.cutoff
             and self.measurement_cutoff == other.measurement_cutoff
             and self.dtype == other.dtype
             and self.validate == other.validate
+            and self.workers == other.workers
         )
 
     def _as_code(self) -> str:
@@ -97,10 +135,16 @@ class Config(_mixins.CodeMixin):
             non_default_params["seed_sequence"] = self._original_seed_sequence
         if self.cache_size != default_config.cache_size:
             non_default_params["cache_size"] = self.cache_size
+        if self.cache_memory_limit != default_config.cache_memory_limit:
+            non_default_params["cache_memory_limit"] = self.cache_memory_limit
         if self.hbar != default_config.hbar:
             non_default_params["hbar"] = self.hbar
         if self.use_torontonian != default_config.use_torontonian:
             non_default_params["use_torontonian"] = self.use_torontonian
+        if self.use_bargmann_recurrence != default_config.use_bargmann_recurrence:
+            non_default_params["use_bargmann_recurrence"] = self.use_bargmann_recurrence
+        if self.fuse_passive_gates != default_config.fuse_passive_gates:
+            non_default_params["fuse_passive_gates"] = self.fuse_passive_gates
         if self.cutoff != default_config.cutoff:
             non_default_params["cutoff"] = self.cutoff
         if self.measurement_cutoff != default_config.measurement_cutoff:
@@ -109,6 +153,8 @@ class Config(_mixins.CodeMixin):
             non_default_params["dtype"] = "np." + self.dtype.__name__
         if self.validate != default_config.validate:
             non_default_params["validate"] = self.validate
+        if self.workers != default_config.workers:
+            non_default_params["workers"] = self.workers
 
         if len(non_default_params) == 0:
             return "pq.Config()"
@@ -128,8 +174,24 @@ class Config(_mixins.CodeMixin):
     def seed_sequence(self, value: Any) -> None:
         self._seed_sequence = value
         self.rng = np.random.default_rng(self._seed_sequence)
+        self._spawner = np.random.SeedSequence(self._seed_sequence)
         random.seed(self._seed_sequence)
 
+    def spawn(self, n: int) -> List[np.random.SeedSequence]:
+        """Spawns independent child seed sequences from :attr:`seed_sequence`.
+
+        Subsequent calls yield different children, similarly to how :attr:`rng`
+        advances during the simulation.
+
+        Args:
+            n (int): The number of child seed sequences.
+
+        Returns:
+            list[numpy.random.SeedSequence]: The spawned seed sequences.
+        """
+
+        return self._spawner.spawn(n)
+
     @property
     def complex_dtype(self):
         """Returns the complex precision depending on the dtype of the Config class"""
@@ -151,6 +213,7 @@ class Config(_mixins.CodeMixin):
         # NOTE: We want to preserve the RNG, otherwise simulations may lead to repeated
         # samples if the user reuses the simulator.
         config_copy.rng = self.rng
+        config_copy._spawner = self._spawner
 
         return config_copy
 
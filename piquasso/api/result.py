@@ -20,23 +20,32 @@ from piquasso.api.state import State
 if TYPE_CHECKING:
     import numpy as np
 
+    from piquasso._simulators.gaussian.cache import CacheInfo
+
 
 class Result:
     """Class for collecting results."""
 
     def __init__(
-        self, state: State, samples: Optional[Union[List[Tuple], "np.ndarray"]] = None
+        self,
+        state: State,
+        samples: Optional[Union[List[Tuple], "np.ndarray"]] = None,
+        cache_info: Optional["CacheInfo"] = None,
     ) -> None:
         """
         Args:
             state (State): The resulting simulated state.
             samples (list[tuple[int or float]]): The generated samples.
+            cache_info (CacheInfo): The statistics of the cache used during sampling,
+                if any. The hits and misses are counted for the generation of
+                `samples` only.
         """
 
         self.state: State = state
         self.samples: Union[List[Tuple], "np.ndarray"] = (
             samples if samples is not None else []
         )
+        self.cache_info: Optional["CacheInfo"] = cache_info
 
     def __repr__(self) -> str:
         return f"Result(samples={self.samples}, state={self.state})"
@@ -15,7 +15,9 @@
 
 import abc
 
-from typing import Optional, List, Type, Dict, Callable
+from typing import Optional, List, Type, Dict, Callable, Sequence
+
+import numpy as np
 
 from piquasso.core import _mixins
 
@@ -194,6 +196,17 @@ class Simulator(Computer, _mixins.CodeMixin):
 
         return instruction
 
+    def _preprocess_instructions(
+        self, instructions: List[Instruction]
+    ) -> List[Instruction]:
+        """
+        Transforms the validated instructions with their modes specified before the
+        execution, e.g., for optimization. Returns the instructions unchanged by
+        default.
+        """
+
+        return instructions
+
     def execute_instructions(
         self,
         instructions: List[Instruction],
@@ -238,6 +251,9 @@ class Simulator(Computer, _mixins.CodeMixin):
             if not hasattr(instruction, "modes") or instruction.modes is tuple():
                 instruction.modes = tuple(range(self.d))
 
+        instructions = self._preprocess_instructions(instructions)
+
+        for instruction in instructions:
             calculation = self._get_calculation(instruction)
 
             instruction = self._maybe_postprocess_batch_instruction(instruction)
@@ -276,3 +292,179 @@ class Simulator(Computer, _mixins.CodeMixin):
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(d={self.d}, config={self.config}, connector={self._connector})"  # noqa: E501
+
+
+class BatchSimulator(Simulator):
+    """Base class for the simulators able to execute a program for multiple parameter
+    sets at once, see :meth:`execute_batch`.
+    """
+
+    _batch_instruction_map: Dict[Type[Instruction], Callable] = {}
+
+    def _get_batch_calculation(self, instruction: Instruction) -> Callable:
+        for instruction_class, calculation in self._batch_instruction_map.items():
+            if type(instruction) is instruction_class:
+                return calculation
+
+        raise InvalidSimulation(
+            "\n"
+            "The parameters of the instruction could not be varied in a batch for this "
+            "simulator.\n"
+            "Details:\n"
+            f"instruction={instruction}\n"
+            f"simulator={self}\n"
+            f"Instructions with batch parameters:\n"
+            + str(", ".join(map(repr, self._batch_instruction_map.keys())))
+            + "."
+        )
+
+    @abc.abstractmethod
+    def _broadcast_state(self, state: State, batch_size: int) -> State:
+        """Creates a batch state from `state` with `batch_size` identical elements."""
+
+    def execute_batch(
+        self,
+        program: Program,
+        parameter_sets: Sequence[Sequence[dict]],
+        initial_state: Optional[State] = None,
+    ) -> Result:
+        """Executes the specified program for multiple parameter sets at once.
+
+        Every element of `parameter_sets` contains one `dict` for every instruction in
+        `program`, overriding the parameters of the instruction. The instructions with
+        the same parameters in every parameter set are applied as in :meth:`execute`,
+        and the others are applied on all the batch elements simultaneously.
+
+        Example usage::
+
+            import numpy as np
+            import piquasso as pq
+
+
+            with pq.Program() as program:
+                pq.Q(all) | pq.Vacuum()
+
+                pq.Q(0) | pq.Squeezing(r=0.1)
+                pq.Q(0, 1) | pq.Beamsplitter(theta=np.pi / 3)
+
+            simulator = pq.PureFockSimulator(d=2, config=pq.Config(cutoff=7))
+
+            result = simulator.execute_batch(
+                program,
+                [[{}, {}, dict(theta=theta)] for theta in np.linspace(0, np.pi, 8)],
+            )
+
+        Args:
+            program (Program): The program to execute.
+            parameter_sets (Sequence[Sequence[dict]]):
+                The parameters of the instructions for every batch element.
+            initial_state (State, optional):
+                A state to execute the instructions on. Defaults to the state created by
+                :meth:`create_initial_state`.
+
+        Raises:
+            InvalidParameter:
+                When `parameter_sets` is empty, or a parameter set does not match the
+                instructions in `program`.
+            InvalidSimulation:
+                When the simulator could not execute the specified program in a batch.
+
+        Returns:
+            Result: The result of the simulation containing the resulting batch state.
+        """
+
+        if not self._batch_instruction_map:
+            raise InvalidSimulation(
+                f"Batch execution is not supported by this simulator: simulator={self}."
+            )
+
+        instructions: List[Instruction] = program.instructions
+
+        if len(parameter_sets) == 0:
+            raise InvalidParameter("At least one parameter set should be specified.")
+
+        for parameter_set in parameter_sets:
+            if len(parameter_set) != len(instructions):
+                raise InvalidParameter(
+                    "Every parameter set should contain one element for every "
+                    f"instruction: len(program.instructions)={len(instructions)}, "
+                    f"parameter_set={parameter_set}"
+                )
+
+        self._validate_instructions(instructions)
+
+        if any(isinstance(instruction, Measurement) for instruction in instructions):
+            raise InvalidSimulation(
+                "Measurements are not supported in batch execution."
+            )
+
+        if initial_state is not None:
+            self._validate_state(initial_state)
+            state = initial_state.copy()
+        else:
+            state = self.create_initial_state()
+
+        for instruction in instructions:
+            if not hasattr(instruction, "modes") or instruction.modes is tuple():
+                instruction.modes = tuple(range(self.d))
+
+        # NOTE: The preprocessing (e.g., the fusion of passive linear gates) only
+        # depends on the types and the modes of the instructions, hence the
+        # preprocessed instructions of the batch elements correspond to each other.
+        instructions_per_element = [
+            self._preprocess_instructions(
+                [
+                    _override_params(instruction, params)
+                    for instruction, params in zip(instructions, parameter_set)
+                ]
+            )
+            for parameter_set in parameter_sets
+        ]
+
+        batch_size = len(parameter_sets)
+        is_broadcast = False
+
+        for batch_instructions in zip(*instructions_per_element):
+            instruction = batch_instructions[0]
+
+            if all(
+                _are_params_equal(instruction, batch_instruction)
+                for batch_instruction in batch_instructions[1:]
+            ):
+                calculation = self._get_calculation(instruction)
+
+                state = calculation(state, instruction, 1).state
+
+                continue
+
+            calculation = self._get_batch_calculation(instruction)
+
+            if not is_broadcast:
+                state = self._broadcast_state(state, batch_size)
+                is_broadcast = True
+
+            state = calculation(state, list(batch_instructions), 1).state
+
+        if not is_broadcast:
+            state = self._broadcast_state(state, batch_size)
+
+        return Result(state=state)
+
+
+def _override_params(instruction: Instruction, params: dict) -> Instruction:
+    if not params:
+        return instruction
+
+    new_instruction = type(instruction)(**{**instruction.params, **params})
+
+    return new_instruction.on_modes(*instruction.modes)
+
+
+def _are_params_equal(instruction: Instruction, other: Instruction) -> bool:
+    if instruction is other:
+        return True
+
+    return all(
+        np.array_equal(value, other.params[key])
+        for key, value in instruction.params.items()
+    )
@@ -30,6 +30,7 @@
 #include <complex>
 #include <vector>
 #include <cstring>
+#include <cstddef>
 #include <iostream>
 
 
@@ -282,3 +283,39 @@ template float loop_torontonian_cpp<float>(
 template double loop_torontonian_cpp<double>(
     Matrix<double> &matrix,
     Vector<double> &displacement_vector);
+
+template <typename TScalar>
+void loop_torontonian_batch_cpp(
+    TScalar *matrices,
+    TScalar *displacement_vectors,
+    size_t batch_size,
+    size_t dim,
+    TScalar *results)
+{
+    // NOTE: OpenMP 2.0 (used by MSVC) requires a signed loop variable.
+    std::ptrdiff_t size = static_cast<std::ptrdiff_t>(batch_size);
+
+#ifdef _OPENMP
+#pragma omp parallel for schedule(dynamic)
+#endif
+    for (std::ptrdiff_t idx = 0; idx < size; idx++)
+    {
+        Matrix<TScalar> matrix(dim, dim, matrices + idx * dim * dim);
+        Vector<TScalar> displacement_vector(dim, displacement_vectors + idx * dim);
+
+        results[idx] = loop_torontonian_cpp(matrix, displacement_vector);
+    }
+}
+
+template void loop_torontonian_batch_cpp<float>(
+    float *matrices,
+    float *displacement_vectors,
+    size_t batch_size,
+    size_t dim,
+    float *results);
+template void loop_torontonian_batch_cpp<double>(
+    double *matrices,
+    double *displacement_vectors,
+    size_t batch_size,
+    size_t dim,
+    double *results);
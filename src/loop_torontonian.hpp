@@ -31,4 +31,23 @@ extern TScalar loop_torontonian_cpp(
     Vector<TScalar> &displacement_vector
 );
 
+/**
+ * Calculates the loop torontonians of a batch of input matrices and displacement
+ * vectors in parallel.
+ *
+ * @param matrices The input matrices stored contiguously, one after the other.
+ * @param displacement_vectors The displacement vectors stored contiguously.
+ * @param batch_size The number of input matrices.
+ * @param dim The number of rows (and columns) of each input matrix.
+ * @param results The output buffer of length `batch_size`.
+ */
+template <typename TScalar>
+extern void loop_torontonian_batch_cpp(
+    TScalar *matrices,
+    TScalar *displacement_vectors,
+    size_t batch_size,
+    size_t dim,
+    TScalar *results
+);
+
 #endif
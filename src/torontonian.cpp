@@ -30,6 +30,7 @@
 #include <complex>
 #include <vector>
 #include <cstring>
+#include <cstddef>
 #include <iostream>
 
 
@@ -196,3 +197,35 @@ TScalar torontonian_cpp(Matrix<TScalar> &matrix_in)
 
 template float torontonian_cpp<float>(Matrix<float> &matrix);
 template double torontonian_cpp<double>(Matrix<double> &matrix);
+
+template <typename TScalar>
+void torontonian_batch_cpp(
+    TScalar *matrices,
+    size_t batch_size,
+    size_t dim,
+    TScalar *results)
+{
+    // NOTE: OpenMP 2.0 (used by MSVC) requires a signed loop variable.
+    std::ptrdiff_t size = static_cast<std::ptrdiff_t>(batch_size);
+
+#ifdef _OPENMP
+#pragma omp parallel for schedule(dynamic)
+#endif
+    for (std::ptrdiff_t idx = 0; idx < size; idx++)
+    {
+        Matrix<TScalar> matrix(dim, dim, matrices + idx * dim * dim);
+
+        results[idx] = torontonian_cpp(matrix);
+    }
+}
+
+template void torontonian_batch_cpp<float>(
+    float *matrices,
+    size_t batch_size,
+    size_t dim,
+    float *results);
+template void torontonian_batch_cpp<double>(
+    double *matrices,
+    size_t batch_size,
+    size_t dim,
+    double *results);
@@ -28,4 +28,20 @@
 template <typename TScalar>
 extern TScalar torontonian_cpp(Matrix<TScalar> &matrix);
 
+/**
+ * Calculates the torontonians of a batch of input matrices in parallel.
+ *
+ * @param matrices The input matrices stored contiguously, one after the other.
+ * @param batch_size The number of input matrices.
+ * @param dim The number of rows (and columns) of each input matrix.
+ * @param results The output buffer of length `batch_size`.
+ */
+template <typename TScalar>
+extern void torontonian_batch_cpp(
+    TScalar *matrices,
+    size_t batch_size,
+    size_t dim,
+    TScalar *results
+);
+
 #endif
@@ -0,0 +1,114 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import numpy as np
+
+import piquasso as pq
+
+from piquasso._math.cache import IndexTableCache, index_table_cache
+
+
+def _calculate_tables(d, cutoff):
+    return (
+        np.arange(d * cutoff, dtype=np.int64).reshape(d, cutoff),
+        [np.full(n, fill_value=n, dtype=np.float64) for n in range(cutoff)],
+    )
+
+
+def _assert_tables_equal(tables, expected_tables):
+    assert isinstance(tables, tuple)
+    assert isinstance(tables[1], list)
+
+    assert np.array_equal(tables[0], expected_tables[0])
+    assert tables[0].dtype == expected_tables[0].dtype
+
+    for array, expected_array in zip(tables[1], expected_tables[1]):
+        assert np.array_equal(array, expected_array)
+
+
+def test_IndexTableCache_hits_in_memory():
+    cache = IndexTableCache(_calculate_tables)
+
+    first = cache(d=2, cutoff=3)
+    second = cache(d=2, cutoff=3)
+
+    assert first is second
+    assert cache.cache_info().hits == 1
+    assert cache.cache_info().misses == 1
+    assert cache.cache_info().memory_usage == 6 * 8 + 3 * 8
+
+
+def test_IndexTableCache_evicts_least_recently_used_entries():
+    cache = IndexTableCache(lambda n: np.zeros(n), memory_limit=3 * 8 * 10)
+
+    cache(10)
+    cache(11)
+    cache(10)
+    cache(12)
+
+    assert cache.cache_info().memory_usage == 8 * 10 + 8 * 12
+
+    cache(10)
+    cache(11)
+
+    assert cache.cache_info().hits == 2
+    assert cache.cache_info().misses == 4
+
+
+def test_IndexTableCache_does_not_store_entries_larger_than_the_limit():
+    cache = IndexTableCache(lambda n: np.zeros(n), memory_limit=8)
+
+    cache(2)
+
+    assert cache.cache_info().memory_usage == 0
+
+
+def test_IndexTableCache_shares_the_tables_on_disk(tmp_path):
+    cache = IndexTableCache(_calculate_tables, directory=str(tmp_path))
+
+    expected_tables = cache(d=2, cutoff=3)
+
+    other_process_cache = IndexTableCache(
+        pytest.fail, directory=str(tmp_path)  # Should not be called.
+    )
+    other_process_cache.__module__ = cache.__module__
+    other_process_cache.__qualname__ = cache.__qualname__
+
+    tables = other_process_cache(d=2, cutoff=3)
+
+    _assert_tables_equal(tables, expected_tables)
+
+    assert other_process_cache.cache_info().disk_hits == 1
+    assert not tables[0].flags.writeable
+
+
+def test_configure_index_cache(tmp_path):
+    cache = index_table_cache(_calculate_tables)
+
+    try:
+        pq.configure_index_cache(directory=str(tmp_path), memory_limit=1024)
+
+        assert cache.directory == str(tmp_path)
+        assert cache.memory_limit == 1024
+
+        cache(d=2, cutoff=3)
+
+        assert len(list(tmp_path.rglob("*.npy"))) == 4
+    finally:
+        pq.configure_index_cache()
+
+    assert cache.directory is None
@@ -466,6 +466,23 @@ def test_hafnian_with_reduction_scaling_equivalence():
         assert np.isclose(scaled_before, scaled_after)
 
 
+@pytest.mark.monkey
+def test_hafnian_with_reduction_compensated_summation():
+    for _ in range(10):
+        d = 5
+        max_photons = 4
+        A = np.random.rand(d, d) + 1j * np.random.rand(d, d)
+
+        A = A + A.T
+
+        occupation_numbers = np.random.randint(0, max_photons, d)
+
+        expected = hafnian_with_reduction(A, occupation_numbers)
+        actual = hafnian_with_reduction(A, occupation_numbers, compensated=True)
+
+        assert np.isclose(expected, actual)
+
+
 @pytest.mark.monkey
 def test_loop_hafnian_with_reduction_equivalence():
     for _ in range(100):
@@ -495,6 +512,26 @@ def test_loop_hafnian_with_reduction_equivalence():
         assert np.isclose(expected, actual)
 
 
+@pytest.mark.monkey
+def test_loop_hafnian_with_reduction_compensated_summation():
+    for _ in range(10):
+        d = 5
+        max_photons = 4
+        A = np.random.rand(d, d) + 1j * np.random.rand(d, d)
+        diagonal = np.random.rand(d) + 1j * np.random.rand(d)
+
+        A = A + A.T
+
+        occupation_numbers = np.random.randint(0, max_photons, d)
+
+        expected = loop_hafnian_with_reduction(A, diagonal, occupation_numbers)
+        actual = loop_hafnian_with_reduction(
+            A, diagonal, occupation_numbers, compensated=True
+        )
+
+        assert np.isclose(expected, actual)
+
+
 @pytest.mark.monkey
 def test_loop_hafnian_with_reduction_scaling_equivalence():
     for _ in range(10):
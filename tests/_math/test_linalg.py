@@ -15,7 +15,7 @@
 
 import numpy as np
 
-from piquasso._math.linalg import block_reduce
+from piquasso._math.linalg import block_reduce, extend_inverse_and_determinant
 
 
 def test_block_reduce_on_2_by_2_matrix():
@@ -98,3 +98,18 @@ def test_hafnian_on_6_by_6_matrix():
             ],
         ),
     )
+
+
+def test_extend_inverse_and_determinant():
+    A = np.random.rand(6, 6)
+    matrix = A @ A.T + np.identity(6)
+
+    inverse, determinant = np.empty(shape=(0, 0)), 1.0
+
+    for size in (2, 4, 6):
+        inverse, determinant = extend_inverse_and_determinant(
+            inverse, determinant, matrix[:size, :size]
+        )
+
+        assert np.allclose(inverse, np.linalg.inv(matrix[:size, :size]))
+        assert np.isclose(determinant, np.linalg.det(matrix[:size, :size]))
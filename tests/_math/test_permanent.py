@@ -13,11 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
+
 import numpy as np
 
 import pytest
 
-from piquasso._math.permanent import permanent
+from piquasso._math.permanent import permanent, partial_permanents
 from piquasso._math.linalg import assym_reduce
 
 
@@ -285,3 +287,74 @@ def test_permanent_asymmetric_matrix_random(generate_random_fock_state):
         permanent(matrix, rows=rows, cols=cols),
         permanent(assym_reduce(matrix, rows, cols), ones, ones),
     )
+
+
+def test_partial_permanents_zero_rows():
+    matrix = np.empty(shape=(0, 3), dtype=complex)
+
+    rows = np.empty(shape=(0,), dtype=int)
+    cols = np.array([0, 1, 0], dtype=int)
+
+    assert np.allclose(partial_permanents(matrix, rows, cols), [0.0, 1.0, 0.0])
+
+
+@pytest.mark.monkey
+def test_partial_permanents_random(generate_random_fock_state):
+    d1 = np.random.randint(1, 6)
+    d2 = np.random.randint(1, 6)
+    n = np.random.randint(1, 6)
+
+    matrix = np.random.rand(d1, d2) + 1j * np.random.rand(d1, d2)
+
+    rows = generate_random_fock_state(d1, n - 1)
+    cols = generate_random_fock_state(d2, n)
+
+    expected = np.zeros(d2, dtype=complex)
+
+    for j in range(d2):
+        if cols[j] > 0:
+            reduced_cols = cols.copy()
+            reduced_cols[j] -= 1
+
+            expected[j] = permanent(matrix, rows=rows, cols=reduced_cols)
+
+    assert np.allclose(partial_permanents(matrix, rows, cols), expected)
+
+
+def test_permanent_compensated_summation_of_ones():
+    matrix = np.ones(shape=(8, 8), dtype=complex)
+
+    rows = cols = np.ones(8, dtype=int)
+
+    assert np.isclose(permanent(matrix, rows, cols, compensated=True), 40320)
+
+
+def test_permanent_compensated_summation_of_ones_large():
+    matrix = np.ones(shape=(20, 20), dtype=complex)
+
+    rows = cols = np.ones(20, dtype=int)
+
+    # NOTE: Plain summation has a relative error of about 4e-12 here.
+    assert np.isclose(
+        permanent(matrix, rows, cols, compensated=True),
+        math.factorial(20),
+        rtol=1e-14,
+        atol=0.0,
+    )
+
+
+@pytest.mark.monkey
+def test_permanent_compensated_summation_equals_to_plain_summation(
+    generate_random_fock_state, generate_unitary_matrix
+):
+    d = np.random.randint(2, 6)
+    n = np.random.randint(1, 8)
+
+    matrix = generate_unitary_matrix(d)
+
+    rows = generate_random_fock_state(d, n)
+    cols = generate_random_fock_state(d, n)
+
+    assert np.isclose(
+        permanent(matrix, rows, cols, compensated=True), permanent(matrix, rows, cols)
+    )
@@ -0,0 +1,49 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from piquasso._math.summation import two_sum, compensated_sum
+
+
+def test_two_sum_is_error_free():
+    s, e = two_sum(1e16, 1.0)
+
+    assert s == 1e16
+    assert e == 1.0
+
+
+def test_two_sum_is_error_free_for_complex_numbers():
+    s, e = two_sum(1e16 + 1e16j, 1.0 + 1.0j)
+
+    assert s == 1e16 + 1e16j
+    assert e == 1.0 + 1.0j
+
+
+def test_compensated_sum_recovers_cancelled_terms():
+    values = np.array([1e16, 1.0, -1e16, 1.0])
+
+    assert np.sum(values) != 2.0
+    assert compensated_sum(values) == 2.0
+
+
+def test_compensated_sum_with_complex_values():
+    values = np.array([1e16j, 1.0, 1.0j, -1e16j])
+
+    assert compensated_sum(values) == 1.0 + 1.0j
+
+
+def test_compensated_sum_of_empty_array():
+    assert compensated_sum(np.array([], dtype=complex)) == 0.0
@@ -22,7 +22,12 @@ import numpy as np
 from itertools import chain, combinations
 
 
-from piquasso._math.torontonian import torontonian, loop_torontonian
+from piquasso._math.torontonian import (
+    torontonian,
+    loop_torontonian,
+    torontonian_batch,
+    loop_torontonian_batch,
+)
 from piquasso._math.transformations import xpxp_to_xxpp_indices
 
 
@@ -209,3 +214,63 @@ def test_loop_torontonian_random(d, generate_unitary_matrix):
         loop_torontonian(input_matrix, displacement_vector),
         loop_torontonian_naive(input_matrix, displacement_vector),
     )
+
+
+@pytest.mark.parametrize("dtype", (np.float32, np.float64))
+def test_torontonian_batch(dtype):
+    batch_size = 10
+    d = 3
+
+    A = np.random.rand(batch_size, 2 * d, 2 * d)
+    matrices = A @ A.transpose(0, 2, 1)
+
+    matrices /= np.max(np.linalg.eigvalsh(matrices), axis=1)[:, None, None] + 1.0
+    matrices = matrices.astype(dtype)
+
+    output = torontonian_batch(matrices)
+
+    assert output.dtype == dtype
+    assert output.shape == (batch_size,)
+    assert np.allclose(output, [torontonian(matrix) for matrix in matrices])
+
+
+def test_torontonian_batch_empty_batch():
+    output = torontonian_batch(np.empty(shape=(0, 4, 4)))
+
+    assert output.shape == (0,)
+
+
+def test_torontonian_batch_raises_ValueError_for_non_square_matrices():
+    with pytest.raises(ValueError):
+        torontonian_batch(np.empty(shape=(2, 4, 3)))
+
+
+@pytest.mark.parametrize("dtype", (np.float32, np.float64))
+def test_loop_torontonian_batch(dtype):
+    batch_size = 10
+    d = 3
+
+    A = np.random.rand(batch_size, 2 * d, 2 * d)
+    matrices = A @ A.transpose(0, 2, 1)
+
+    matrices /= np.max(np.linalg.eigvalsh(matrices), axis=1)[:, None, None] + 1.0
+    matrices = matrices.astype(dtype)
+
+    displacement_vectors = np.random.rand(batch_size, 2 * d).astype(dtype)
+
+    output = loop_torontonian_batch(matrices, displacement_vectors)
+
+    assert output.dtype == dtype
+    assert output.shape == (batch_size,)
+    assert np.allclose(
+        output,
+        [
+            loop_torontonian(matrix, displacement_vector)
+            for matrix, displacement_vector in zip(matrices, displacement_vectors)
+        ],
+    )
+
+
+def test_loop_torontonian_batch_raises_ValueError_for_mismatching_shapes():
+    with pytest.raises(ValueError):
+        loop_torontonian_batch(np.empty(shape=(2, 4, 4)), np.empty(shape=(3, 4)))
@@ -299,6 +299,45 @@ def test_interferometer():
     )
 
 
+def test_interferometer_on_mixed_state_equals_mixture_of_pure_states():
+    d = 4
+    cutoff = 4
+
+    matrix = np.array(
+        [
+            [0.5, 0.53033009 + 0.53033009j, 0.21650635 + 0.375j],
+            [-0.61237244 + 0.61237244j, 0.4330127, 0.24148146 + 0.06470476j],
+            [0, -0.48296291 + 0.12940952j, 0.8660254],
+        ]
+    )
+
+    def get_pure_density_matrix(occupation_numbers):
+        with pq.Program() as program:
+            pq.Q() | pq.StateVector(occupation_numbers)
+
+            pq.Q(0, 2, 3) | pq.Interferometer(matrix=matrix)
+
+        simulator = pq.PureFockSimulator(d=d, config=pq.Config(cutoff=cutoff))
+
+        return simulator.execute(program).state.density_matrix
+
+    with pq.Program() as program:
+        pq.Q() | pq.DensityMatrix(ket=(1, 0, 1, 0), bra=(1, 0, 1, 0)) / 3
+        pq.Q() | pq.DensityMatrix(ket=(0, 1, 0, 2), bra=(0, 1, 0, 2)) * 2 / 3
+
+        pq.Q(0, 2, 3) | pq.Interferometer(matrix=matrix)
+
+    simulator = pq.FockSimulator(d=d, config=pq.Config(cutoff=cutoff))
+
+    state = simulator.execute(program).state
+
+    assert np.allclose(
+        state.density_matrix,
+        get_pure_density_matrix((1, 0, 1, 0)) / 3
+        + get_pure_density_matrix((0, 1, 0, 2)) * 2 / 3,
+    )
+
+
 def test_kerr():
     xi = np.pi / 3
 
@@ -49,6 +49,30 @@ def test_FockState_reduced():
     assert expected_reduced_state == reduced_state
 
 
+@pytest.mark.parametrize("modes", [(0,), (2, 0), (1, 2, 3), (3, 0, 1)])
+def test_FockState_reduced_equals_to_reduced_PureFockState(modes):
+    d = 4
+
+    with pq.Program() as program:
+        pq.Q() | pq.Vacuum()
+
+        pq.Q(0) | pq.Squeezing(r=0.2, phi=np.pi / 3)
+        pq.Q(1) | pq.Displacement(r=0.3)
+        pq.Q(0, 1) | pq.Beamsplitter(theta=np.pi / 5, phi=np.pi / 7)
+        pq.Q(1, 2) | pq.Beamsplitter(theta=np.pi / 6)
+        pq.Q(2, 3) | pq.Beamsplitter(theta=np.pi / 8)
+
+    config = pq.Config(cutoff=4)
+
+    pure_state = pq.PureFockSimulator(d=d, config=config).execute(program).state
+    state = pq.FockSimulator(d=d, config=config).execute(program).state
+
+    assert np.allclose(
+        state.reduced(modes).density_matrix,
+        pure_state.reduced(modes).density_matrix,
+    )
+
+
 def test_FockState_fock_probabilities_map():
     with pq.Program() as program:
         pq.Q() | pq.DensityMatrix(ket=(0, 1), bra=(0, 1)) / 4
@@ -19,6 +19,10 @@ import numpy as np
 
 import piquasso as pq
 
+from unittest import mock
+
+from piquasso._simulators.fusion import fuse_passive_linear_gates
+
 
 def test_BatchPureFockState_equals_to_itself():
     with pq.Program() as first_preparation:
@@ -485,3 +489,122 @@ def test_Batch_with_OneByOne():
 
     assert np.allclose(batch_state_vector[:, 0], first_state_vector)
     assert np.allclose(batch_state_vector[:, 1], second_state_vector)
+
+
+def _make_parametrized_program(params):
+    with pq.Program() as program:
+        pq.Q() | pq.Vacuum()
+
+        pq.Q(0) | pq.Squeezing(r=params[0], phi=np.pi / 3)
+        pq.Q(1) | pq.Displacement(r=params[1], phi=np.pi / 5)
+        pq.Q(0, 1) | pq.Beamsplitter(theta=params[2], phi=np.pi / 7)
+        pq.Q(1) | pq.Phaseshifter(phi=params[3])
+        pq.Q(2) | pq.Kerr(xi=params[4])
+        pq.Q(0, 2) | pq.CrossKerr(xi=params[5])
+        pq.Q(1, 2) | pq.Beamsplitter5050()
+        pq.Q(2) | pq.CubicPhase(gamma=params[6])
+        pq.Q(0, 1, 2) | pq.Interferometer(
+            np.diag(np.exp(1j * np.array([params[0], params[1], params[2]])))
+        )
+
+    return program
+
+
+def test_execute_batch_equals_to_separate_executions():
+    parameter_array = np.random.default_rng(123).uniform(0.0, 0.3, size=(5, 7))
+
+    programs = [_make_parametrized_program(params) for params in parameter_array]
+
+    parameter_sets = [
+        [{}] + [instruction.params for instruction in program.instructions[1:]]
+        for program in programs
+    ]
+
+    simulator = pq.PureFockSimulator(d=3, config=pq.Config(cutoff=5))
+
+    batch_state = simulator.execute_batch(programs[0], parameter_sets).state
+
+    assert isinstance(batch_state, pq.BatchPureFockState)
+
+    for index, program in enumerate(programs):
+        assert np.allclose(
+            batch_state.state_vector[:, index],
+            simulator.execute(program).state.state_vector,
+        )
+
+
+def test_execute_batch_fuses_passive_linear_gates():
+    parameter_array = np.random.default_rng(123).uniform(0.0, 0.3, size=(4, 7))
+
+    programs = [_make_parametrized_program(params) for params in parameter_array]
+
+    parameter_sets = [
+        [{}] + [instruction.params for instruction in program.instructions[1:]]
+        for program in programs
+    ]
+
+    simulator = pq.PureFockSimulator(
+        d=3, config=pq.Config(cutoff=5, fuse_passive_gates=True)
+    )
+
+    with mock.patch(
+        "piquasso._simulators.simulator.fuse_passive_linear_gates",
+        wraps=fuse_passive_linear_gates,
+    ) as fuse:
+        batch_state = simulator.execute_batch(programs[0], parameter_sets).state
+
+    assert fuse.call_count == len(programs)
+
+    for index, program in enumerate(programs):
+        assert np.allclose(
+            batch_state.state_vector[:, index],
+            simulator.execute(program).state.state_vector,
+        )
+
+
+def test_execute_batch_with_identical_parameter_sets():
+    program = _make_parametrized_program(np.full(7, 0.1))
+
+    simulator = pq.PureFockSimulator(d=3, config=pq.Config(cutoff=5))
+
+    batch_state = simulator.execute_batch(
+        program, [[{}] * len(program.instructions)] * 3
+    ).state
+
+    state_vector = simulator.execute(program).state.state_vector
+
+    assert batch_state.state_vector.shape == (len(state_vector), 3)
+    assert np.allclose(batch_state.state_vector, state_vector[:, None])
+
+
+def test_execute_batch_with_invalid_parameter_sets():
+    program = _make_parametrized_program(np.full(7, 0.1))
+
+    simulator = pq.PureFockSimulator(d=3, config=pq.Config(cutoff=5))
+
+    with pytest.raises(pq.api.exceptions.InvalidParameter):
+        simulator.execute_batch(program, [])
+
+    with pytest.raises(pq.api.exceptions.InvalidParameter):
+        simulator.execute_batch(program, [[{}]])
+
+
+def test_execute_batch_raises_InvalidSimulation_for_unsupported_varying_gate():
+    with pq.Program() as program:
+        pq.Q() | pq.Vacuum()
+
+        pq.Q(0) | pq.QuadraticPhase(s=0.1)
+
+    simulator = pq.PureFockSimulator(d=1, config=pq.Config(cutoff=5))
+
+    with pytest.raises(pq.api.exceptions.InvalidSimulation):
+        simulator.execute_batch(program, [[{}, dict(s=0.1)], [{}, dict(s=0.2)]])
+
+
+def test_execute_batch_is_not_supported_by_TrajectoryFockSimulator():
+    program = _make_parametrized_program(np.full(7, 0.1))
+
+    simulator = pq.TrajectoryFockSimulator(d=3, config=pq.Config(cutoff=5))
+
+    with pytest.raises(pq.api.exceptions.InvalidSimulation):
+        simulator.execute_batch(program, [[{}] * len(program.instructions)])
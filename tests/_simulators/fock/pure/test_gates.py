@@ -337,3 +337,35 @@ def test_cubic_phase():
     nonzero_elements = list(state.nonzero_elements)
 
     assert len(nonzero_elements) == 5.0
+
+
+def test_GaussianTransform_with_passive_block_only_equals_to_Interferometer():
+    interferometer = np.array(
+        [
+            [np.cos(np.pi / 5), -np.exp(-1j * np.pi / 7) * np.sin(np.pi / 5)],
+            [np.exp(1j * np.pi / 7) * np.sin(np.pi / 5), np.cos(np.pi / 5)],
+        ]
+    )
+
+    with pq.Program() as preparation:
+        pq.Q(all) | pq.StateVector([1, 2, 0]) / np.sqrt(2)
+        pq.Q(all) | pq.StateVector([0, 1, 1]) / np.sqrt(2)
+
+    with pq.Program() as program:
+        pq.Q(all) | preparation
+
+        pq.Q(0, 2) | pq.GaussianTransform(
+            passive=interferometer, active=np.zeros_like(interferometer)
+        )
+
+    with pq.Program() as expected_program:
+        pq.Q(all) | preparation
+
+        pq.Q(0, 2) | pq.Interferometer(interferometer)
+
+    simulator = pq.PureFockSimulator(d=3, config=pq.Config(cutoff=4))
+
+    state = simulator.execute(program).state
+    expected_state = simulator.execute(expected_program).state
+
+    assert np.allclose(state.state_vector, expected_state.state_vector)
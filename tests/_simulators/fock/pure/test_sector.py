@@ -0,0 +1,107 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import numpy as np
+
+import piquasso as pq
+
+from scipy.stats import unitary_group
+
+
+def test_SectorPureFockSimulator_passive_circuit_keeps_single_sector():
+    d = 5
+
+    with pq.Program() as program:
+        pq.Q(all) | pq.StateVector([1, 0, 2, 0, 1])
+
+        pq.Q(0, 1) | pq.Beamsplitter(theta=np.pi / 5, phi=np.pi / 7)
+        pq.Q(2, 3) | pq.Beamsplitter5050()
+        pq.Q(1) | pq.Phaseshifter(phi=np.pi / 3)
+        pq.Q(1, 2, 4) | pq.Interferometer(unitary_group.rvs(3, random_state=42))
+        pq.Q(3, 4) | pq.MachZehnder(int_=np.pi / 3, ext=np.pi / 4)
+        pq.Q(2) | pq.Fourier()
+
+    config = pq.Config(cutoff=6)
+
+    state = pq.SectorPureFockSimulator(d=d, config=config).execute(program).state
+    expected_state = pq.PureFockSimulator(d=d, config=config).execute(program).state
+
+    assert isinstance(state, pq.SectorPureFockState)
+    assert list(state._sectors) == [4]
+
+    assert np.allclose(state.state_vector, expected_state.state_vector)
+    assert np.isclose(state.norm, 1.0)
+
+
+def test_SectorPureFockSimulator_with_active_gates():
+    d = 3
+
+    with pq.Program() as program:
+        pq.Q(all) | pq.Vacuum()
+
+        pq.Q(0) | pq.Squeezing(r=0.1, phi=np.pi / 3)
+        pq.Q(1) | pq.Displacement(r=0.2)
+        pq.Q(0, 1) | pq.Beamsplitter(theta=np.pi / 5, phi=np.pi / 7)
+        pq.Q(1, 2) | pq.CrossKerr(xi=0.2)
+        pq.Q(2) | pq.Kerr(xi=0.1)
+        pq.Q(1, 2) | pq.Beamsplitter5050()
+
+    config = pq.Config(cutoff=5)
+
+    state = pq.SectorPureFockSimulator(d=d, config=config).execute(program).state
+    expected_state = pq.PureFockSimulator(d=d, config=config).execute(program).state
+
+    assert np.allclose(state.state_vector, expected_state.state_vector)
+    assert np.allclose(state.fock_probabilities, expected_state.fock_probabilities)
+    assert np.isclose(state.norm, expected_state.norm)
+
+
+def test_SectorPureFockState_copy_is_independent():
+    with pq.Program() as program:
+        pq.Q(all) | pq.StateVector([1, 1])
+
+        pq.Q(0, 1) | pq.Beamsplitter(theta=np.pi / 5, phi=np.pi / 7)
+
+    simulator = pq.SectorPureFockSimulator(d=2, config=pq.Config(cutoff=4))
+
+    state = simulator.execute(program).state
+
+    state_copy = state.copy()
+
+    assert state_copy == state
+
+    state_copy.normalize()
+    state_copy.state_vector = 2 * state_copy.state_vector
+
+    assert state_copy != state
+
+
+def test_SectorPureFockState_get_particle_number_sector():
+    with pq.Program() as program:
+        pq.Q(all) | pq.StateVector([0, 1, 1])
+
+    simulator = pq.SectorPureFockSimulator(d=3, config=pq.Config(cutoff=4))
+
+    state = simulator.execute(program).state
+
+    assert np.allclose(state.get_particle_number_sector(2), [0, 0, 0, 0, 1, 0])
+    assert np.allclose(state.get_particle_number_sector(1), [0, 0, 0])
+
+
+def test_SectorPureFockSimulator_does_not_support_TensorflowConnector():
+    with pytest.raises(pq.api.exceptions.InvalidSimulation):
+        pq.SectorPureFockSimulator(d=2, connector=pq.TensorflowConnector())
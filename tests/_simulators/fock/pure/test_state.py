@@ -49,6 +49,27 @@ def test_PureFockState_reduced():
     assert expected_reduced_state == reduced_state
 
 
+@pytest.mark.parametrize("modes", [(1,), (0, 2), (2, 0), (3, 1, 0)])
+def test_PureFockState_reduced_equals_reduced_mixed_state(modes):
+    with pq.Program() as program:
+        pq.Q() | pq.StateVector([0, 1, 1, 0]) / np.sqrt(2)
+        pq.Q() | pq.StateVector([1, 1, 0, 0]) / np.sqrt(2)
+
+        pq.Q(0, 1) | pq.Beamsplitter(theta=0.3, phi=0.4)
+        pq.Q(1) | pq.Squeezing(r=0.2)
+        pq.Q(2, 3) | pq.Beamsplitter(theta=0.5, phi=0.1)
+
+    simulator = pq.PureFockSimulator(d=4, config=pq.Config(cutoff=5))
+    state = simulator.execute(program).state
+
+    reduced_state = state.reduced(modes=modes)
+    expected_reduced_state = state._as_mixed().reduced(modes=modes)
+
+    assert np.allclose(
+        reduced_state.density_matrix, expected_reduced_state.density_matrix
+    )
+
+
 def test_PureFockState_reduced_preserves_Config():
     with pq.Program() as program:
         pq.Q() | pq.StateVector([0, 1]) / 2
@@ -345,3 +366,26 @@ def test_PureFockState_unnormalized_state_validate_False():
     assert not np.isclose(state.norm, 1.0)
 
     state.validate()
+
+
+def test_PureFockState_gates_alternate_between_two_state_vector_buffers():
+    with pq.Program() as program:
+        pq.Q() | pq.Vacuum()
+
+        pq.Q(0) | pq.Displacement(r=0.1)
+        pq.Q(1) | pq.Squeezing(r=0.2)
+        pq.Q(0, 1) | pq.Beamsplitter(theta=np.pi / 5, phi=np.pi / 7)
+        pq.Q(1, 2) | pq.Beamsplitter5050()
+        pq.Q(2) | pq.CubicPhase(gamma=0.1)
+
+    simulator = pq.PureFockSimulator(d=3, config=pq.Config(cutoff=5))
+
+    state = simulator.execute(program).state
+
+    assert len(state._state_vector_buffers) == 2
+    assert any(buffer is state.state_vector for buffer in state._state_vector_buffers)
+
+    spare_state_vector = state._get_spare_state_vector()
+
+    assert spare_state_vector is not state.state_vector
+    assert any(buffer is spare_state_vector for buffer in state._state_vector_buffers)
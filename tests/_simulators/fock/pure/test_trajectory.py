@@ -0,0 +1,201 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import numpy as np
+
+import piquasso as pq
+
+
+def _make_lossy_program(preparation):
+    with pq.Program() as program:
+        pq.Q(all) | preparation
+
+        pq.Q(0, 1) | pq.Beamsplitter(theta=np.pi / 3, phi=np.pi / 5)
+
+        pq.Q(0) | pq.Attenuator(theta=np.pi / 6)
+        pq.Q(1) | pq.Attenuator(theta=np.pi / 5)
+
+        pq.Q(1, 2) | pq.Beamsplitter(theta=np.pi / 4)
+        pq.Q(2) | pq.Kerr(xi=0.3)
+
+    return program
+
+
+def test_TrajectoryFockSimulator_estimates_the_mixed_state():
+    config = pq.Config(cutoff=4, seed_sequence=123)
+
+    state = (
+        pq.TrajectoryFockSimulator(d=3, config=config)
+        .execute(_make_lossy_program(pq.StateVector([2, 1, 0])), shots=2000)
+        .state
+    )
+
+    expected_state = (
+        pq.FockSimulator(d=3, config=config)
+        .execute(_make_lossy_program(pq.DensityMatrix(ket=(2, 1, 0), bra=(2, 1, 0))))
+        .state
+    )
+
+    assert isinstance(state, pq.TrajectoryFockState)
+    assert state.number_of_trajectories == 2000
+    assert np.isclose(state.norm, 1.0)
+
+    assert np.all(
+        np.abs(state.fock_probabilities - expected_state.fock_probabilities)
+        <= 5 * state.fock_probabilities_standard_error + 1e-10
+    )
+
+    expected_mean_photon_number = (
+        np.sum(expected_state._space, axis=1) @ expected_state.fock_probabilities
+    )
+
+    assert (
+        np.abs(state.mean_photon_number() - expected_mean_photon_number)
+        <= 5 * state.mean_photon_number_standard_error()
+    )
+
+    assert np.allclose(
+        state.reduced((2, 0)).density_matrix,
+        expected_state.reduced((2, 0)).density_matrix,
+        atol=0.05,
+    )
+
+
+def test_TrajectoryFockState_get_particle_detection_probability():
+    config = pq.Config(cutoff=4, seed_sequence=123)
+
+    state = (
+        pq.TrajectoryFockSimulator(d=3, config=config)
+        .execute(_make_lossy_program(pq.StateVector([2, 1, 0])), shots=2000)
+        .state
+    )
+
+    expected_state = (
+        pq.FockSimulator(d=3, config=config)
+        .execute(_make_lossy_program(pq.DensityMatrix(ket=(2, 1, 0), bra=(2, 1, 0))))
+        .state
+    )
+
+    probability = state.get_particle_detection_probability((1, 1, 0))
+
+    assert np.ndim(probability) == 0
+    assert np.isclose(probability, state.fock_probabilities_map[(1, 1, 0)])
+    assert np.isclose(
+        probability,
+        expected_state.get_particle_detection_probability((1, 1, 0)),
+        atol=0.05,
+    )
+
+    probability_on_modes = state.get_particle_detection_probability_on_modes(
+        (1,), modes=(2,)
+    )
+
+    assert np.ndim(probability_on_modes) == 0
+    assert np.isclose(
+        probability_on_modes,
+        np.real(expected_state.reduced((2,)).density_matrix[1, 1]),
+        atol=0.05,
+    )
+
+
+def test_TrajectoryFockState_mean_position():
+    with pq.Program() as program:
+        pq.Q(all) | pq.StateVector([0, 0])
+
+        pq.Q(0) | pq.Displacement(r=0.5)
+        pq.Q(0) | pq.Attenuator(theta=np.pi / 4)
+
+    config = pq.Config(cutoff=8, seed_sequence=123)
+
+    state = pq.TrajectoryFockSimulator(d=2, config=config).execute(program, 100).state
+
+    mean_position = state.mean_position(mode=0)
+
+    assert np.ndim(mean_position) == 0
+    assert np.isclose(mean_position, state.quadratures_mean_variance(modes=(0,))[0])
+
+
+def test_TrajectoryFockState_get_tensor_representation_is_not_supported():
+    config = pq.Config(cutoff=4, seed_sequence=123)
+
+    state = (
+        pq.TrajectoryFockSimulator(d=3, config=config)
+        .execute(_make_lossy_program(pq.StateVector([2, 1, 0])), shots=10)
+        .state
+    )
+
+    with pytest.raises(NotImplementedError):
+        state.get_tensor_representation()
+
+
+def test_TrajectoryFockSimulator_without_channels_keeps_a_single_trajectory():
+    with pq.Program() as program:
+        pq.Q(all) | pq.StateVector([1, 1])
+
+        pq.Q(0, 1) | pq.Beamsplitter(theta=np.pi / 3, phi=np.pi / 5)
+        pq.Q(0) | pq.Squeezing(r=0.1)
+
+    config = pq.Config(cutoff=5)
+
+    state = pq.TrajectoryFockSimulator(d=2, config=config).execute(program, 10).state
+    expected_state = pq.PureFockSimulator(d=2, config=config).execute(program).state
+
+    assert state.number_of_trajectories == 1
+    assert np.allclose(state.state_vector, expected_state.state_vector)
+    assert np.allclose(state.fock_probabilities_standard_error, 0.0)
+
+
+def test_TrajectoryFockSimulator_full_loss_empties_the_mode():
+    with pq.Program() as program:
+        pq.Q(all) | pq.StateVector([2, 1])
+
+        pq.Q(0) | pq.Attenuator(theta=np.pi / 2)
+
+    simulator = pq.TrajectoryFockSimulator(
+        d=2, config=pq.Config(cutoff=4, seed_sequence=42)
+    )
+
+    state = simulator.execute(program, shots=5).state
+
+    assert np.isclose(state.fock_probabilities_map[(0, 1)], 1.0)
+
+
+def test_TrajectoryFockSimulator_samples_every_trajectory_once():
+    lossy_program = _make_lossy_program(pq.StateVector([2, 1, 0]))
+
+    with pq.Program() as program:
+        pq.Q() | lossy_program
+
+        pq.Q(0, 1) | pq.ParticleNumberMeasurement()
+
+    def get_samples():
+        simulator = pq.TrajectoryFockSimulator(
+            d=3, config=pq.Config(cutoff=4, seed_sequence=42)
+        )
+
+        return simulator.execute(program, shots=100).samples
+
+    samples = get_samples()
+
+    assert len(samples) == 100
+    assert all(sum(sample) <= 3 for sample in samples)
+    assert samples == get_samples()
+
+
+def test_TrajectoryFockSimulator_does_not_support_TensorflowConnector():
+    with pytest.raises(pq.api.exceptions.InvalidSimulation):
+        pq.TrajectoryFockSimulator(d=2, connector=pq.TensorflowConnector())
@@ -22,6 +22,12 @@ import tensorflow as tf
 
 from functools import partial
 
+from piquasso._math.fock import get_fock_space_basis
+from piquasso._simulators.fock.calculations import (
+    calculate_interferometer_helper_indices,
+    calculate_two_mode_interferometer_on_fock_space,
+)
+
 tf_purefock_simulators = (
     partial(
         pq.PureFockSimulator,
@@ -360,3 +366,165 @@ def test_PureFockState_cubic_phase():
     assert np.isclose(x_var, 0.999321, atol=1e-4)
     assert np.isclose(p_mean, 0.547729, atol=1e-4)
     assert np.isclose(p_var, 1.8674705, atol=1e-4)
+
+
+@pytest.mark.parametrize(
+    "SimulatorClass",
+    (
+        pq.PureFockSimulator,
+        *tf_purefock_simulators,
+        *jax_purefock_simulator,
+        pq.FockSimulator,
+    ),
+)
+def test_Phaseshifter_is_equivalent_to_single_mode_Interferometer(SimulatorClass):
+    phi = np.pi / 5
+
+    def get_density_matrix(gate):
+        with pq.Program() as program:
+            pq.Q() | pq.Vacuum()
+
+            pq.Q(0) | pq.Displacement(r=0.3, phi=np.pi / 7)
+            pq.Q(0, 1) | pq.Beamsplitter(theta=np.pi / 3, phi=np.pi / 4)
+
+            pq.Q(1) | gate
+
+        simulator = SimulatorClass(d=2, config=pq.Config(cutoff=4))
+
+        return simulator.execute(program).state.density_matrix
+
+    assert np.allclose(
+        get_density_matrix(pq.Phaseshifter(phi=phi)),
+        get_density_matrix(pq.Interferometer(np.array([[np.exp(1j * phi)]]))),
+    )
+
+
+@pytest.mark.parametrize(
+    "SimulatorClass",
+    (
+        pq.PureFockSimulator,
+        *tf_purefock_simulators,
+        *jax_purefock_simulator,
+        pq.FockSimulator,
+    ),
+)
+def test_Kerr_and_CrossKerr_multiply_basis_vectors_by_phases(SimulatorClass):
+    kerr_xi = 0.3
+    cross_kerr_xi = 0.7
+
+    with pq.Program() as preparation:
+        pq.Q() | pq.Vacuum()
+
+        pq.Q(0) | pq.Displacement(r=0.3, phi=np.pi / 7)
+        pq.Q(0, 1) | pq.Beamsplitter(theta=np.pi / 3, phi=np.pi / 4)
+
+    with pq.Program() as program:
+        pq.Q() | preparation
+
+        pq.Q(0) | pq.Kerr(xi=kerr_xi)
+        pq.Q(0, 1) | pq.CrossKerr(xi=cross_kerr_xi)
+
+    config = pq.Config(cutoff=4)
+
+    simulator = SimulatorClass(d=2, config=config)
+    density_matrix = simulator.execute(program).state.density_matrix
+
+    state_vector = (
+        pq.PureFockSimulator(d=2, config=config).execute(preparation).state.state_vector
+    )
+    basis = np.array(get_fock_space_basis(d=2, cutoff=4))
+    expected_state_vector = state_vector * np.exp(
+        1j * (kerr_xi * basis[:, 0] ** 2 + cross_kerr_xi * basis[:, 0] * basis[:, 1])
+    )
+
+    assert np.allclose(
+        density_matrix, np.outer(expected_state_vector, expected_state_vector.conj())
+    )
+
+
+def test_calculate_two_mode_interferometer_on_fock_space(generate_unitary_matrix):
+    cutoff = 6
+
+    interferometer = generate_unitary_matrix(2)
+
+    subspace_representations = calculate_two_mode_interferometer_on_fock_space(
+        interferometer, cutoff
+    )
+
+    expected_subspace_representations = (
+        pq.NumpyConnector().calculate_interferometer_on_fock_space(
+            interferometer, calculate_interferometer_helper_indices(d=2, cutoff=cutoff)
+        )
+    )
+
+    assert len(subspace_representations) == cutoff
+
+    for representation, expected_representation in zip(
+        subspace_representations, expected_subspace_representations
+    ):
+        assert np.allclose(representation, expected_representation)
+
+
+@pytest.mark.parametrize("d", (2, 3))
+def test_calculate_interferometer_on_fock_space_in_single_precision(
+    d, generate_unitary_matrix
+):
+    cutoff = 6
+
+    interferometer = generate_unitary_matrix(d)
+
+    helper_indices = calculate_interferometer_helper_indices(d=d, cutoff=cutoff)
+
+    expected_subspace_representations = (
+        pq.NumpyConnector().calculate_interferometer_on_fock_space(
+            interferometer, helper_indices
+        )
+    )
+
+    subspace_representations = (
+        pq.NumpyConnector().calculate_interferometer_on_fock_space(
+            interferometer.astype(np.complex64), helper_indices
+        )
+    )
+    two_mode_subspace_representations = calculate_two_mode_interferometer_on_fock_space(
+        interferometer[:2, :2].astype(np.complex64), cutoff
+    )
+
+    for representation, expected_representation in zip(
+        subspace_representations, expected_subspace_representations
+    ):
+        assert representation.dtype == np.complex64
+        assert np.allclose(representation, expected_representation, atol=1e-5)
+
+    for representation in two_mode_subspace_representations:
+        assert representation.dtype == np.complex64
+
+
+def test_PureFockSimulator_in_single_precision_keeps_the_dtype(
+    generate_unitary_matrix,
+):
+    d = 3
+
+    interferometer = generate_unitary_matrix(d)
+
+    with pq.Program() as program:
+        pq.Q(all) | pq.StateVector([1, 2, 0])
+
+        pq.Q(all) | pq.Interferometer(interferometer)
+        pq.Q(0, 1) | pq.Beamsplitter(theta=np.pi / 5, phi=np.pi / 3)
+
+    single_precision_state = (
+        pq.PureFockSimulator(d=d, config=pq.Config(cutoff=5, dtype=np.float32))
+        .execute(program)
+        .state
+    )
+    double_precision_state = (
+        pq.PureFockSimulator(d=d, config=pq.Config(cutoff=5)).execute(program).state
+    )
+
+    assert single_precision_state.state_vector.dtype == np.complex64
+    assert np.allclose(
+        single_precision_state.state_vector,
+        double_precision_state.state_vector,
+        atol=1e-5,
+    )
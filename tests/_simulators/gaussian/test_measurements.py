@@ -347,55 +347,55 @@ def test_seeded_gaussian_boson_sampling_samples_from_graph():
         samples,
         [
             [0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0],
+            [2, 2, 0, 2, 2],
             [1, 0, 0, 1, 0],
-            [2, 0, 0, 2, 2],
+            [1, 2, 0, 0, 1],
+            [2, 2, 1, 3, 2],
+            [1, 0, 0, 0, 1],
+            [0, 0, 0, 1, 1],
+            [4, 3, 0, 2, 3],
             [0, 0, 0, 0, 0],
+            [0, 1, 0, 0, 1],
             [0, 0, 0, 0, 0],
+            [2, 0, 0, 0, 2],
+            [0, 0, 1, 3, 2],
+            [1, 1, 0, 0, 0],
+            [3, 1, 1, 4, 3],
+            [2, 0, 0, 2, 4],
+            [2, 0, 0, 2, 0],
             [0, 0, 0, 0, 0],
-            [4, 2, 1, 4, 3],
             [0, 0, 0, 0, 0],
-            [4, 4, 0, 2, 4],
+            [0, 1, 1, 1, 1],
             [0, 0, 0, 0, 0],
-            [0, 1, 0, 0, 1],
-            [2, 0, 0, 1, 1],
-            [3, 1, 0, 3, 3],
-            [0, 0, 0, 1, 1],
-            [0, 1, 0, 0, 1],
+            [1, 0, 0, 2, 1],
+            [1, 1, 1, 1, 0],
+            [1, 0, 0, 0, 1],
+            [3, 1, 0, 1, 3],
             [0, 0, 0, 0, 0],
-            [3, 1, 2, 4, 2],
-            [0, 0, 1, 1, 0],
-            [1, 1, 0, 1, 1],
+            [2, 1, 0, 1, 2],
             [0, 0, 0, 0, 0],
-            [1, 2, 0, 0, 1],
+            [1, 1, 0, 0, 0],
             [0, 0, 0, 0, 0],
+            [1, 0, 0, 1, 0],
             [0, 0, 0, 0, 0],
-            [1, 2, 0, 1, 2],
+            [1, 0, 0, 0, 1],
+            [1, 1, 0, 0, 0],
+            [0, 1, 0, 0, 1],
+            [3, 3, 0, 3, 3],
+            [1, 0, 0, 3, 2],
+            [2, 0, 0, 2, 2],
             [0, 0, 0, 0, 0],
+            [0, 1, 0, 0, 1],
+            [3, 2, 0, 0, 3],
             [0, 0, 0, 0, 0],
-            [1, 1, 0, 2, 2],
             [0, 0, 0, 0, 0],
-            [2, 0, 1, 3, 2],
-            [2, 1, 0, 0, 1],
+            [0, 1, 0, 1, 2],
             [1, 4, 0, 0, 3],
-            [3, 4, 1, 3, 3],
-            [0, 0, 0, 0, 0],
-            [0, 0, 1, 1, 0],
-            [1, 1, 0, 0, 2],
+            [4, 4, 0, 4, 4],
             [0, 0, 0, 0, 0],
-            [3, 0, 0, 4, 3],
             [1, 1, 0, 0, 0],
-            [0, 0, 0, 0, 0],
-            [1, 0, 0, 0, 1],
-            [0, 1, 1, 2, 2],
-            [0, 1, 0, 0, 1],
-            [0, 0, 0, 0, 0],
-            [1, 1, 0, 1, 1],
-            [2, 3, 0, 2, 3],
             [0, 0, 1, 1, 0],
-            [0, 0, 0, 1, 1],
-            [1, 2, 0, 1, 2],
-            [0, 0, 0, 0, 0],
-            [1, 0, 0, 2, 1],
         ],
     )
 
@@ -428,56 +428,56 @@ def test_seeded_gaussian_boson_sampling_samples_displaced():
     assert np.allclose(
         samples,
         [
-            [1, 1, 1],
-            [1, 4, 1],
-            [0, 3, 0],
-            [0, 1, 1],
             [0, 2, 1],
             [1, 3, 1],
+            [0, 1, 1],
+            [0, 3, 0],
+            [0, 1, 0],
             [0, 4, 0],
-            [0, 3, 1],
+            [0, 1, 1],
             [0, 4, 0],
+            [1, 4, 1],
+            [0, 1, 1],
+            [0, 0, 2],
             [0, 3, 0],
-            [0, 3, 0],
-            [0, 2, 0],
-            [0, 0, 0],
             [0, 2, 1],
-            [0, 1, 0],
-            [2, 0, 0],
-            [1, 1, 2],
-            [0, 0, 1],
-            [0, 0, 2],
+            [0, 3, 1],
             [0, 2, 0],
-            [2, 4, 1],
             [0, 1, 1],
-            [0, 1, 0],
+            [0, 2, 0],
+            [0, 0, 3],
+            [0, 3, 1],
+            [1, 0, 1],
             [0, 0, 0],
             [0, 4, 1],
-            [0, 4, 0],
-            [1, 3, 2],
-            [1, 2, 0],
-            [1, 4, 1],
-            [1, 1, 2],
-            [0, 4, 1],
-            [0, 2, 0],
-            [2, 1, 2],
-            [1, 1, 2],
-            [0, 2, 1],
-            [1, 3, 3],
-            [0, 3, 2],
+            [0, 1, 0],
+            [1, 2, 1],
+            [0, 1, 3],
+            [1, 0, 1],
+            [1, 0, 1],
+            [0, 1, 0],
+            [1, 3, 0],
+            [0, 1, 1],
             [0, 2, 0],
             [0, 4, 0],
             [0, 3, 0],
+            [0, 1, 0],
+            [0, 3, 1],
             [0, 2, 0],
-            [0, 2, 1],
+            [0, 3, 0],
+            [0, 0, 2],
+            [0, 4, 0],
+            [0, 1, 0],
+            [0, 3, 0],
             [1, 2, 1],
             [0, 3, 1],
-            [1, 3, 0],
+            [2, 4, 1],
+            [0, 2, 0],
             [0, 3, 0],
-            [0, 2, 2],
-            [0, 4, 0],
-            [1, 2, 0],
-            [0, 1, 1],
+            [0, 3, 3],
+            [0, 3, 0],
+            [0, 2, 1],
+            [0, 2, 0],
         ],
     )
 
@@ -511,16 +511,16 @@ def test_ThresholdMeasurement_use_torontonian_seeding():
     result = simulator.execute(program, shots=shots)
 
     assert result.samples == [
-        (1, 0, 0, 0, 1),
-        (1, 1, 0, 1, 1),
-        (1, 0, 1, 1, 1),
-        (1, 1, 0, 1, 1),
         (0, 0, 0, 0, 0),
-        (0, 0, 0, 1, 1),
+        (1, 0, 0, 1, 1),
         (1, 1, 0, 1, 1),
+        (0, 0, 1, 1, 0),
         (0, 0, 0, 0, 0),
+        (1, 1, 0, 1, 1),
+        (0, 1, 1, 1, 1),
         (0, 0, 0, 0, 0),
-        (0, 0, 0, 0, 0),
+        (1, 1, 1, 1, 1),
+        (1, 1, 0, 0, 1),
     ]
 
 
@@ -555,14 +555,137 @@ def test_ThresholdMeasurement_use_torontonian_seeding_float32():
     result = simulator.execute(program, shots=shots)
 
     assert result.samples == [
-        (1, 0, 0, 0, 1),
-        (1, 1, 0, 1, 1),
-        (1, 0, 1, 1, 1),
-        (1, 1, 0, 1, 1),
         (0, 0, 0, 0, 0),
-        (0, 0, 0, 1, 1),
+        (1, 0, 0, 1, 1),
         (1, 1, 0, 1, 1),
+        (0, 0, 1, 1, 0),
         (0, 0, 0, 0, 0),
+        (1, 1, 0, 1, 1),
+        (0, 1, 1, 1, 1),
         (0, 0, 0, 0, 0),
-        (0, 0, 0, 0, 0),
+        (1, 1, 1, 1, 1),
+        (1, 1, 0, 0, 1),
     ]
+
+
+@pytest.mark.parametrize(
+    "measurement, use_torontonian",
+    [
+        (pq.ParticleNumberMeasurement(), False),
+        (pq.ThresholdMeasurement(), True),
+    ],
+)
+def test_sampling_with_multiple_workers_is_independent_of_number_of_workers(
+    measurement, use_torontonian
+):
+    d = 3
+    shots = 10
+
+    with pq.Program() as program:
+        for i in range(d):
+            pq.Q(i) | pq.Squeezing(r=0.3) | pq.Displacement(r=0.4)
+
+        pq.Q(0, 1) | pq.Beamsplitter(0.0959408065906761, 0.06786053071484363)
+        pq.Q(1, 2) | pq.Beamsplitter(1.0152680371119776, 1.2863559998816205)
+
+        pq.Q(all) | measurement
+
+    def get_samples(workers):
+        simulator = pq.GaussianSimulator(
+            d=d,
+            config=pq.Config(
+                seed_sequence=123, use_torontonian=use_torontonian, workers=workers
+            ),
+        )
+
+        return simulator.execute(program, shots=shots).samples
+
+    samples_with_1_worker = get_samples(workers=1)
+    samples_with_2_workers = get_samples(workers=2)
+    samples_with_3_workers = get_samples(workers=3)
+
+    assert len(samples_with_1_worker) == shots
+    assert np.allclose(samples_with_1_worker, samples_with_2_workers)
+    assert np.allclose(samples_with_1_worker, samples_with_3_workers)
+
+
+def test_ThresholdMeasurement_use_torontonian_cache_info():
+    d = 5
+    shots = 100
+
+    with pq.Program() as program:
+        pq.Q(all) | pq.Graph(np.ones((d, d)) - np.identity(d))
+
+        pq.Q(all) | pq.ThresholdMeasurement()
+
+    simulator = pq.GaussianSimulator(
+        d=d, config=pq.Config(seed_sequence=123, use_torontonian=True)
+    )
+
+    result = simulator.execute(program, shots=shots)
+
+    cache_info = result.cache_info
+
+    assert cache_info.hits + cache_info.misses == shots * d
+    assert cache_info.misses <= 2**d - 1
+    assert 0 < cache_info.memory_usage <= cache_info.memory_limit
+
+
+def test_ThresholdMeasurement_use_torontonian_cache_is_shared_between_executions():
+    d = 4
+    shots = 50
+
+    with pq.Program() as preparation:
+        for i in range(d):
+            pq.Q(i) | pq.Squeezing(r=0.3) | pq.Displacement(r=0.2)
+
+        pq.Q(0, 1) | pq.Beamsplitter(0.5, 0.3)
+        pq.Q(2, 3) | pq.Beamsplitter(0.7, 0.1)
+
+    with pq.Program() as measurement:
+        pq.Q(all) | pq.ThresholdMeasurement()
+
+    simulator = pq.GaussianSimulator(
+        d=d, config=pq.Config(seed_sequence=123, use_torontonian=True)
+    )
+
+    state = simulator.execute(preparation).state
+
+    first_result = simulator.execute(measurement, shots=shots, initial_state=state)
+    second_result = simulator.execute(measurement, shots=shots, initial_state=state)
+
+    assert first_result.cache_info.misses > 0
+    assert second_result.cache_info.misses == 0
+    assert second_result.cache_info.hits == shots * d
+
+
+def test_ThresholdMeasurement_use_torontonian_samples_are_independent_of_cache_size():
+    d = 5
+    shots = 20
+
+    with pq.Program() as program:
+        pq.Q(all) | pq.Graph(np.ones((d, d)) - np.identity(d))
+
+        pq.Q(all) | pq.ThresholdMeasurement()
+
+    def get_result(**cache_limits):
+        simulator = pq.GaussianSimulator(
+            d=d,
+            config=pq.Config(seed_sequence=123, use_torontonian=True, **cache_limits),
+        )
+
+        return simulator.execute(program, shots=shots)
+
+    result = get_result()
+    result_with_small_cache = get_result(cache_size=4)
+    result_without_cache = get_result(cache_memory_limit=0)
+
+    assert result.samples == result_with_small_cache.samples
+    assert result.samples == result_without_cache.samples
+
+    assert 0 < result_with_small_cache.cache_info.currsize <= 4
+    assert result_with_small_cache.cache_info.maxsize == 4
+
+    assert result_without_cache.cache_info.hits == 0
+    assert result_without_cache.cache_info.currsize == 0
+    assert result_without_cache.cache_info.memory_usage == 0
@@ -20,6 +20,7 @@ from scipy.linalg import polar, coshm, sinhm, block_diag
 
 import piquasso as pq
 from piquasso.api.exceptions import InvalidParameter
+from piquasso._math.fock import get_fock_space_basis
 
 
 def test_xxpp_representation(state, assets):
@@ -1000,3 +1001,58 @@ def test_get_purity_Thermal_Interferometer(generate_unitary_matrix):
     assert np.isclose(actual_initial_purity, actual_final_purity)
     assert np.isclose(expected_initial_purity, expected_final_purity)
     assert np.isclose(expected_final_purity, actual_final_purity)
+
+
+@pytest.mark.parametrize("displacement", (0.0, 0.3))
+def test_fock_probabilities_of_pure_state_equal_to_particle_detection_probabilities(
+    displacement,
+):
+    d = 3
+
+    with pq.Program() as program:
+        for i in range(d):
+            pq.Q(i) | pq.Squeezing(r=0.1 * (i + 1)) | pq.Displacement(r=displacement)
+
+        pq.Q(0, 1) | pq.Beamsplitter(0.4, 0.3)
+        pq.Q(1, 2) | pq.Beamsplitter(0.7, 0.9)
+
+    simulator = pq.GaussianSimulator(d=d, config=pq.Config(cutoff=5))
+
+    state = simulator.execute(program).state
+
+    fock_probabilities = state.fock_probabilities
+
+    basis = get_fock_space_basis(d=d, cutoff=5)
+
+    assert np.allclose(
+        fock_probabilities,
+        [state.get_particle_detection_probability(vector) for vector in basis],
+    )
+
+
+@pytest.mark.parametrize("displacement", (0.0, 0.3))
+def test_density_matrix_with_bargmann_recurrence(displacement):
+    d = 3
+
+    with pq.Program() as program:
+        for i in range(d):
+            pq.Q(i) | pq.Squeezing(r=0.1 * (i + 1)) | pq.Displacement(r=displacement)
+
+        pq.Q(0, 1) | pq.Beamsplitter(0.4, 0.3)
+        pq.Q(1, 2) | pq.Beamsplitter(0.7, 0.9)
+
+        pq.Q(0) | pq.Attenuator(theta=0.5)
+
+    def get_state(use_bargmann_recurrence):
+        simulator = pq.GaussianSimulator(
+            d=d,
+            config=pq.Config(cutoff=4, use_bargmann_recurrence=use_bargmann_recurrence),
+        )
+
+        return simulator.execute(program).state
+
+    state = get_state(use_bargmann_recurrence=True)
+    expected_state = get_state(use_bargmann_recurrence=False)
+
+    assert np.allclose(state.density_matrix, expected_state.density_matrix)
+    assert np.allclose(state.fock_probabilities, expected_state.fock_probabilities)
@@ -180,6 +180,45 @@ def test_general_loss():
     simulator.execute(program, shots=1)
 
 
+@pytest.mark.parametrize(
+    "transmissivities",
+    [
+        [1.0, 1.0, 1.0, 1.0, 1.0],
+        [0.9, 0.9, 0.9, 0.9, 0.9],
+        [0.4, 0.5, 1.0, 1.0, 1.0],
+    ],
+)
+def test_sampling_with_multiple_workers_is_independent_of_number_of_workers(
+    transmissivities,
+):
+    d = 5
+    shots = 10
+
+    with pq.Program() as program:
+        pq.Q() | pq.StateVector([1, 1, 1, 0, 0])
+        pq.Q() | pq.Interferometer(unitary_group.rvs(d, random_state=123))
+
+        for i, transmissivity in enumerate(transmissivities):
+            pq.Q(i) | pq.Loss(transmissivity=transmissivity)
+
+        pq.Q() | pq.ParticleNumberMeasurement()
+
+    def get_samples(workers):
+        simulator = pq.SamplingSimulator(
+            d=d, config=pq.Config(seed_sequence=123, workers=workers)
+        )
+
+        return simulator.execute(program, shots=shots).samples
+
+    samples_with_1_worker = get_samples(workers=1)
+    samples_with_2_workers = get_samples(workers=2)
+    samples_with_3_workers = get_samples(workers=3)
+
+    assert len(samples_with_1_worker) == shots
+    assert samples_with_1_worker == samples_with_2_workers
+    assert samples_with_1_worker == samples_with_3_workers
+
+
 def test_boson_sampling_seeded():
     seed_sequence = 123
 
@@ -234,26 +273,26 @@ def test_boson_sampling_seeded():
     samples = simulator.execute(program, shots=20).samples
 
     expected_samples = [
-        (3, 0, 0, 0, 2),
-        (0, 0, 1, 2, 2),
-        (0, 1, 0, 4, 0),
+        (1, 0, 3, 0, 1),
+        (0, 0, 4, 1, 0),
         (1, 0, 0, 0, 4),
-        (0, 1, 0, 1, 3),
-        (1, 0, 0, 3, 1),
-        (2, 0, 3, 0, 0),
-        (3, 1, 1, 0, 0),
-        (0, 1, 0, 3, 1),
-        (1, 2, 0, 0, 2),
-        (1, 0, 4, 0, 0),
-        (0, 1, 1, 2, 1),
+        (0, 1, 1, 1, 2),
+        (0, 0, 4, 0, 1),
+        (0, 0, 3, 1, 1),
+        (1, 1, 0, 1, 2),
+        (1, 0, 3, 0, 1),
         (0, 0, 1, 1, 3),
-        (0, 2, 0, 1, 2),
+        (1, 1, 1, 1, 1),
         (2, 0, 1, 0, 2),
-        (0, 0, 3, 1, 1),
-        (0, 0, 4, 1, 0),
-        (2, 0, 0, 0, 3),
+        (2, 2, 1, 0, 0),
+        (0, 0, 0, 4, 1),
+        (2, 1, 1, 0, 1),
+        (0, 2, 0, 2, 1),
+        (0, 2, 0, 1, 2),
         (0, 0, 2, 1, 2),
-        (1, 1, 0, 1, 2),
+        (0, 0, 1, 0, 4),
+        (0, 0, 2, 2, 1),
+        (1, 3, 1, 0, 0),
     ]
 
     assert samples == expected_samples
@@ -317,26 +356,26 @@ def test_LossyInterferometer_boson_sampling_seeded():
     samples = simulator.execute(program, shots=20).samples
 
     expected_samples = [
-        (0, 0, 3, 0, 0),
-        (0, 0, 1, 1, 0),
-        (0, 0, 1, 1, 0),
-        (1, 0, 0, 1, 0),
-        (0, 0, 1, 0, 0),
+        (2, 0, 1, 0, 0),
+        (0, 2, 1, 0, 1),
         (0, 0, 1, 0, 0),
-        (1, 1, 1, 0, 0),
-        (0, 2, 0, 0, 2),
-        (0, 0, 1, 0, 0),
-        (1, 0, 1, 0, 2),
-        (1, 0, 0, 0, 3),
-        (0, 0, 1, 1, 2),
+        (1, 0, 1, 0, 0),
+        (0, 0, 0, 0, 4),
+        (0, 0, 0, 2, 2),
+        (0, 0, 0, 2, 0),
         (0, 0, 0, 1, 0),
-        (0, 0, 0, 1, 2),
+        (0, 0, 0, 1, 1),
         (0, 1, 1, 1, 0),
-        (0, 1, 2, 0, 0),
-        (0, 1, 0, 0, 1),
-        (1, 0, 0, 1, 1),
-        (0, 0, 2, 1, 0),
-        (0, 1, 1, 0, 0),
+        (1, 0, 1, 0, 0),
+        (0, 2, 0, 0, 2),
+        (0, 0, 0, 0, 3),
+        (2, 0, 0, 0, 0),
+        (0, 0, 0, 1, 2),
+        (0, 1, 1, 0, 1),
+        (0, 0, 0, 0, 0),
+        (0, 0, 0, 0, 0),
+        (0, 0, 0, 0, 1),
+        (0, 0, 1, 1, 1),
     ]
 
     assert samples == expected_samples
@@ -400,26 +439,26 @@ def test_LossyInterferometer_boson_sampling_uniform_losses():
     samples = simulator.execute(program, shots=20).samples
 
     expected_samples = [
-        (1, 0, 2, 0, 0),
-        (1, 0, 0, 1, 1),
-        (0, 2, 1, 0, 2),
-        (1, 0, 0, 0, 2),
-        (5, 0, 0, 0, 0),
-        (0, 2, 2, 0, 1),
-        (0, 3, 2, 0, 0),
-        (0, 1, 1, 2, 1),
-        (1, 1, 0, 0, 3),
-        (0, 0, 0, 2, 2),
-        (0, 2, 1, 0, 2),
-        (2, 0, 2, 0, 0),
-        (0, 1, 0, 0, 3),
-        (0, 1, 3, 0, 0),
+        (2, 1, 1, 0, 0),
+        (0, 1, 2, 2, 0),
+        (1, 0, 1, 2, 0),
+        (0, 0, 0, 0, 4),
+        (0, 3, 1, 0, 0),
+        (0, 0, 1, 2, 1),
         (1, 1, 0, 0, 2),
-        (0, 0, 4, 1, 0),
-        (1, 3, 0, 0, 1),
-        (2, 1, 1, 0, 1),
-        (0, 2, 1, 0, 2),
+        (0, 0, 1, 2, 1),
+        (0, 0, 1, 2, 2),
+        (0, 0, 0, 1, 3),
+        (0, 0, 0, 0, 2),
         (0, 1, 1, 0, 2),
+        (1, 1, 2, 1, 0),
+        (0, 2, 0, 2, 0),
+        (0, 0, 0, 3, 1),
+        (0, 0, 0, 1, 3),
+        (0, 0, 1, 1, 0),
+        (1, 0, 0, 0, 3),
+        (0, 0, 1, 2, 2),
+        (0, 1, 3, 0, 0),
     ]
 
     assert samples == expected_samples
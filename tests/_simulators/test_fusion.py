@@ -0,0 +1,83 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import numpy as np
+
+import piquasso as pq
+
+from piquasso._simulators.fusion import fuse_passive_linear_gates
+
+
+def test_fuse_passive_linear_gates_fuses_consecutive_passive_gates():
+    config = pq.Config(cutoff=6)
+
+    instructions = [
+        pq.Phaseshifter(phi=np.pi / 3).on_modes(0),
+        pq.Beamsplitter(theta=np.pi / 5, phi=np.pi / 7).on_modes(0, 1),
+        pq.Kerr(xi=0.1).on_modes(1),
+        pq.Beamsplitter(theta=np.pi / 4, phi=np.pi / 6).on_modes(1, 2),
+    ]
+
+    fused_instructions = fuse_passive_linear_gates(
+        instructions, d=3, connector=pq.NumpyConnector(), config=config
+    )
+
+    assert len(fused_instructions) == 3
+
+    interferometer = fused_instructions[0]
+
+    assert isinstance(interferometer, pq.Interferometer)
+    assert interferometer.modes == (0, 1)
+
+    expected_matrix = instructions[1]._get_passive_block(
+        pq.NumpyConnector(), config
+    ) @ np.diag([np.exp(1j * np.pi / 3), 1.0])
+
+    assert np.allclose(interferometer.params["matrix"], expected_matrix)
+
+    assert fused_instructions[1] is instructions[2]
+    assert fused_instructions[2] is instructions[3]
+
+
+@pytest.mark.parametrize(
+    "SimulatorClass",
+    (pq.PureFockSimulator, pq.FockSimulator, pq.GaussianSimulator),
+)
+def test_fuse_passive_gates_yields_the_same_state(SimulatorClass):
+    d = 4
+
+    with pq.Program() as program:
+        pq.Q(all) | pq.Vacuum()
+
+        for i in range(d):
+            pq.Q(i) | pq.Squeezing(r=0.1 * (i + 1)) | pq.Displacement(r=0.1)
+
+        pq.Q(0, 1) | pq.Beamsplitter(theta=np.pi / 5, phi=np.pi / 7)
+        pq.Q(2, 3) | pq.MachZehnder(int_=np.pi / 3, ext=np.pi / 4)
+        pq.Q(1, 2) | pq.Beamsplitter(theta=np.pi / 6, phi=np.pi / 8)
+        pq.Q(1) | pq.Phaseshifter(phi=np.pi / 3)
+        pq.Q(0, 1) | pq.Beamsplitter5050()
+        pq.Q(3) | pq.Fourier()
+
+    def get_state(fuse_passive_gates):
+        simulator = SimulatorClass(
+            d=d, config=pq.Config(cutoff=5, fuse_passive_gates=fuse_passive_gates)
+        )
+
+        return simulator.execute(program).state
+
+    assert get_state(fuse_passive_gates=True) == get_state(fuse_passive_gates=False)
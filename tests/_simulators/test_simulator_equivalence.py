@@ -569,6 +569,33 @@ def test_fock_probabilities_with_quadratic_phase(SimulatorClass):
     assert is_proportional(probabilities, expected_probabilities)
 
 
+@pytest.mark.parametrize(
+    "SimulatorClass",
+    (
+        pq.PureFockSimulator,
+        *tf_purefock_simulators,
+        *jax_purefock_simulator,
+        pq.FockSimulator,
+    ),
+)
+@pytest.mark.parametrize("gate", (pq.ControlledX(s=0.2), pq.ControlledZ(s=0.2)))
+def test_fock_probabilities_with_controlled_gates(SimulatorClass, gate):
+    with pq.Program() as program:
+        pq.Q() | pq.Vacuum()
+
+        pq.Q(0) | pq.Squeezing(r=0.1)
+        pq.Q(0, 1) | gate
+
+    config = pq.Config(cutoff=8)
+
+    state = SimulatorClass(d=2, config=config).execute(program).state
+    expected_state = pq.GaussianSimulator(d=2, config=config).execute(program).state
+
+    assert np.allclose(
+        state.fock_probabilities, expected_state.fock_probabilities, atol=1e-5
+    )
+
+
 @pytest.mark.parametrize(
     "SimulatorClass",
     (
@@ -44,11 +44,15 @@ def test_eq():
     config3 = pq.Config(
         seed_sequence=0,
         cache_size=64,
+        cache_memory_limit=2**20,
         hbar=1,
         use_torontonian=True,
+        use_bargmann_recurrence=True,
+        fuse_passive_gates=True,
         cutoff=6,
         measurement_cutoff=4,
         validate=False,
+        workers=2,
     )
 
     assert config1 == config1
@@ -97,3 +101,43 @@ def test_Config_rng_is_shallow_copied():
     config_copy = config.copy()
 
     assert config.rng is config_copy.rng
+
+
+def test_as_code_workers():
+    config = pq.Config(workers=4)
+
+    assert config._as_code() == "pq.Config(workers=4)"
+
+
+def test_as_code_use_bargmann_recurrence():
+    config = pq.Config(use_bargmann_recurrence=True)
+
+    assert config._as_code() == "pq.Config(use_bargmann_recurrence=True)"
+
+
+def test_as_code_fuse_passive_gates():
+    config = pq.Config(fuse_passive_gates=True)
+
+    assert config._as_code() == "pq.Config(fuse_passive_gates=True)"
+
+
+def test_Config_spawn_is_reproducible_and_advances():
+    def get_entropy(seed_sequences):
+        return [seed_sequence.generate_state(1)[0] for seed_sequence in seed_sequences]
+
+    config1 = pq.Config(seed_sequence=123)
+    config2 = pq.Config(seed_sequence=123)
+
+    first_entropy = get_entropy(config1.spawn(2))
+
+    assert first_entropy == get_entropy(config2.spawn(2))
+
+    second_entropy = get_entropy(config1.spawn(2))
+
+    assert not set(first_entropy) & set(second_entropy)
+
+
+def test_as_code_cache_limits():
+    config = pq.Config(cache_size=64, cache_memory_limit=1024)
+
+    assert config._as_code() == "pq.Config(cache_size=64, cache_memory_limit=1024)"
@@ -0,0 +1,41 @@
+#
+# Copyright 2021-2025 Budapest Quantum Computing Group
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+import piquasso as pq
+
+from piquasso._warmup import main
+
+
+def test_warmup_returns_the_elapsed_times():
+    elapsed_times = pq.warmup(dtypes=(np.float64,))
+
+    assert set(elapsed_times) == {
+        ("gaussian", "float64"),
+        ("pure_fock", "float64"),
+        ("fock", "float64"),
+        ("sampling", "float64"),
+    }
+    assert all(elapsed_time >= 0.0 for elapsed_time in elapsed_times.values())
+
+
+def test_warmup_command_line_interface(capsys):
+    main(["warmup", "--dtype", "float64"])
+
+    output = capsys.readouterr().out
+
+    assert "pure_fock" in output
+    assert "Warmup finished" in output